@@ -216,4 +216,13 @@ def sparse_grad(var):
 
 
 import aesara.tensor.shared_randomstreams
-from aesara.scan_module import clone, foldl, foldr, map, reduce, scan, scan_checkpoints
+from aesara.scan_module import (
+    clone,
+    foldl,
+    foldr,
+    map,
+    reduce,
+    scan,
+    scan_checkpoints,
+    scan_stream,
+)
@@ -783,6 +783,107 @@ optdb.register(
     "fast_run",
 )
 
+
+def _find_outer_apply(fgraph, op, inputs):
+    """
+    Return an Apply node of `fgraph` that computes ``op(*inputs)``, or None.
+
+    """
+    for inp in inputs:
+        if not isinstance(inp, gof.Constant):
+            clients = fgraph.clients(inp)
+            break
+    else:
+        return None
+    for client, _ in clients:
+        if client == "output" or client.op != op:
+            continue
+        if len(client.inputs) == len(inputs) and all(
+            a is b or (isinstance(a, gof.Constant) and a.equals(b))
+            for a, b in zip(client.inputs, inputs)
+        ):
+            return client
+    return None
+
+
+@gof.local_optimizer([OpFromGraph])
+def hoist_ofg_shared(node):
+    """
+    Take the parts of an OpFromGraph body that the outer graph already
+    computes out of the body.
+
+    The inner nodes that have an equivalent in the outer graph (same Op
+    applied to the same outer variables) are removed from the body, whose
+    new inputs are the outer variables. They are then computed only once.
+    Nodes that destroy their inputs stay in the body.
+
+    """
+    op = node.op
+    if not isinstance(op, OpFromGraph) or op.is_inline:
+        return False
+    if not (op._lop_is_default and op._rop_is_default):
+        # The overrides are defined for the current inputs.
+        return False
+    if op._connection_pattern is not None:
+        return False
+    fgraph = node.fgraph
+
+    # Map the inner variables to the outer variables with the same value.
+    outer = OrderedDict(zip(op.local_inputs, node.inputs))
+    for inner_node in gof.graph.io_toposort(op.local_inputs, op.local_outputs):
+        if getattr(inner_node.op, "destroy_map", None):
+            continue
+        inputs = []
+        for inp in inner_node.inputs:
+            if inp in outer:
+                inputs.append(outer[inp])
+            elif isinstance(inp, gof.Constant):
+                inputs.append(inp)
+            else:
+                break
+        else:
+            outer_node = _find_outer_apply(fgraph, inner_node.op, inputs)
+            if outer_node is not None:
+                outer.update(zip(inner_node.outputs, outer_node.outputs))
+
+    # The hoisted variables that the rest of the body still uses.
+    used = OrderedDict()
+    for inner_node in gof.graph.io_toposort(op.local_inputs, op.local_outputs):
+        if inner_node.outputs[0] in outer:
+            continue
+        for inp in inner_node.inputs:
+            if inp.owner is not None and inp in outer:
+                used[inp] = None
+    for out in op.local_outputs:
+        if out.owner is not None and out in outer:
+            used[out] = None
+    if not used:
+        return False
+
+    new_inner_inputs = [var.type() for var in used]
+    new_outputs = aesara.clone(
+        op.local_outputs, replace=OrderedDict(zip(used, new_inner_inputs))
+    )
+    kwargs = dict(op.kwargs)
+    # Some of the original inputs may only have been used by hoisted nodes.
+    kwargs.setdefault("on_unused_input", "ignore")
+    new_op = OpFromGraph(
+        list(op.local_inputs) + new_inner_inputs,
+        new_outputs,
+        inline=False,
+        name=op.name,
+        **kwargs,
+    )
+    return new_op(*(list(node.inputs) + [outer[var] for var in used]), return_list=True)
+
+
+optdb.register(
+    "hoist_ofg_shared",
+    gof.opt.in2out(hoist_ofg_shared, ignore_newtrees=True),
+    0.6,
+    "fast_run",
+)
+
 # Since OpFromGraph contains a Aesara compiled function,
 # we should let DebugMode know about it
 ops_with_inner_function[OpFromGraph] = "fn"
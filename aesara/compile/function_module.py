@@ -6,7 +6,6 @@ Driver of graph construction, optimization, and linking.
 import copy
 import copyreg
 import logging
-import pickle
 import time
 import warnings
 from itertools import chain
@@ -20,7 +19,6 @@ from aesara.compile.io import In, SymbolicInput, SymbolicOutput
 from aesara.compile.ops import deep_copy_op, view_op
 from aesara.gof import graph
 from aesara.gof.op import ops_with_inner_function
-from aesara.gof.toolbox import is_same_graph
 
 
 _logger = logging.getLogger("aesara.compile.function_module")
@@ -224,6 +222,9 @@ class AliasedMemoryError(Exception):
 # unique id object used as a placeholder for duplicate entries
 DUPLICATE = ["DUPLICATE"]
 
+# returned by Function._call_fast when the general path is needed
+SLOW_CALL = ["SLOW_CALL"]
+
 
 class Function:
     """
@@ -366,6 +367,14 @@ class Function:
 
     """
 
+    _fast_call = None
+    """
+    Precomputed state of the fast path of `__call__`, built by
+    `_make_fast_call` at the first call. False if the function always needs
+    the general path.
+
+    """
+
     def __init__(
         self,
         fn,
@@ -394,6 +403,9 @@ class Function:
         self.name = name
         self.nodes_with_inner_function = []
         self.output_keys = output_keys
+        self._fast_call = None
+        # Vectorized functions used by map, by positions of batched inputs.
+        self._map_fns = {}
 
         # See if we have any mutable / borrow inputs
         # TODO: this only need to be set if there is more then 1 input
@@ -650,6 +662,10 @@ class Function:
             [memo[o] for o in out_vars],
             clone=False,
         )
+        if hasattr(maker.fgraph, "destroyers"):
+            # The linker orders the nodes according to the inplace
+            # operations of the optimized graph.
+            fg_cpy.attach_feature(gof.DestroyHandler())
 
         # Re initialize Outs and swap update and variable in Ins
         # By doing this, we can pass FunctionMaker._check_unused_inputs()
@@ -782,6 +798,150 @@ class Function:
         f_cpy.maker.fgraph.name = name
         return f_cpy
 
+    def _make_fast_call(self):
+        """
+        Precompute what a call with only the required positional arguments
+        has to do, or return False if such a call needs the general path.
+
+        The fast path applies when the required inputs come first, no
+        input needs its default value to be fed again after the call, and
+        no input is borrowed or mutable, so that no input can alias another.
+
+        """
+        from aesara.tensor.type import TensorType
+
+        if getattr(self, "_check_for_aliased_inputs", True):
+            return False
+        if any(refeed for required, refeed, value in self.defaults):
+            return False
+        n_args = 0
+        for c in self.input_storage:
+            if not c.required:
+                break
+            if c.implicit:
+                return False
+            n_args += 1
+        if any(c.required for c in self.input_storage[n_args:]):
+            return False
+
+        checks = []
+        for c in self.input_storage[:n_args]:
+            t = c.type
+            if type(t).filter is TensorType.filter and not t.filter_checks_isfinite:
+                # Values that TensorType.filter() returns unchanged.
+                bcast = tuple(i for i, b in enumerate(t.broadcastable) if b)
+                checks.append((c, t.numpy_dtype, t.ndim, bcast))
+            else:
+                checks.append((c, None, None, None))
+
+        gc_cells = [
+            o_container.storage
+            for o_container, o_variable in zip(
+                self.output_storage, self.maker.fgraph.outputs
+            )
+            if o_variable.owner is not None
+        ]
+        updated = [
+            storage
+            for input, storage in reversed(
+                list(zip(self.maker.expanded_inputs, self.input_storage))
+            )
+            if input.update is not None
+        ]
+        return checks, gc_cells, updated
+
+    def _call_fast(self, fast_call, args):
+        """
+        Call the function with the required positional arguments `args`.
+
+        Arguments that `Type.filter` would return unchanged are bound
+        directly into the storage of the inputs. Return SLOW_CALL, before
+        running the function, if an argument needs the checks and error
+        messages of the general path.
+
+        """
+        checks, gc_cells, updated = fast_call
+        t0 = time.time()
+        trust_input = self.trust_input
+        for arg, (c, dtype, ndim, bcast) in zip(args, checks):
+            if trust_input:
+                c.storage[0] = arg
+                continue
+            if (
+                dtype is not None
+                and type(arg) is np.ndarray
+                and arg.ndim == ndim
+                and (
+                    arg.dtype is dtype
+                    or (arg.dtype == dtype and arg.dtype.num == dtype.num)
+                )
+                and arg.flags.aligned
+            ):
+                shape = arg.shape
+                for i in bcast:
+                    if shape[i] != 1:
+                        return SLOW_CALL
+                c.storage[0] = arg
+            elif arg is None:
+                return SLOW_CALL
+            else:
+                try:
+                    c.storage[0] = c.type.filter(
+                        arg, strict=c.strict, allow_downcast=c.allow_downcast
+                    )
+                except Exception:
+                    return SLOW_CALL
+
+        t0_fn = time.time()
+        try:
+            outputs = self.fn()
+        except Exception:
+            self._raise_fn_error()
+        self.maker.mode.fn_time += time.time() - t0_fn
+
+        if outputs is None:
+            outputs = [x.data for x in self.output_storage]
+        for c, _, _, _ in checks:
+            c.storage[0] = None
+        fn = self.fn
+        if getattr(fn, "allow_gc", False):
+            for cell in gc_cells:
+                cell[0] = None
+        if getattr(fn, "need_update_inputs", True):
+            for storage in updated:
+                storage.data = outputs.pop()
+        else:
+            outputs = outputs[: self.n_returned_outputs]
+
+        dt_call = time.time() - t0
+        aesara.compile.profiling.total_fct_exec_time += dt_call
+        self.maker.mode.call_time += dt_call
+        if self.return_none:
+            return None
+        elif self.unpack_single and len(outputs) == 1:
+            return outputs[0]
+        elif self.output_keys is not None:
+            return dict(zip(self.output_keys, outputs))
+        return outputs
+
+    def _raise_fn_error(self):
+        """Re-raise the exception raised by the linked function."""
+        if hasattr(self.fn, "position_of_error"):
+            # this is a new vm-provided function or c linker
+            # they need this because the exception manipulation
+            # done by raise_with_op is not implemented in C.
+            thunk = None
+            if hasattr(self.fn, "thunks"):
+                thunk = self.fn.thunks[self.fn.position_of_error]
+            gof.link.raise_with_op(
+                node=self.fn.nodes[self.fn.position_of_error],
+                thunk=thunk,
+                storage_map=getattr(self.fn, "storage_map", None),
+            )
+        else:
+            # old-style linkers raise their own exceptions
+            raise
+
     def __call__(self, *args, **kwargs):
         """
         Evaluates value of a function on given arguments.
@@ -811,6 +971,19 @@ class Function:
             if ``output_subset`` is not passed.
         """
 
+        fast_call = self._fast_call
+        if fast_call is None:
+            fast_call = self._fast_call = self._make_fast_call()
+        if (
+            fast_call
+            and not kwargs
+            and len(args) == len(fast_call[0])
+            and not self.profile
+        ):
+            outputs = self._call_fast(fast_call, args)
+            if outputs is not SLOW_CALL:
+                return outputs
+
         def restore_defaults():
             for i, (required, refeed, value) in enumerate(self.defaults):
                 if refeed:
@@ -976,21 +1149,7 @@ class Function:
             )
         except Exception:
             restore_defaults()
-            if hasattr(self.fn, "position_of_error"):
-                # this is a new vm-provided function or c linker
-                # they need this because the exception manipulation
-                # done by raise_with_op is not implemented in C.
-                thunk = None
-                if hasattr(self.fn, "thunks"):
-                    thunk = self.fn.thunks[self.fn.position_of_error]
-                gof.link.raise_with_op(
-                    node=self.fn.nodes[self.fn.position_of_error],
-                    thunk=thunk,
-                    storage_map=getattr(self.fn, "storage_map", None),
-                )
-            else:
-                # old-style linkers raise their own exceptions
-                raise
+            self._raise_fn_error()
 
         dt_fn = time.time() - t0_fn
         self.maker.mode.fn_time += dt_fn
@@ -1083,6 +1242,92 @@ class Function:
         doc=("dictionary-like access to the containers associated with " "Variables"),
     )
 
+    def map(self, *args, batched=None):
+        """
+        Evaluate the function on a batch of inputs in a single call.
+
+        The graph of the function is vectorized (see
+        `aesara.tensor.vectorize`) and compiled with the same mode at the
+        first call for a given set of batched inputs.
+
+        Parameters
+        ----------
+        args
+            The inputs of the function. The batched ones have one more
+            (leading) dimension than the input they are passed for.
+        batched : list of int, optional
+            The positions of the batched inputs. The other inputs are the
+            same for all the elements of the batch. By default, all the
+            arguments in `args` are batched.
+
+        Returns
+        -------
+        The outputs of the function, each with a leading batch dimension:
+        ``f.map(xs, ys)[i]`` equals ``f(xs[i], ys[i])``.
+
+        """
+        from aesara.tensor.type import TensorType
+        from aesara.tensor.vectorize import vectorize
+
+        if batched is None:
+            batched = range(len(args))
+        batched = tuple(sorted(set(batched)))
+        fn = self._map_fns.get(batched)
+        if fn is None:
+            if self.return_none:
+                raise TypeError("Cannot map a function without outputs")
+            if any(i.update is not None for i in self.maker.inputs):
+                raise NotImplementedError("Cannot map a function with updates")
+            explicit = [i for i in self.maker.inputs if not i.implicit]
+            if not batched or batched[-1] >= len(explicit):
+                raise TypeError(
+                    "Invalid positions of the batched inputs: %s" % (batched,)
+                )
+            inputs = []
+            replace = {}
+            for pos, i in enumerate(explicit):
+                if pos in batched:
+                    var = i.variable
+                    if not isinstance(var.type, TensorType):
+                        raise TypeError("Cannot batch the input %s" % var)
+                    new_var = TensorType(
+                        var.type.dtype, (False,) + var.type.broadcastable
+                    )(var.name)
+                    replace[var] = new_var
+                    inputs.append(
+                        In(
+                            new_var,
+                            name=i.name,
+                            strict=i.strict,
+                            allow_downcast=i.allow_downcast,
+                        )
+                    )
+                else:
+                    inputs.append(
+                        In(
+                            i.variable,
+                            name=i.name,
+                            value=i.value,
+                            strict=i.strict,
+                            allow_downcast=i.allow_downcast,
+                        )
+                    )
+            outputs = vectorize([o.variable for o in self.maker.outputs], replace)
+            if self.unpack_single:
+                (outputs,) = outputs
+            elif self.output_keys is not None:
+                # aesara.function sorts the keys, like for this function.
+                outputs = dict(zip(self.output_keys, outputs))
+            fn = aesara.function(
+                inputs,
+                outputs,
+                mode=self.maker.mode,
+                on_unused_input="ignore",
+                name=self.name,
+            )
+            self._map_fns[batched] = fn
+        return fn(*args)
+
     def free(self):
         """
         When allow_gc = False, clear the Variables in storage_map
@@ -1360,175 +1605,51 @@ class FunctionMaker:
             raise TypeError("Unknown output type: %s (%s)", type(output), output)
 
     def optimize_graph_with_cache(self, optimizer, inputs, outputs):
-        # This function is not finished
-        import os.path
-
-        from aesara.gof.compilelock import get_lock, release_lock
-
-        graph_db_file = os.path.join(aesara.config.compiledir, "optimized_graphs.pkl")
+        """
+        Optimize self.fgraph, reusing the result of a previous optimization
+        of the same graph if there is one in the optimization cache.
 
-        # the inputs, outputs, and size of the graph to be optimized
-        inputs_new = [inp.variable for inp in inputs]
-        outputs_new = [out.variable for out in outputs]
-        size_new = len(self.fgraph.apply_nodes)
-        get_lock()
-        # Beginning of cache optimizations.
-        # Could be refactored in different functions.
+        See `aesara.compile.optcache`.
 
-        def load_graph_db():
-            if os.path.isfile(graph_db_file):
-                print("graph_db already exists")
-            else:
-                # create graph_db
-                with open(graph_db_file, "wb") as f:
-                    print("create new graph_db in %s" % graph_db_file)
-            # load the graph_db dictionary
+        """
+        from aesara.compile.optcache import get_optimized_graph_cache, graph_key
+
+        fgraph = self.fgraph
+        protected = []
+        for feature in fgraph._features:
+            if isinstance(feature, Supervisor):
+                protected.extend(feature.protected)
+        key = graph_key(fgraph, optimizer, protected)
+        if key is None:
+            return optimizer(fgraph)
+
+        cache = get_optimized_graph_cache()
+        new_outputs = cache.get(key, fgraph.inputs)
+        if new_outputs is not None:
+            old_outputs = list(fgraph.outputs)
+            new_nodes = graph.io_toposort(fgraph.inputs, new_outputs)
+            if not hasattr(fgraph, "destroyers") and any(
+                getattr(node.op, "destroy_map", None) for node in new_nodes
+            ):
+                fgraph.attach_feature(gof.DestroyHandler())
+            if not hasattr(fgraph, "validate"):
+                fgraph.attach_feature(gof.toolbox.ReplaceValidate())
+            for i, out in enumerate(new_outputs):
+                fgraph.change_input("output", i, out, reason="optimization_cache")
             try:
-                with open(graph_db_file, "rb") as f:
-                    # Temporary hack to allow
-                    # tests.scan_module.test_scan.T_Scan to
-                    # finish. Should be changed in definitive version.
-                    tmp = aesara.config.unpickle_function
-                    aesara.config.unpickle_function = False
-                    graph_db = pickle.load(f)
-                print("graph_db loaded and it is not empty")
-            except EOFError as e:
-                # the file has nothing in it
-                print(e)
-                print("graph_db loaded and it is empty")
-                graph_db = {}
-            finally:
-                aesara.config.unpickle_function = tmp
-
-            return graph_db
-
-        def find_same_graph_in_db(graph_db):
-            # If found_graph_in_db is None, then need to optimize.
-            # Otherwise, return the graph found.
-            found_graph_in_db = None
-            # The sole purpose of this loop is to set 'need_optimize' by
-            # going through graph_db, looking for graph that has the same
-            # computation performed.
-            for graph_old, graph_optimized in graph_db.items():
-                inputs_old = graph_old.inputs
-                outputs_old = graph_old.outputs
-                size_old = len(graph_old.apply_nodes)
-                # Some heuristics to check is the same graphs have
-                # already been optimized before.
-                if len(inputs_new) != len(inputs_old):
-                    # If the inputs are of different size,
-                    # two graphs are for sure different
-                    print("need to optimize, because input size is different")
-                    continue
-                elif len(outputs_new) != len(outputs_old):
-                    # If the inputs are of different size,
-                    # two graphs are for sure different
-                    print("need to optimize, because output size is different")
-                    continue
-                elif not all(
-                    input_new.type == input_old.type
-                    for input_new, input_old in zip(inputs_new, inputs_old)
-                ):
-                    print("need to optimize, because inputs are of different " "types")
-                    continue
-                elif not all(
-                    output_new.type == output_old.type
-                    for output_new, output_old in zip(outputs_new, outputs_old)
-                ):
-                    print("need to optimize, because outputs are of different " "types")
-                    continue
-                elif not size_old == size_new:
-                    print(
-                        "need to optimize, because numbers of nodes in graph"
-                        " are different"
-                    )
-                    continue
-                else:
-                    flags = []
-                    for i, (output_new, output_old) in enumerate(
-                        zip(outputs_new, outputs_old)
-                    ):
-                        print("loop through outputs node for both graphs")
-                        graph_old.variables = set(
-                            gof.graph.variables(graph_old.inputs, graph_old.outputs)
-                        )
-
-                        # using clone allowed to avoid a lot of errors
-                        # deep copy seemed to had.
-                        f2 = graph_old.clone(check_integrity=False)
-                        t1 = output_new
-                        t2 = f2.outputs[i]
-
-                        # Used to remove "already used by another graph error
-                        def removeAllFgraph(remove):
-                            if hasattr(remove, "fgraph"):
-                                del remove.fgraph
-                            if hasattr(remove, "owner"):
-                                if remove.owner is None:
-                                    pass
-                                else:
-                                    if hasattr(remove.owner, "fgraph"):
-                                        del remove.owner.fgraph
-                                    if hasattr(remove.owner, "inputs"):
-                                        remove.owner.inputs = [
-                                            removeAllFgraph(i)
-                                            for i in remove.owner.inputs
-                                        ]
-                                        for o in remove.owner.outputs:
-                                            if hasattr(o, "fgraph"):
-                                                del o.fgraph
-                            return remove
-
-                        t2 = removeAllFgraph(t2)
-
-                        givens = dict(
-                            zip(gof.graph.inputs([t1]), gof.graph.inputs([t2]))
-                        )
-
-                        temp = dict(zip(gof.graph.inputs([t1]), gof.graph.inputs([t2])))
-
-                        # hack to remove inconstent entry in givens
-                        # seems to work that but source of inconsistency
-                        # could be worth investigating.
-                        for key, value in temp.items():
-                            if key.type != value.type:
-                                del givens[key]
-
-                        flag = is_same_graph(t1, t2, givens=givens)
-
-                        flags.append(flag)
+                fgraph.validate()
+            except gof.InconsistencyError:
+                _logger.warning(
+                    "Ignoring an inconsistent entry of the optimization cache"
+                )
+                for i, out in enumerate(old_outputs):
+                    fgraph.change_input("output", i, out, reason="optimization_cache")
+            else:
+                _logger.debug("Optimized graph found in the cache")
+                return None
 
-                    is_same = all(flags)
-                    if is_same:
-                        # found the match
-                        print("found a match, no need to optimize")
-                        found_graph_in_db = graph_optimized
-                        break
-            return found_graph_in_db
-
-        graph_db = load_graph_db()
-        print("loaded graph_db from %s, size=%d" % (graph_db_file, len(graph_db)))
-        found_graph = find_same_graph_in_db(graph_db)
-        if found_graph:
-            self.fgraph = found_graph
-            optimizer_profile = None
-        else:
-            # this is a brand new graph, optimize it, save it to graph_db
-            print("graph not found in graph_db, optimizing the graph")
-            self.fgraph.variables = set(
-                gof.graph.variables(self.fgraph.inputs, self.fgraph.outputs)
-            )
-            # check_integrity parameters was added to ignore
-            # "excess cached variables" errors. Works that way
-            # but once again the error couldbe worth
-            # investigating.
-            before_opt = self.fgraph.clone(check_integrity=False)
-            optimizer_profile = optimizer(self.fgraph)
-            graph_db.update({before_opt: self.fgraph})
-            with open(graph_db_file, "wb") as f:
-                pickle.dump(graph_db, f, -1)
-            print("new graph saved into graph_db")
-        release_lock()
+        optimizer_profile = optimizer(fgraph)
+        cache.add(key, fgraph)
         return optimizer_profile
 
     def __init__(
@@ -28,6 +28,10 @@ predefined_linkers = {
     "cvm": gof.vm.VM_Linker(use_cloop=True),  # Use allow_gc Aesara flag
     "vm_nogc": gof.vm.VM_Linker(allow_gc=False, use_cloop=False),
     "cvm_nogc": gof.vm.VM_Linker(allow_gc=False, use_cloop=True),
+    "vm_parallel": gof.vm.VM_Linker(use_cloop=False, parallel=True),
+    "vm_parallel_nogc": gof.vm.VM_Linker(
+        allow_gc=False, use_cloop=False, parallel=True
+    ),
     "jax": JAXLinker(),
 }
 
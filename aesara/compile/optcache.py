@@ -0,0 +1,393 @@
+"""
+On-disk cache of optimized graphs.
+
+The graph given to `aesara.function` is identified by a structural hash
+computed by `graph_key`. The key does not depend on the identity of the
+Python objects nor on the order in which the graph was built, so two
+processes that build the same model get the same key. It also covers the
+optimizer that will be applied and the Aesara flags, so that a graph
+optimized with other settings is never reused.
+
+Each optimized graph is stored in its own file of the
+``optimized_graphs`` directory of the compiledir. Files are published
+with an atomic rename, so they can be read without taking the
+compilation lock. The lock is only taken when adding an entry, to update
+the index of entry sizes and to evict the least recently used entries
+once the cache grows beyond the Aesara flag `optimization_cache.max_size`.
+
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import re
+import tempfile
+import types
+from io import StringIO
+
+import numpy as np
+
+import aesara
+from aesara import config
+from aesara.configparser import _config_var_list
+from aesara.gof import graph
+from aesara.gof.compilelock import lock_ctx
+from aesara.gof.fg import FunctionGraph
+
+
+_logger = logging.getLogger("aesara.compile.optcache")
+
+# Flags that can not change the result of the optimization.
+_ignored_flags_prefix = (
+    "base_compiledir",
+    "cache_optimizations",
+    "cmodule.",
+    "compile.",
+    "compiledir",
+    "optimization_cache.",
+    "print_global_stats",
+    "profile",
+    "profiling.",
+)
+
+# Attributes that do not define the behavior of an Op or a Type.
+_ignored_attributes = ("fgraph", "inputs", "name", "outputs", "prepare_node_called")
+
+
+class NotCanonical(Exception):
+    """Raised when an object has no representation stable across processes."""
+
+
+def _holds_variables(obj):
+    return isinstance(obj, (list, tuple)) and any(
+        isinstance(o, graph.Variable) for o in obj
+    )
+
+
+def _canonical(obj):
+    """
+    Return a string describing `obj` that is stable across processes.
+
+    Raise `NotCanonical` if `obj` (or something it contains) has no such
+    description, e.g. when it holds a Variable or a lambda function.
+
+    """
+    if obj is None or isinstance(obj, (bool, int, float, complex, str, bytes)):
+        return repr(obj)
+    if isinstance(obj, (tuple, list)):
+        return "%s(%s)" % (type(obj).__name__, ",".join(_canonical(o) for o in obj))
+    if isinstance(obj, (set, frozenset)):
+        return "set(%s)" % ",".join(sorted(_canonical(o) for o in obj))
+    if isinstance(obj, dict):
+        return "dict(%s)" % ",".join(
+            sorted("%s:%s" % (_canonical(k), _canonical(v)) for k, v in obj.items())
+        )
+    if isinstance(obj, slice):
+        return "slice(%s)" % _canonical((obj.start, obj.stop, obj.step))
+    if isinstance(obj, np.dtype):
+        return "dtype(%s)" % obj.str
+    if isinstance(obj, (np.ndarray, np.generic)):
+        obj = np.asarray(obj)
+        if obj.dtype.hasobject:
+            raise NotCanonical(obj)
+        return "ndarray(%s,%s,%s)" % (
+            obj.dtype.str,
+            obj.shape,
+            hashlib.sha256(np.ascontiguousarray(obj).tobytes()).hexdigest(),
+        )
+    if isinstance(obj, FunctionGraph):
+        return "fgraph(%s)" % graph_digest(obj)
+    if isinstance(obj, (graph.Variable, graph.Apply)):
+        raise NotCanonical(obj)
+    if isinstance(
+        obj, (type, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+    ):
+        name = getattr(obj, "__qualname__", obj.__name__)
+        if "<" in name:
+            # lambdas and functions defined in functions
+            raise NotCanonical(obj)
+        if isinstance(obj, types.MethodType):
+            return "method(%s,%s)" % (_canonical(obj.__self__), name)
+        return "%s.%s" % (obj.__module__, name)
+
+    cls = type(obj)
+    if hasattr(obj, "__props__"):
+        attrs = {p: getattr(obj, p) for p in obj.__props__}
+    elif hasattr(obj, "__dict__"):
+        attrs = {
+            k: v
+            for k, v in obj.__dict__.items()
+            if not k.startswith("_") and k not in _ignored_attributes
+        }
+        if isinstance(getattr(obj, "fgraph", None), FunctionGraph):
+            # e.g. Composite, whose behavior is defined by its inner graph
+            attrs["fgraph"] = obj.fgraph
+        elif _holds_variables(obj.__dict__.get("outputs")):
+            # e.g. Scan, whose inner graph goes from its inputs to its outputs
+            attrs["inner_graph"] = _io_digest(obj.inputs, obj.outputs)
+        elif any(_holds_variables(obj.__dict__.get(k)) for k in _ignored_attributes):
+            raise NotCanonical(obj)
+    else:
+        raise NotCanonical(obj)
+    return "%s.%s%s" % (cls.__module__, cls.__qualname__, _canonical(attrs))
+
+
+def graph_digest(fgraph):
+    """
+    Return a structural hash of `fgraph`.
+
+    The hash of a variable is computed from the Op that produced it and
+    the hashes of its inputs, so it does not depend on the order of the
+    nodes. The inputs of the graph are identified by their position.
+
+    """
+    return _io_digest(fgraph.inputs, fgraph.outputs)
+
+
+def _io_digest(inputs, outputs):
+    """Return the structural hash of the graph between `inputs` and `outputs`."""
+    if not all(isinstance(v, graph.Variable) for v in list(inputs) + list(outputs)):
+        raise NotCanonical(outputs)
+    canonical_cache = {}
+
+    def canonical(obj):
+        if id(obj) not in canonical_cache:
+            canonical_cache[id(obj)] = (obj, _canonical(obj))
+        return canonical_cache[id(obj)][1]
+
+    digests = {}
+    for i, inp in enumerate(inputs):
+        digests[inp] = "input(%i,%s)" % (i, canonical(inp.type))
+
+    def digest(var):
+        if var in digests:
+            return digests[var]
+        if isinstance(var, graph.Constant):
+            d = "constant(%s,%s)" % (canonical(var.type), _canonical(var.data))
+        elif var.owner is None:
+            raise NotCanonical(var)
+        else:
+            node = var.owner
+            d = "apply(%s,[%s],%i,%s)" % (
+                canonical(node.op),
+                ",".join(digest(i) for i in node.inputs),
+                node.outputs.index(var),
+                canonical(var.type),
+            )
+        d = hashlib.sha256(d.encode()).hexdigest()
+        digests[var] = d
+        return d
+
+    # Visit the graph in topological order, to avoid deep recursions.
+    for node in graph.io_toposort(inputs, outputs):
+        for out in node.outputs:
+            digest(out)
+    return hashlib.sha256(",".join(digest(o) for o in outputs).encode()).hexdigest()
+
+
+def optimizer_digest(optimizer):
+    """Return a hash of the structure of `optimizer`."""
+    stream = StringIO()
+    optimizer.print_summary(stream=stream)
+    summary = stream.getvalue()
+    # Remove the object ids and addresses.
+    summary = re.sub(r"id=\d+|\(\d+\)|0x[0-9a-fA-F]+", "", summary)
+    return hashlib.sha256(summary.encode()).hexdigest()
+
+
+def config_digest():
+    """Return a hash of the Aesara flags that can change the optimizations."""
+    opts = sorted(
+        (
+            cv
+            for cv in _config_var_list
+            if not cv.fullname.startswith(_ignored_flags_prefix)
+        ),
+        key=lambda cv: cv.fullname,
+    )
+    return hashlib.sha256(
+        "\n".join(
+            "{} = {}".format(cv.fullname, cv.__get__(True, None)) for cv in opts
+        ).encode()
+    ).hexdigest()
+
+
+def graph_key(fgraph, optimizer, protected=()):
+    """
+    Return the key under which the optimized version of `fgraph` is cached.
+
+    Parameters
+    ----------
+    fgraph
+        The FunctionGraph before optimization.
+    optimizer
+        The optimizer that will be applied to it.
+    protected
+        The inputs of `fgraph` that must not be destroyed.
+
+    Returns
+    -------
+    str or None
+        None if the graph can not be cached.
+
+    """
+    protected = set(protected)
+    try:
+        key = [
+            aesara.__version__,
+            graph_digest(fgraph),
+            repr([inp in protected for inp in fgraph.inputs]),
+            optimizer_digest(optimizer),
+            config_digest(),
+        ]
+    except NotCanonical as e:
+        _logger.debug("Graph not cached, %s has no canonical form", e.args[0])
+        return None
+    return hashlib.sha256("\n".join(key).encode()).hexdigest()
+
+
+class OptimizedGraphCache:
+    """
+    Directory of optimized graphs, one file per key.
+
+    Parameters
+    ----------
+    dirname
+        The directory of the cache.
+    max_size
+        The maximal size of the cache in bytes. When an entry is added and
+        the cache is larger than that, the least recently used entries are
+        removed.
+
+    """
+
+    index_name = "index.pkl"
+
+    def __init__(self, dirname, max_size):
+        self.dirname = dirname
+        self.max_size = max_size
+
+    def _entry_path(self, key):
+        return os.path.join(self.dirname, key + ".pkl")
+
+    def get(self, key, inputs):
+        """
+        Return the optimized outputs cached under `key`, or None.
+
+        The outputs are rebuilt on top of `inputs`, the inputs of the
+        FunctionGraph that is being compiled.
+
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                # Do not compile the inner functions of e.g. Scan now.
+                unpickle_function = config.unpickle_function
+                config.unpickle_function = False
+                try:
+                    cached_inputs, cached_outputs = pickle.load(f)
+                finally:
+                    config.unpickle_function = unpickle_function
+        except FileNotFoundError:
+            return None
+        except Exception:
+            _logger.warning("Ignoring corrupted optimization cache entry %s", path)
+            return None
+        if len(cached_inputs) != len(inputs) or any(
+            c.type != i.type for c, i in zip(cached_inputs, inputs)
+        ):
+            return None
+        try:
+            # Mark the entry as recently used, for the eviction.
+            os.utime(path)
+        except OSError:
+            pass
+        memo = dict(zip(cached_inputs, inputs))
+        equiv = graph.clone_get_equiv(
+            cached_inputs, cached_outputs, copy_inputs=False, memo=memo
+        )
+        return [equiv[o] for o in cached_outputs]
+
+    def add(self, key, fgraph):
+        """Store the optimized `fgraph` under `key`."""
+        # Replace the inputs by new variables, so that shared variables
+        # values are not saved.
+        memo = {inp: inp.type() for inp in fgraph.inputs}
+        equiv = graph.clone_get_equiv(
+            fgraph.inputs, fgraph.outputs, copy_inputs=False, memo=memo
+        )
+        entry = (
+            [equiv[i] for i in fgraph.inputs],
+            [equiv[o] for o in fgraph.outputs],
+        )
+        try:
+            data = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            _logger.debug("Graph not cached, it can not be pickled: %s", e)
+            return
+
+        os.makedirs(self.dirname, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.dirname, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # Readers never see a partially written entry.
+        os.replace(tmp_path, self._entry_path(key))
+
+        with lock_ctx():
+            index = self._load_index()
+            index[key] = len(data)
+            if sum(index.values()) > self.max_size:
+                self._evict(index)
+            self._save_index(index)
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.dirname, self.index_name), "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            return {}
+
+    def _save_index(self, index):
+        fd, tmp_path = tempfile.mkstemp(dir=self.dirname, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, os.path.join(self.dirname, self.index_name))
+
+    def _evict(self, index):
+        """Remove the least recently used entries until the cache fits."""
+        last_use = {}
+        for key in list(index):
+            try:
+                last_use[key] = os.path.getmtime(self._entry_path(key))
+            except OSError:
+                del index[key]
+        total = sum(index.values())
+        for key in sorted(last_use, key=last_use.get):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(self._entry_path(key))
+            except OSError:
+                pass
+            total -= index.pop(key)
+
+    def clear(self):
+        """Remove all the entries."""
+        with lock_ctx():
+            if not os.path.isdir(self.dirname):
+                return
+            for name in os.listdir(self.dirname):
+                if name.endswith((".pkl", ".tmp")):
+                    try:
+                        os.remove(os.path.join(self.dirname, name))
+                    except OSError:
+                        pass
+
+
+def get_optimized_graph_cache():
+    """Return the cache of optimized graphs of the current compiledir."""
+    return OptimizedGraphCache(
+        os.path.join(config.compiledir, "optimized_graphs"),
+        config.optimization_cache.max_size * 2 ** 20,
+    )
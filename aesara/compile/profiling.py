@@ -289,6 +289,10 @@ class ProfileStats:
     optimizer_profile = None
     # None or tuple (the optimizer, the profile it returned)
 
+    memory_plan = {}
+    # FunctionGraph -> list of buffers planned by vm.calculate_memory_plan,
+    # each buffer being the list of variables that reuse it in turn
+
     # param is called flag_time_thunks because most other attributes with time
     # in the name are times *of* something, rather than configuration flags.
     def __init__(
@@ -332,6 +336,7 @@ class ProfileStats:
         self.variable_shape = {}
         self.variable_strides = {}
         self.variable_offset = {}
+        self.memory_plan = {}
         if flag_time_thunks is None:
             self.flag_time_thunks = config.profiling.time_thunks
         else:
@@ -1422,6 +1427,48 @@ class ProfileStats:
 
             print("---", file=file)
 
+        plans = [
+            (fgraph, self.memory_plan[fgraph])
+            for fgraph in fct_memory
+            if self.memory_plan.get(fgraph)
+        ]
+        if plans:
+            n_vars = n_buffers = planned_size = arena_size = 0
+            for fgraph, slots in plans:
+                for slot in slots:
+                    sizes = [var_mem.get(v, 0) for v in slot]
+                    n_vars += len(slot)
+                    n_buffers += 1
+                    planned_size += sum(sizes)
+                    arena_size += max(sizes)
+            print(
+                "    Static memory plan (linker=vm or vm_nogc, Aesara flag"
+                " vm.memory_plan=True)",
+                file=file,
+            )
+            print(
+                "        %d intermediate results share %d buffers"
+                % (n_vars, n_buffers),
+                file=file,
+            )
+            print(
+                "        Buffers size: %dKB (%dKB without the plan)"
+                % (
+                    int(round(arena_size / 1024.0)),
+                    int(round(planned_size / 1024.0)),
+                ),
+                file=file,
+            )
+            print("---", file=file)
+        elif config.vm.memory_plan:
+            # Memory profiling runs the Stack VM, which does not apply the plan.
+            print(
+                "    No static memory plan was applied (vm.memory_plan is only"
+                " applied by the Loop VMs, not when profiling memory)",
+                file=file,
+            )
+            print("---", file=file)
+
         print("", file=file)
         if len(fct_memory) > 1:
             print("    This list is based on all functions in the profile", file=file)
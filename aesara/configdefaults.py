@@ -703,7 +703,18 @@ if rc == 0 and config.cxx != "":
     AddConfigVar(
         "linker",
         "Default linker used if the aesara flags mode is Mode",
-        EnumStr("cvm", "c|py", "py", "c", "c|py_nogc", "vm", "vm_nogc", "cvm_nogc"),
+        EnumStr(
+            "cvm",
+            "c|py",
+            "py",
+            "c",
+            "c|py_nogc",
+            "vm",
+            "vm_nogc",
+            "cvm_nogc",
+            "vm_parallel",
+            "vm_parallel_nogc",
+        ),
         in_c_key=False,
     )
 else:
@@ -712,7 +723,7 @@ else:
     AddConfigVar(
         "linker",
         "Default linker used if the aesara flags mode is Mode",
-        EnumStr("vm", "py", "vm_nogc"),
+        EnumStr("vm", "py", "vm_nogc", "vm_parallel", "vm_parallel_nogc"),
         in_c_key=False,
     )
     if type(config).cxx.is_default:
@@ -1252,11 +1263,21 @@ AddConfigVar(
     "openmp_elemwise_minsize",
     "If OpenMP is enabled, this is the minimum size of vectors "
     "for which the openmp parallelization is enabled "
-    "in element wise ops.",
+    "in element wise ops and reductions.",
     IntParam(200000),
     in_c_key=False,
 )
 
+AddConfigVar(
+    "openmp_num_threads",
+    "If OpenMP is enabled, the number of threads used by the ops "
+    "parallelized with OpenMP, set when each of them runs. "
+    "0 means the number of threads of the OpenMP runtime "
+    "(see OMP_NUM_THREADS and aesara.gof.openmp.num_threads).",
+    IntParam(0, lambda i: i >= 0),
+    in_c_key=False,
+)
+
 AddConfigVar(
     "check_input",
     "Specify if types should check their input in their C code. "
@@ -1269,15 +1290,21 @@ AddConfigVar(
 
 AddConfigVar(
     "cache_optimizations",
-    "WARNING: work in progress, does not work yet. "
-    "Specify if the optimization cache should be used. This cache will "
-    "any optimized graph and its optimization. Actually slow downs a lot "
-    "the first optimization, and could possibly still contains some bugs. "
-    "Use at your own risks.",
+    "Specify if the optimization cache should be used. This cache stores "
+    "the optimized graphs in the compiledir, so that compiling the same "
+    "graph again, also from another process, skips the optimization.",
     BoolParam(False),
     in_c_key=False,
 )
 
+AddConfigVar(
+    "optimization_cache.max_size",
+    "Maximal size, in megabytes, of the optimization cache. When it is "
+    "exceeded, the least recently used graphs are removed.",
+    IntParam(1024, lambda i: i > 0),
+    in_c_key=False,
+)
+
 
 def good_seed_param(seed):
     if seed == "random":
@@ -1577,11 +1604,20 @@ AddConfigVar(
 
 AddConfigVar(
     "cmodule.preload_cache",
-    "If set to True, will preload the C module cache at import time",
+    "If set to True, will read the index of the C module cache at import time",
     BoolParam(False, allow_override=False),
     in_c_key=False,
 )
 
+AddConfigVar(
+    "cmodule.compilation_workers",
+    "Maximum number of C modules compiled at the same time when a "
+    "function is built. 0 means the number of CPUs, 1 disables the "
+    "concurrent compilation.",
+    IntParam(0, lambda i: i >= 0),
+    in_c_key=False,
+)
+
 AddConfigVar(
     "cmodule.age_thresh_use",
     "In seconds. The time after which " "Aesara won't reuse a compile c module.",
@@ -1998,6 +2034,25 @@ AddConfigVar(
     in_c_key=False,
 )
 
+AddConfigVar(
+    "vm.memory_plan",
+    "Useful only for the vm and vm_nogc linkers. If True, plan at compile"
+    " time which intermediate results can reuse the buffer of a dead one,"
+    " based on the shapes inferred by the ShapeFeature. The planned buffers"
+    " are kept between calls, instead of being reallocated.",
+    BoolParam(True),
+    in_c_key=False,
+)
+
+AddConfigVar(
+    "vm.parallel_threads",
+    "Number of worker threads used by the parallel vm linkers "
+    "(vm_parallel, vm_parallel_nogc) to run independent Apply nodes "
+    "concurrently. 0 means use the number of available cores.",
+    IntParam(0, lambda i: i >= 0),
+    in_c_key=False,
+)
+
 AddConfigVar(
     "warn.identify_1pexp_bug",
     "Warn if Aesara versions prior to 7987b51 (2011-12-18) could have "
@@ -2054,6 +2109,30 @@ AddConfigVar(
     in_c_key=False,
 )
 
+AddConfigVar(
+    "scan.fuse_inner",
+    "If True, compile the inner function of scan with the C linker, as a "
+    "single C function, when all its Ops have C code. This removes the "
+    "dispatch of the VM inside each step, which dominates when the steps are "
+    "small. The loop over the steps still calls that function once per "
+    "step (default: False)",
+    BoolParam(False),
+    in_c_key=False,
+)
+
+AddConfigVar(
+    "scan.pushout_seqs_max_bytes",
+    "Largest array, in bytes, that the optimization moving elementwise "
+    "operations on sequences out of scan may create in the backward scan of "
+    "a gradient, for an operation that is cheap to recompute at each step, "
+    "like an addition or a comparison. Larger arrays, or arrays of unknown "
+    "size, are not created and the operation is recomputed in the backward "
+    "scan, which saves the memory of a full trace of the forward loop. "
+    "-1 means no limit (default: 1 MiB)",
+    IntParam(2 ** 20),
+    in_c_key=False,
+)
+
 AddConfigVar(
     "scan.debug",
     "If True, enable extra verbose output related to scan",
@@ -1,6 +1,7 @@
 #include <Python.h>
 #include "aesara_mod_helper.h"
 #include "structmember.h"
+#include <numpy/arrayobject.h>
 #include <sys/time.h>
 
 #if PY_VERSION_HEX >= 0x03000000
@@ -109,6 +110,9 @@ typedef struct {
 
     void ** thunk_cptr_fn;
     void ** thunk_cptr_data;
+
+    Py_ssize_t * ifelse_n_outs; // n_outs of IfElse nodes evaluated in C, 0 for others
+    int * ifelse_as_view; // 1 or 0 for every IfElse node evaluated in C
     PyObject * call_times;
     PyObject * call_counts;
     int do_timing;
@@ -123,6 +127,8 @@ CLazyLinker_dealloc(PyObject* _self)
   CLazyLinker* self = (CLazyLinker *) _self;
   free(self->thunk_cptr_fn);
   free(self->thunk_cptr_data);
+  free(self->ifelse_n_outs);
+  free(self->ifelse_as_view);
 
   free(self->is_lazy);
 
@@ -216,6 +222,8 @@ CLazyLinker_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
       self->thunk_cptr_data = NULL;
       self->thunk_cptr_fn = NULL;
+      self->ifelse_n_outs = NULL;
+      self->ifelse_as_view = NULL;
       self->call_times = NULL;
       self->call_counts = NULL;
       self->do_timing = 0;
@@ -250,6 +258,7 @@ CLazyLinker_init(CLazyLinker *self, PyObject *args, PyObject *kwds)
       (char*)"node_output_size",
       (char*)"update_storage",
       (char*)"dependencies",
+      (char*)"ifelse_list",
       NULL};
 
     PyObject *compute_map_list=NULL,
@@ -265,10 +274,11 @@ CLazyLinker_init(CLazyLinker *self, PyObject *args, PyObject *kwds)
              *node_prereqs=NULL,
              *node_output_size=NULL,
              *update_storage=NULL,
-             *dependencies=NULL;
+             *dependencies=NULL,
+             *ifelse_list=NULL;
 
     assert(!self->nodes);
-    if (! PyArg_ParseTupleAndKeywords(args, kwds, "OOOiOOOOOOOOOOOOOOOO", kwlist,
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "OOOiOOOOOOOOOOOOOOOO|O", kwlist,
                                       &self->nodes,
                                       &self->thunks,
                                       &self->pre_call_clear,
@@ -288,7 +298,8 @@ CLazyLinker_init(CLazyLinker *self, PyObject *args, PyObject *kwds)
                                       &node_prereqs,
                                       &node_output_size,
                                       &update_storage,
-                                      &dependencies
+                                      &dependencies,
+                                      &ifelse_list
                                       ))
         return -1;
     Py_INCREF(self->nodes);
@@ -468,6 +479,52 @@ CLazyLinker_init(CLazyLinker *self, PyObject *args, PyObject *kwds)
     if (unpack_list_of_ssize_t(update_storage, &self->update_storage, &self->n_updates,
                                "updates_storage"))
       return -1;
+
+    // ifelse_list has one element per node: (n_outs, as_view) for the IfElse
+    // nodes to evaluate without calling their thunk, None for the others.
+    if (ifelse_list && ifelse_list != Py_None)
+      {
+        if (!PyList_Check(ifelse_list) || PyList_Size(ifelse_list) != n_applies)
+          {
+            PyErr_SetString(PyExc_TypeError,
+                            "ifelse_list must be a list with one element per node");
+            return -1;
+          }
+        if (n_applies)
+          {
+            self->ifelse_n_outs = (Py_ssize_t*)calloc(n_applies, sizeof(Py_ssize_t));
+            self->ifelse_as_view = (int*)calloc(n_applies, sizeof(int));
+            assert(self->ifelse_n_outs);
+            assert(self->ifelse_as_view);
+          }
+        for (int i = 0; i < n_applies; ++i)
+          {
+            PyObject * el_i = PyList_GetItem(ifelse_list, i);
+            if (el_i == Py_None)
+              continue;
+            if (!PyTuple_Check(el_i) || PyTuple_Size(el_i) != 2)
+              {
+                PyErr_SetString(PyExc_TypeError,
+                                "ifelse_list elements must be None or (n_outs, as_view)");
+                return -1;
+              }
+            Py_ssize_t n_outs = PyNumber_AsSsize_t(PyTuple_GetItem(el_i, 0),
+                                                   PyExc_IndexError);
+            if (PyErr_Occurred()) return -1;
+            int as_view = PyObject_IsTrue(PyTuple_GetItem(el_i, 1));
+            if (as_view < 0) return -1;
+            if (!self->is_lazy[i]
+                || self->node_n_inputs[i] != 1 + 2 * n_outs
+                || self->node_n_outputs[i] != n_outs)
+              {
+                PyErr_SetString(PyExc_ValueError,
+                                "ifelse_list does not match the node inputs and outputs");
+                return -1;
+              }
+            self->ifelse_n_outs[i] = n_outs;
+            self->ifelse_as_view[i] = as_view;
+          }
+      }
     return 0;
 }
 static void set_position_of_error(CLazyLinker * self, int owner_idx)
@@ -552,6 +609,68 @@ static int c_call(CLazyLinker * self, Py_ssize_t node_idx, int verbose)
   if (err) set_position_of_error(self, node_idx);
   return err;
 }
+static
+int lazy_rec_eval(CLazyLinker * self, Py_ssize_t var_idx, PyObject*one, PyObject*zero);
+
+/**
+  Evaluate an IfElse node without calling its thunk: compute the condition,
+  then the inputs of the selected branch, and set the outputs.
+
+  Returns non-zero on error. `done` is set to 0 when the outputs are not
+  ndarrays. The thunk then sets them, as the inputs are computed.
+  */
+static
+int ifelse_eval(CLazyLinker * self, Py_ssize_t owner_idx, PyObject*one, PyObject*zero,
+                int * done)
+{
+  Py_ssize_t n_outs = self->ifelse_n_outs[owner_idx];
+  Py_ssize_t * inputs = self->node_inputs[owner_idx];
+  Py_ssize_t * outputs = self->node_outputs[owner_idx];
+  int err = 0;
+  *done = 0;
+
+  err = lazy_rec_eval(self, inputs[0], one, zero);
+  if (err) return err;
+  PyObject * cond = PyList_GetItem(self->var_value_cells[inputs[0]], 0);
+  // refcounting - cond is borrowed
+  int truth = PyObject_IsTrue(cond);
+  if (truth < 0) return 1;
+
+  Py_ssize_t offset = truth ? 1 : 1 + n_outs;
+  for (Py_ssize_t i = 0; i < n_outs; ++i)
+    {
+      err = lazy_rec_eval(self, inputs[offset + i], one, zero);
+      if (err) return err;
+    }
+  for (Py_ssize_t i = 0; i < n_outs; ++i)
+    {
+      PyObject * val = PyList_GetItem(self->var_value_cells[inputs[offset + i]], 0);
+      if (!PyArray_CheckExact(val))
+        return 0;
+    }
+
+  for (Py_ssize_t i = 0; i < n_outs; ++i)
+    {
+      PyObject * val = PyList_GetItem(self->var_value_cells[inputs[offset + i]], 0);
+      PyObject * out = NULL;
+      // Only the true branch can be viewed, like in IfElse.make_thunk.
+      if (truth && self->ifelse_as_view[owner_idx])
+        {
+          Py_INCREF(val);
+          out = val;
+        }
+      else
+        {
+          out = PyArray_NewCopy((PyArrayObject*)val, NPY_CORDER);
+          if (!out) return 1;
+        }
+      // steals the reference to out
+      if (PyList_SetItem(self->var_value_cells[outputs[i]], 0, out)) return 1;
+    }
+  *done = 1;
+  return 0;
+}
+
 static
 int lazy_rec_eval(CLazyLinker * self, Py_ssize_t var_idx, PyObject*one, PyObject*zero)
 {
@@ -580,7 +699,17 @@ int lazy_rec_eval(CLazyLinker * self, Py_ssize_t var_idx, PyObject*one, PyObject
     }
 
   // STEP 2: compute the node itself
-  if (self->is_lazy[owner_idx])
+  int ifelse_done = 0;
+  if (self->ifelse_n_outs && self->ifelse_n_outs[owner_idx] && !self->do_timing)
+    {
+      err = ifelse_eval(self, owner_idx, one, zero, &ifelse_done);
+      if (err) goto fail;
+    }
+  if (ifelse_done)
+    {
+      // The outputs were set by ifelse_eval.
+    }
+  else if (self->is_lazy[owner_idx])
     {
       // update the compute_map cells corresponding to the inputs of this thunk
       for (int i = 0; i < self->node_n_inputs[owner_idx]; ++i)
@@ -1054,7 +1183,7 @@ static PyTypeObject lazylinker_ext_CLazyLinkerType = {
 
 static PyObject * get_version(PyObject *dummy, PyObject *args)
 {
-  PyObject *result = PyFloat_FromDouble(0.211);
+  PyObject *result = PyFloat_FromDouble(0.212);
   return result;
 }
 
@@ -1088,6 +1217,7 @@ initlazylinker_ext(void)
 #endif
     PyObject* m;
 
+    import_array();
     lazylinker_ext_CLazyLinkerType.tp_new = PyType_GenericNew;
     if (PyType_Ready(&lazylinker_ext_CLazyLinkerType) < 0)
         return RETVAL;
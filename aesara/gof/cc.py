@@ -5,6 +5,7 @@ Defines Linkers that deal with C implementations.
 import logging
 import os
 import sys
+import weakref
 from copy import copy
 from io import StringIO
 
@@ -15,6 +16,7 @@ from aesara import config
 from aesara.gof import cmodule, graph, link, utils
 from aesara.gof.callcache import CallCache
 from aesara.gof.compilelock import get_lock, release_lock
+from aesara.gof.fg import FunctionGraph
 
 
 _logger = logging.getLogger("aesara.gof.cc")
@@ -608,6 +610,7 @@ class CLinker(link.Linker):
         self.fgraph = fgraph
         self.fetch_variables()
         self.no_recycling = no_recycling
+        self.__dict__.pop("_cmodule_key", None)
         return self
 
     def fetch_variables(self):
@@ -1351,15 +1354,20 @@ class CLinker(link.Linker):
         no_recycling set. Older versions of compiled modules only have the
         no_recycle list.
 
+        This method is cached on the first call so it can be called
+        multiple times without penalty.
+
         """
-        return self.cmodule_key_(
-            self.fgraph,
-            self.no_recycling,
-            compile_args=self.compile_args(),
-            libraries=self.libraries(),
-            header_dirs=self.header_dirs(),
-            c_compiler=self.c_compiler(),
-        )
+        if not hasattr(self, "_cmodule_key"):
+            self._cmodule_key = self.cmodule_key_(
+                self.fgraph,
+                self.no_recycling,
+                compile_args=self.compile_args(),
+                libraries=self.libraries(),
+                header_dirs=self.header_dirs(),
+                c_compiler=self.c_compiler(),
+            )
+        return self._cmodule_key
 
     def cmodule_key_variables(
         self,
@@ -1597,24 +1605,13 @@ class CLinker(link.Linker):
         """
         if location is None:
             location = cmodule.dlimport_workdir(config.compiledir)
-        mod = self.get_dynamic_module()
         c_compiler = self.c_compiler()
-        libs = self.libraries()
-        preargs = self.compile_args()
         # We want to compute the code without the lock
-        src_code = mod.code()
+        compile_args = self.compile_cmodule_args()
         get_lock()
         try:
             _logger.debug("LOCATION %s", str(location))
-            module = c_compiler.compile_str(
-                module_name=mod.code_hash,
-                src_code=src_code,
-                location=location,
-                include_dirs=self.header_dirs(),
-                lib_dirs=self.lib_dirs(),
-                libs=libs,
-                preargs=preargs,
-            )
+            module = c_compiler.compile_str(location=location, **compile_args)
         except Exception as e:
             e.args += (str(self.fgraph),)
             raise
@@ -1622,6 +1619,22 @@ class CLinker(link.Linker):
             release_lock()
         return module
 
+    def compile_cmodule_args(self):
+        """
+        Return the arguments of ``c_compiler().compile_str`` that compile
+        the source code for this linker, except for the location.
+
+        """
+        mod = self.get_dynamic_module()
+        return dict(
+            module_name=mod.code_hash,
+            src_code=mod.code(),
+            include_dirs=self.header_dirs(),
+            lib_dirs=self.lib_dirs(),
+            libs=self.libraries(),
+            preargs=self.compile_args(),
+        )
+
     def get_dynamic_module(self):
         """
         Return a cmodule.DynamicModule instance full of the code for our fgraph.
@@ -1845,6 +1858,79 @@ class _CThunk:
             raise exc_value.with_traceback(exc_trace)
 
 
+# The CLinkers built by `compile_c_modules`, by node, with the part of
+# `no_recycling` they were built for. `Op.make_c_thunk` takes them back with
+# `prepared_linker`, so their keys are not computed again.
+_prepared_linkers = weakref.WeakKeyDictionary()
+
+
+def prepared_linker(node, no_recycling):
+    """
+    Return the CLinker that `compile_c_modules` built for `node`, or None.
+
+    A linker is only returned once, and only if it was built for the same
+    `no_recycling`.
+
+    """
+    cl, recycle = _prepared_linkers.pop(node, (None, None))
+    if cl is None or recycle != [o in no_recycling for o in node.outputs]:
+        return None
+    return cl
+
+
+def compile_c_modules(nodes, storage_map, compute_map, no_recycling, n_workers=None):
+    """
+    Compile concurrently the C modules of `nodes` missing from the cache.
+
+    This is called before making the thunks of `nodes`, which then find
+    their module in the cache and reuse the linkers built here (see
+    `prepared_linker`). Nodes whose Op has no C implementation or makes its
+    own thunks are skipped. Nothing is done if the modules are not compiled
+    concurrently.
+
+    Parameters
+    ----------
+    nodes
+        The Apply nodes whose thunks will be made.
+    storage_map, compute_map, no_recycling
+        The arguments that will be given to ``node.op.make_thunk``.
+    n_workers : int
+        See `ModuleCache.compile_many`.
+
+    """
+    if not config.cxx or cmodule.compilation_workers(n_workers) < 2:
+        return
+    items = []
+    prepared = {}
+    for node in nodes:
+        op = node.op
+        # Only `Op.make_thunk` uses `Op.make_c_thunk`.
+        if getattr(type(op), "make_thunk", None) is not aesara.gof.op.Op.make_thunk:
+            continue
+        if not getattr(op, "_f16_ok", False) and any(
+            getattr(v.type, "dtype", "") == "float16"
+            for v in node.inputs + node.outputs
+        ):
+            continue
+        try:
+            op.prepare_node(node, storage_map, compute_map, "c")
+            # Same linker as in `Op.make_c_thunk`.
+            e = FunctionGraph(node.inputs, node.outputs)
+            e_no_recycling = [
+                new_o
+                for (new_o, old_o) in zip(e.outputs, node.outputs)
+                if old_o in no_recycling
+            ]
+            cl = CLinker().accept(e, no_recycling=e_no_recycling)
+            items.append((cl.cmodule_key(), cl))
+        except Exception:
+            # `make_thunk` will report the error or fall back on perform.
+            continue
+        prepared[node] = (cl, [o in no_recycling for o in node.outputs])
+    get_module_cache().compile_many(items, n_workers=n_workers)
+    _prepared_linkers.update(prepared)
+
+
 class OpWiseCLinker(link.LocalLinker):
     """
     Uses CLinker on the individual Ops that comprise an fgraph and loops
@@ -1929,6 +2015,8 @@ class OpWiseCLinker(link.LocalLinker):
             for k in storage_map:
                 compute_map[k] = [k.owner is None]
 
+            compile_c_modules(order, storage_map, compute_map, no_recycling)
+
             thunks = []
             for node in order:
                 # make_thunk will try by default C code, otherwise
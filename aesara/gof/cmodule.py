@@ -3,6 +3,7 @@ Generate and compile C modules for Python.
 
 """
 import atexit
+import concurrent.futures
 import distutils.sysconfig
 import logging
 import os
@@ -15,6 +16,7 @@ import subprocess
 import sys
 import tempfile
 import textwrap
+import threading
 import time
 import warnings
 from io import BytesIO, StringIO
@@ -298,6 +300,14 @@ def dlimport(fullpath, suffix=None):
     _logger.debug("WORKDIR %s", workdir)
     _logger.debug("module_name %s", module_name)
 
+    # Versioned modules are published in directories named after their
+    # hash, so the same module may have been imported from another cache
+    # directory.
+    loaded = sys.modules.get(module_name)
+    if loaded is not None and not fullpath.startswith(loaded.__file__):
+        del sys.modules[module_name]
+        sys.modules.pop(module_name.split(".")[0], None)
+
     sys.path[0:0] = [workdir]  # insert workdir at beginning (temporarily)
     global import_time
     try:
@@ -524,21 +534,31 @@ class KeyData:
         if save_pkl:
             self.save_pkl()
 
-    def save_pkl(self):
+    def save_pkl(self, path=None):
         """
-        Dump this object into its `key_pkl` file.
+        Dump this object into its `key_pkl` file, or into `path`.
+
+        The file is replaced atomically, so it can be read without holding
+        a lock.
 
         May raise a cPickle.PicklingError if such an exception is raised at
         pickle time (in which case a warning is also displayed).
 
         """
+        if path is None:
+            path = self.key_pkl
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
         # Note that writing in binary mode is important under Windows.
         try:
-            with open(self.key_pkl, "wb") as f:
+            with os.fdopen(fd, "wb") as f:
                 pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
-        except pickle.PicklingError:
-            _logger.warning("Cache leak due to unpickle-able key data %s", self.keys)
-            os.remove(self.key_pkl)
+            os.replace(tmp_path, path)
+        except BaseException as e:
+            os.remove(tmp_path)
+            if isinstance(e, pickle.PicklingError):
+                _logger.warning(
+                    "Cache leak due to unpickle-able key data %s", self.keys
+                )
             raise
 
     def get_entry(self):
@@ -584,6 +604,34 @@ class KeyData:
                     pass
 
 
+def compilation_workers(n_workers=None):
+    """
+    Return the number of modules `ModuleCache.compile_many` compiles at once.
+
+    Parameters
+    ----------
+    n_workers : int
+        The requested number. Defaults to the Aesara flag
+        `cmodule.compilation_workers`, 0 meaning the number of CPUs.
+
+    Returns
+    -------
+    int
+        Less than 2 if the modules are compiled one at a time, by
+        `ModuleCache.module_from_key`.
+
+    """
+    if n_workers is None:
+        n_workers = config.cmodule.compilation_workers
+    if n_workers <= 0:
+        n_workers = os.cpu_count() or 1
+    # Without fcntl, `ModuleCache._lock_key` uses the global lock, that is
+    # not thread safe.
+    if compilelock.fcntl is None:
+        return 1
+    return n_workers
+
+
 class ModuleCache:
     """
     Interface to the cache of dynamically compiled modules on disk.
@@ -606,6 +654,22 @@ class ModuleCache:
     - possibly a delete.me file, meaning this directory has been marked
     for deletion.
 
+    A versioned module is compiled in the ``staging`` directory, and then
+    renamed into ``tmp<module hash>``: other processes never see partially
+    written modules, so the cache can be read without holding a lock. The
+    compilation of a module only holds the lock of its hash (see
+    `compilelock.lock_key`), so that different modules can be compiled at
+    the same time and the same module is compiled only once.
+
+    Each published module is also appended to the ``module_index`` file of
+    the cache directory, as a line ``<module hash> <directory> <time>``. The
+    time is the one at which the entry was last validated. `refresh` only
+    reads the lines appended since its last call, and the key.pkl file of a
+    module is only loaded when the module is needed, so that starting a
+    process does not depend on the size of the cache. Old and broken modules
+    are removed by `cleanup_steps`, that runs in a background thread at most
+    once every `cleanup_interval` seconds (see `start_cleanup`).
+
     Keys should be tuples of length 2: (version, rest). The
     ``rest`` can be anything hashable and picklable, that uniquely
     identifies the computation in the module. The key is returned by
@@ -682,6 +746,16 @@ class ModuleCache:
     """
     Set of all key.pkl files that have been loaded.
 
+    """
+    module_index = {}
+    """
+    Maps a module hash to the name of its directory, as read from the index.
+
+    """
+    index_name = "module_index"
+    """
+    The name of the index file in the cache directory.
+
     """
 
     def __init__(self, dirname, check_for_broken_eq=True, do_refresh=True):
@@ -693,7 +767,13 @@ class ModuleCache:
         self.stats = [0, 0, 0]
         self.check_for_broken_eq = check_for_broken_eq
         self.loaded_key_pkl = set()
+        self.module_index = dict(self.module_index)
+        # (inode, offset) of the part of the index already read.
+        self._index_pos = None
         self.time_spent_in_check_key = 0
+        # Protects module_from_name and module_hash_to_key_data, that the
+        # cleanup thread reads.
+        self._lock = threading.RLock()
 
         if do_refresh:
             self.refresh()
@@ -713,38 +793,75 @@ class ModuleCache:
         """
         if name not in self.module_from_name:
             _logger.debug("loading name %s", name)
-            self.module_from_name[name] = dlimport(name)
+            module = dlimport(name)
+            with self._lock:
+                self.module_from_name[name] = module
             self.stats[1] += 1
         else:
             _logger.debug("returning compiled module from cache %s", name)
             self.stats[0] += 1
         return self.module_from_name[name]
 
-    def refresh(self, age_thresh_use=None, delete_if_problem=False, cleanup=True):
+    def refresh(
+        self, age_thresh_use=None, delete_if_problem=False, cleanup=True, full=False
+    ):
         """
-        Update cache data by walking the cache directory structure.
+        Update cache data from the index of the cache directory.
 
-        Load key.pkl files that have not been loaded yet.
+        Only read the entries appended to the index since the last call. The
+        key.pkl files of these modules are loaded when they are needed.
         Remove entries which have been removed from the filesystem.
-        Also, remove malformed cache directories.
+
+        If there is no index yet, e.g. for a cache directory used by an
+        older version of Aesara, the cache directory is walked as with
+        ``full=True``, and the index is built from what was found.
 
         Parameters
         ----------
         age_thresh_use
             Do not use modules other than this. Defaults to self.age_thresh_use.
+            Only used when walking the cache directory.
         delete_if_problem : bool
-            If True, cache entries that meet one of those two conditions are
-            deleted:
+            Only used when walking the cache directory. If True, cache
+            entries that meet one of those two conditions are deleted:
             - Those for which unpickling the KeyData file fails with
               an unknown exception.
             - Duplicated modules, regardless of their age.
         cleanup : bool
-            Do a cleanup of the cache removing expired and broken modules.
+            Only used when walking the cache directory. Do a cleanup of the
+            cache removing expired and broken modules.
+        full : bool
+            Walk the cache directory structure and load all the key.pkl files
+            that have not been loaded yet. Also, remove malformed cache
+            directories.
 
         Returns
         -------
         list
-            A list of modules of age higher than age_thresh_use.
+            A list of modules of age higher than age_thresh_use, found when
+            walking the cache directory.
+
+        """
+        if not full and self._read_index():
+            self._forget_missing()
+            return []
+        too_old_to_use = self._refresh_dirs(age_thresh_use, delete_if_problem, cleanup)
+        if os.path.isdir(self.dirname):
+            # Create the index, or add the modules it does not know.
+            self._read_index()
+            self._append_index(
+                (module_hash, os.path.dirname(key_data.get_entry()))
+                for module_hash, key_data in self.module_hash_to_key_data.items()
+                if any(key[0] for key in key_data.keys)
+                and self.module_index.get(module_hash)
+                != os.path.basename(os.path.dirname(key_data.get_entry()))
+            )
+            self._read_index()
+        return too_old_to_use
+
+    def _refresh_dirs(self, age_thresh_use, delete_if_problem, cleanup):
+        """
+        Walk the cache directory structure, see `refresh`.
 
         """
         if age_thresh_use is None:
@@ -774,8 +891,8 @@ class ModuleCache:
             subdirs = []
         files, root = None, None  # To make sure the "del" below works
         for subdirs_elem in subdirs:
-            # Never clean/remove lock_dir
-            if subdirs_elem == "lock_dir":
+            # Never clean/remove lock_dir, key_locks and staging
+            if subdirs_elem in ("lock_dir", "key_locks", "staging"):
                 continue
             root = os.path.join(self.dirname, subdirs_elem)
             # Don't delete the gpuarray kernel cache
@@ -954,7 +1071,8 @@ class ModuleCache:
 
                     # Remember the map from a module's hash to the KeyData
                     # object associated with it.
-                    self.module_hash_to_key_data[mod_hash] = key_data
+                    with self._lock:
+                        self.module_hash_to_key_data[mod_hash] = key_data
 
                     for key in key_data.keys:
                         if key not in self.entry_from_key:
@@ -993,7 +1111,31 @@ class ModuleCache:
         # Clean up the name space to prevent bug.
         del root, files, subdirs
 
-        # Remove entries that are not in the filesystem.
+        self._forget_missing()
+
+        # Modules are published atomically, so we do not need the lock to
+        # delete broken or empty directories: they are not being written.
+        # Concurrent deletions of the same directory are fine.
+        for a, kw in to_delete:
+            _rmtree(*a, **kw)
+        for a, kw in to_delete_empty:
+            try:
+                files = os.listdir(a[0])
+            except OSError:
+                # Already deleted by another process.
+                continue
+            if not files:
+                _rmtree(*a, **kw)
+
+        _logger.debug("Time needed to refresh cache: %s", (time.time() - start_time))
+
+        return too_old_to_use
+
+    def _forget_missing(self):
+        """
+        Remove entries that are not in the filesystem.
+
+        """
         items_copy = list(self.module_hash_to_key_data.items())
         for module_hash, key_data in items_copy:
             entry = key_data.get_entry()
@@ -1017,11 +1159,13 @@ class ModuleCache:
                         "%s... this could lead to problems.",
                         entry,
                     )
-                    del self.module_from_name[entry]
+                    with self._lock:
+                        del self.module_from_name[entry]
 
                 _logger.info("deleting ModuleCache entry %s", entry)
                 key_data.delete_keys_from(self.entry_from_key)
-                del self.module_hash_to_key_data[module_hash]
+                with self._lock:
+                    del self.module_hash_to_key_data[module_hash]
                 if key_data.keys and list(key_data.keys)[0][0]:
                     # this is a versioned entry, so should have been on
                     # disk. Something weird happened to cause this, so we
@@ -1040,18 +1184,103 @@ class ModuleCache:
                         )
                     self.loaded_key_pkl.remove(pkl_file_to_remove)
 
-        if to_delete or to_delete_empty:
-            with compilelock.lock_ctx():
-                for a, kw in to_delete:
-                    _rmtree(*a, **kw)
-                for a, kw in to_delete_empty:
-                    files = os.listdir(a[0])
-                    if not files:
-                        _rmtree(*a, **kw)
+    def _index_path(self):
+        return os.path.join(self.dirname, self.index_name)
 
-        _logger.debug("Time needed to refresh cache: %s", (time.time() - start_time))
+    @staticmethod
+    def _parse_index(data):
+        """
+        Return the (module hash, directory name) pairs of the complete lines
+        of `data`, and the number of bytes they use.
 
-        return too_old_to_use
+        """
+        # The last line may be being written by another process.
+        end = data.rfind(b"\n") + 1
+        entries = []
+        for line in data[:end].decode(errors="replace").splitlines():
+            try:
+                module_hash, name, _validated = line.split()
+            except ValueError:
+                continue
+            entries.append((module_hash, name))
+        return entries, end
+
+    def _read_index(self):
+        """
+        Read the entries appended to the index since the last call.
+
+        Returns
+        -------
+        bool
+            False if there is no index.
+
+        """
+        try:
+            with open(self._index_path(), "rb") as f:
+                st = os.fstat(f.fileno())
+                inode, offset = self._index_pos or (None, 0)
+                if st.st_ino != inode or st.st_size < offset:
+                    # The index was compacted, read it from the start.
+                    self.module_index = {}
+                    offset = 0
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return False
+        entries, end = self._parse_index(data)
+        # The last entry of a module wins, as modules are only indexed again
+        # when the previous directory could not be used.
+        self.module_index.update(entries)
+        self._index_pos = (st.st_ino, offset + end)
+        return True
+
+    def _append_index(self, entries):
+        """
+        Append the (module hash, module directory) pairs `entries` to the
+        index.
+
+        """
+        now = int(time.time())
+        lines = "".join(
+            "%s %s %i\n" % (module_hash, os.path.basename(module_dir), now)
+            for module_hash, module_dir in entries
+        )
+        if not lines:
+            return
+        # The lock makes sure we do not write in an index that is being
+        # replaced by `_compact_index`.
+        with self._lock_key(self.index_name):
+            with open(self._index_path(), "a") as f:
+                f.write(lines)
+
+    def _compact_index(self):
+        """
+        Rewrite the index without the duplicated entries and the modules
+        that were removed.
+
+        """
+        with self._lock_key(self.index_name):
+            try:
+                with open(self._index_path(), "rb") as f:
+                    entries, _ = self._parse_index(f.read())
+            except FileNotFoundError:
+                return
+            now = int(time.time())
+            lines = [
+                "%s %s %i\n" % (module_hash, name, now)
+                for module_hash, name in dict(entries).items()
+                if os.path.exists(os.path.join(self.dirname, name, "key.pkl"))
+            ]
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.dirname, prefix=self.index_name + "."
+            )
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.writelines(lines)
+                os.replace(tmp_path, self._index_path())
+            except BaseException:
+                os.remove(tmp_path)
+                raise
 
     def _get_from_key(self, key, key_data=None):
         """
@@ -1077,11 +1306,19 @@ class ModuleCache:
             return None
         return self._get_module(name)
 
-    def _get_from_hash(self, module_hash, key, keep_lock=False):
+    def _get_from_hash(self, module_hash, key):
+        if module_hash not in self.module_hash_to_key_data and key[0]:
+            # The module may be in the index, or have been published by
+            # another process since the last refresh.
+            key_data = self._load_published(module_hash)
+            if key_data is not None:
+                self._add_published(module_hash, key, key_data, compiled=False)
+                if key in key_data.keys:
+                    return self._get_from_key(key)
         if module_hash in self.module_hash_to_key_data:
             key_data = self.module_hash_to_key_data[module_hash]
             module = self._get_from_key(None, key_data)
-            with compilelock.lock_ctx(keep_lock=keep_lock):
+            with self._lock_key(module_hash):
                 try:
                     key_data.add_key(key, save_pkl=bool(key[0]))
                     key_broken = False
@@ -1116,7 +1353,7 @@ class ModuleCache:
 
     def _add_to_cache(self, module, key, module_hash):
         """
-        This function expects the compile lock to be held.
+        Add the unversioned `module` compiled by this process to the cache.
 
         """
         name = module.__file__
@@ -1125,26 +1362,14 @@ class ModuleCache:
         # compilation. That is the only cause found that makes
         # the following assert fail.
         assert key not in self.entry_from_key
+        assert not key[0]
 
         location = os.path.dirname(name)
         key_pkl = os.path.join(location, "key.pkl")
-        assert not os.path.exists(key_pkl)
         key_data = KeyData(
             keys={key}, module_hash=module_hash, key_pkl=key_pkl, entry=name
         )
-
-        key_broken = False
-        if key[0]:
-            try:
-                key_data.save_pkl()
-            except pickle.PicklingError:
-                key_broken = True
-                key_data.remove_key(key)
-                key_data.save_pkl()
-            if not key_broken and self.check_for_broken_eq:
-                self.check_key(key, key_pkl)
-            self.loaded_key_pkl.add(key_pkl)
-        elif config.cmodule.warn_no_version:
+        if config.cmodule.warn_no_version:
             key_flat = flatten(key)
             ops = [k for k in key_flat if isinstance(k, aesara.Op)]
             _logger.warning(
@@ -1153,9 +1378,27 @@ class ModuleCache:
                 " c_code_cache_version(). This makes them"
                 " recompiled for each process." + str(ops)
             )
-        self._update_mappings(key, key_data, module.__file__, not key_broken)
+        self._update_mappings(key, key_data, module.__file__, True)
         return key_data
 
+    def _add_published(self, module_hash, key, key_data, compiled):
+        """
+        Add the versioned module described by `key_data` to the cache.
+
+        The module itself is loaded later, by `_get_from_key`. If `key` is
+        not one of its keys (e.g. it was compiled by another process for
+        another key), it is added by `_get_from_hash`.
+
+        """
+        if compiled:
+            self.stats[2] += 1
+            if key in key_data.keys and self.check_for_broken_eq:
+                self.check_key(key, key_data.key_pkl)
+        with self._lock:
+            self.module_hash_to_key_data[module_hash] = key_data
+        self.loaded_key_pkl.add(key_data.key_pkl)
+        self._update_mappings(key, key_data, key_data.get_entry(), check_in_keys=False)
+
     def module_from_key(self, key, lnk=None, keep_lock=False):
         """
         Return a module from the cache, compiling it if necessary.
@@ -1167,11 +1410,11 @@ class ModuleCache:
             we avoid compilation.
         lnk
             Usually a CLinker instance, but it can be any object that defines
-            the `get_src_code()` and `compile_cmodule(location)` functions. The
-            first one returns the source code of the module to load/compile and
-            the second performs the actual compilation.
+            the `get_src_code()`, `c_compiler()` and `compile_cmodule_args()`
+            functions. The first one returns the source code of the module to
+            load/compile, the others tell how to compile it.
         keep_lock : bool
-            If True, the compilation lock will not be released if taken.
+            Ignored, the compilation lock is not taken anymore.
 
         """
         # Is the module in the cache?
@@ -1182,72 +1425,283 @@ class ModuleCache:
         src_code = lnk.get_src_code()
         # Is the source code already in the cache?
         module_hash = get_module_hash(src_code, key)
-        module = self._get_from_hash(module_hash, key, keep_lock=keep_lock)
+        module = self._get_from_hash(module_hash, key)
         if module is not None:
             return module
 
-        with compilelock.lock_ctx(keep_lock=keep_lock):
-            # 1) Maybe somebody else compiled it for us while we
-            #    where waiting for the lock. Try to load it again.
-            # 2) If other repo that import Aesara have Aesara ops defined,
-            #    we need to refresh the cache here. Otherwise, there are import
-            #    order problems.
-            #    When device=gpu, we compile during Aesara
-            #    import. This triggers the loading of the cache. But
-            #    unpickling the cache asks that the external Ops are
-            #    completly loaded, which isn't always the case!
-            #    If a module isn't completly loaded and its unpickling
-            #    fails, it means it is safe for this function
-            #    compilation to skip them, but not for future
-            #    compilations. So reloading the cache here
-            #    compilation fixes this problem. (we could do that only once)
-            self.refresh(cleanup=False)
+        hash_key = hash(key)
+        c_compiler = lnk.c_compiler()
+        compile_args = lnk.compile_cmodule_args()
+        try:
+            if key[0]:
+                # Maybe somebody else compiled it for us. This also covers
+                # modules whose key.pkl could not be unpickled by `refresh`
+                # because their Ops were not imported yet.
+                key_data, compiled = self._compile_module(
+                    module_hash, key, c_compiler, compile_args
+                )
+            else:
+                # Unversioned modules are not shared, but they are also
+                # compiled in staging, so that the cleanup of other processes
+                # never sees them half-written.
+                location, module_file = self._compile_staged(c_compiler, compile_args)
+                module_dir = self._new_module_dir()
+                try:
+                    os.rename(location, module_dir)
+                except BaseException:
+                    _rmtree(location, ignore_if_missing=True, msg="failed rename")
+                    raise
+                module = dlimport(os.path.join(module_dir, module_file))
+        except OSError as e:
+            _logger.error(e)
+            if e.errno == 31:
+                _logger.error(
+                    "There are %i files in %s",
+                    len(os.listdir(config.compiledir)),
+                    config.compiledir,
+                )
+            raise
+
+        # Changing the hash of the key is not allowed during
+        # compilation.
+        assert hash(key) == hash_key
 
+        if key[0]:
+            self._add_published(module_hash, key, key_data, compiled)
             module = self._get_from_key(key)
-            if module is not None:
-                return module
+            if module is None:
+                module = self._get_from_hash(module_hash, key)
+            return module
 
-            module = self._get_from_hash(module_hash, key)
-            if module is not None:
-                return module
+        name = module.__file__
+        assert name not in self.module_from_name
+        with self._lock:
+            self.module_from_name[name] = module
+        key_data = self._add_to_cache(module, key, module_hash)
+        with self._lock:
+            self.module_hash_to_key_data[module_hash] = key_data
+        self.stats[2] += 1
+        return module
 
-            hash_key = hash(key)
+    def compile_many(self, items, n_workers=None):
+        """
+        Compile concurrently the modules missing from the cache.
+
+        This does not return the modules: `module_from_key` finds them in the
+        cache afterwards. Modules that fail to compile here are left to
+        `module_from_key`, which will report the error.
+
+        Parameters
+        ----------
+        items
+            List of (key, lnk) pairs, as given to `module_from_key`.
+        n_workers : int
+            Maximum number of modules compiled at the same time, see
+            `compilation_workers`.
 
-            nocleanup = False
+        """
+        n_workers = compilation_workers(n_workers)
+        if n_workers < 2:
+            return
+
+        pending = {}
+        pending_keys = set()
+        for key, lnk in items:
+            # Unversioned modules are left to `module_from_key`, as they are
+            # not shared between processes.
+            if (
+                key is None
+                or not key[0]
+                or key in self.entry_from_key
+                or key in pending_keys
+            ):
+                continue
             try:
-                location = dlimport_workdir(self.dirname)
-                module = lnk.compile_cmodule(location)
-                name = module.__file__
-                assert name.startswith(location)
-                assert name not in self.module_from_name
-                self.module_from_name[name] = module
-                nocleanup = True
-            except OSError as e:
-                _logger.error(e)
-                if e.errno == 31:
-                    _logger.error(
-                        "There are %i files in %s",
-                        len(os.listdir(config.compiledir)),
-                        config.compiledir,
+                module_hash = get_module_hash(lnk.get_src_code(), key)
+                if module_hash in self.module_hash_to_key_data:
+                    continue
+                if module_hash not in pending:
+                    pending_keys.add(key)
+                    pending[module_hash] = (
+                        key,
+                        lnk.c_compiler(),
+                        lnk.compile_cmodule_args(),
                     )
+            except Exception:
+                # e.g. no C implementation, `module_from_key` will deal
+                # with it.
+                continue
+        if len(pending) < 2:
+            return
+
+        _logger.debug("Compiling %i modules with %i workers", len(pending), n_workers)
+        with concurrent.futures.ThreadPoolExecutor(
+            min(n_workers, len(pending))
+        ) as executor:
+            futures = {
+                executor.submit(self._compile_module, module_hash, *args): module_hash
+                for module_hash, args in pending.items()
+            }
+            for future in concurrent.futures.as_completed(futures):
+                module_hash = futures[future]
+                key = pending[module_hash][0]
+                try:
+                    key_data, compiled = future.result()
+                except Exception as e:
+                    _logger.debug("Parallel compilation of %s failed: %s", key, e)
+                    continue
+                # The module is loaded by `module_from_key`, as imports are
+                # not thread safe.
+                self._add_published(module_hash, key, key_data, compiled)
+
+    def _lock_key(self, module_hash):
+        return compilelock.lock_key(
+            module_hash, lock_dir=os.path.join(self.dirname, "key_locks")
+        )
+
+    def _module_dir(self, module_hash):
+        """
+        Return the directory where the versioned module `module_hash` is
+        published.
+
+        It only depends on the module hash, so that all processes publish a
+        module at the same place. The "tmp" prefix is the one of all module
+        directories.
+
+        """
+        return os.path.join(self.dirname, "tmp" + module_hash[1:])
+
+    def _load_published(self, module_hash):
+        """
+        Return the KeyData of the published module `module_hash`, or None.
+
+        The module is looked for in the directory given by the index, or
+        else in `_module_dir`. Modules older than `age_thresh_use` are
+        ignored.
+
+        """
+        name = self.module_index.get(module_hash)
+        if name is None:
+            module_dir = self._module_dir(module_hash)
+        else:
+            module_dir = os.path.join(self.dirname, name)
+        key_pkl = os.path.join(module_dir, "key.pkl")
+        try:
+            with open(key_pkl, "rb") as f:
+                key_data = pickle.load(f)
+        except Exception:
+            # Not published, or it uses Ops we can not import.
+            return None
+        if not isinstance(key_data, KeyData) or key_data.module_hash != module_hash:
+            return None
+        # The cache directory may have been moved since the module was
+        # published.
+        try:
+            entry = os.path.join(module_dir, os.path.basename(key_data.get_entry()))
+            if time.time() - last_access_time(entry) >= self.age_thresh_use:
+                return None
+        except (OSError, ValueError):
+            return None
+        key_data.entry = entry
+        key_data.key_pkl = key_pkl
+        return key_data
+
+    def _compile_module(self, module_hash, key, c_compiler, compile_args):
+        """
+        Compile and publish the versioned module `module_hash`.
+
+        This holds the lock of `module_hash` and not the compilation lock.
+        It is run in the threads of `compile_many`, so it must not modify
+        `self`.
+
+        Returns
+        -------
+        tuple
+            The KeyData of the module, and False if it was published by
+            another process instead of being compiled.
+
+        """
+        with self._lock_key(module_hash):
+            key_data = self._load_published(module_hash)
+            if key_data is not None:
+                return key_data, False
+
+            location, module_file = self._compile_staged(c_compiler, compile_args)
+            try:
+                key_data = self._publish(location, module_file, module_hash, key)
+            except BaseException:
+                _rmtree(location, ignore_if_missing=True, msg="failed publication")
                 raise
-            finally:
-                if not nocleanup:
-                    _rmtree(
-                        location,
-                        ignore_if_missing=True,
-                        msg="exception during compilation",
-                    )
+        return key_data, True
 
-            # Changing the hash of the key is not allowed during
-            # compilation.
-            assert hash(key) == hash_key
+    def _compile_staged(self, c_compiler, compile_args):
+        """
+        Compile a module in a new directory of ``staging``.
 
-            key_data = self._add_to_cache(module, key, module_hash)
-            self.module_hash_to_key_data[module_hash] = key_data
+        Returns
+        -------
+        tuple
+            The directory and the file name of the module.
 
-        self.stats[2] += 1
-        return module
+        """
+        staging = os.path.join(self.dirname, "staging")
+        os.makedirs(staging, exist_ok=True)
+        location = tempfile.mkdtemp(dir=staging)
+        try:
+            c_compiler.compile_str(location=location, py_module=False, **compile_args)
+            open(os.path.join(location, "__init__.py"), "w").close()
+            module_file = os.path.basename(module_name_from_dir(location))
+        except BaseException:
+            _rmtree(
+                location,
+                ignore_if_missing=True,
+                msg="exception during compilation",
+            )
+            raise
+        return location, module_file
+
+    def _new_module_dir(self):
+        """
+        Return a new module directory name, that is not used yet.
+
+        The directory itself is not created, modules are renamed into it.
+
+        """
+        module_dir = dlimport_workdir(self.dirname)
+        try:
+            os.rmdir(module_dir)
+        except FileNotFoundError:
+            # Removed by the cleanup of another process.
+            pass
+        return module_dir
+
+    def _publish(self, location, module_file, module_hash, key):
+        """
+        Write the key.pkl file of the module compiled in `location`, then
+        move it into the cache with an atomic rename, and index it.
+
+        """
+        module_dir = self._module_dir(module_hash)
+        if os.path.exists(module_dir):
+            # Something we can not use is published under this hash, e.g.
+            # a module whose Ops can not be imported here, or that is too old
+            # to be used. Fall back to a unique directory name, the index
+            # gives the last published directory.
+            module_dir = self._new_module_dir()
+        key_data = KeyData(
+            keys={key},
+            module_hash=module_hash,
+            key_pkl=os.path.join(module_dir, "key.pkl"),
+            entry=os.path.join(module_dir, module_file),
+        )
+        try:
+            key_data.save_pkl(os.path.join(location, "key.pkl"))
+        except pickle.PicklingError:
+            key_data.remove_key(key, save_pkl=False)
+            key_data.save_pkl(os.path.join(location, "key.pkl"))
+        os.rename(location, module_dir)
+        self._append_index([(module_hash, module_dir)])
+        return key_data
 
     def check_key(self, key, key_pkl):
         """
@@ -1318,14 +1772,19 @@ class ModuleCache:
     """
     The default age threshold for `clear_old` (in seconds).
 
+    """
+    cleanup_interval = 60 * 60 * 24  # 1 day
+    """
+    The minimal time (in seconds) between two cleanups started by
+    `start_cleanup`, in any process.
+
     """
 
     def clear_old(self, age_thresh_del=None, delete_if_problem=False):
         """Delete entries from the filesystem for cache entries that are too old.
 
-        This refreshes the content of the cache. Don't hold the lock
-        while calling this method, this is useless. It will be taken
-        if needed.
+        This walks the whole cache directory, see `cleanup_steps`. Don't
+        hold the lock while calling this method, this is useless.
 
         Parameters
         ----------
@@ -1334,14 +1793,13 @@ class ModuleCache:
             ``age_thresh_del`` seconds ago will be erased.
             Defaults to 31-day age if not provided.
         delete_if_problem
-            See help of refresh() method.
+            If True, also delete the modules whose KeyData file can not be
+            unpickled.
 
         """
         if age_thresh_del is None:
             age_thresh_del = self.age_thresh_del
 
-        # Ensure that the too_old_to_use list return by refresh() will
-        # contain all modules older than age_thresh_del.
         if age_thresh_del < self.age_thresh_use:
             if age_thresh_del > 0:
                 _logger.warning(
@@ -1353,37 +1811,193 @@ class ModuleCache:
                 )
             else:
                 _logger.info("Clearing all modules.")
-            age_thresh_use = age_thresh_del
-        else:
-            age_thresh_use = None
 
-        too_old_to_use = self.refresh(
-            age_thresh_use=age_thresh_use,
-            delete_if_problem=delete_if_problem,
-            # The clean up is done at init, no need to trigger it again
-            cleanup=False,
-        )
-        if not too_old_to_use:
+        for _ in self.cleanup_steps(age_thresh_del, delete_if_problem):
+            pass
+
+    def cleanup_steps(self, age_thresh_del=None, delete_if_problem=False):
+        """
+        Remove old and broken modules from the cache directory.
+
+        This is a generator that handles one directory at each step, so that
+        the cleanup can be spread over time. It removes:
+        - the directories marked with a delete.me file, and the empty ones,
+        - the modules whose module file is missing,
+        - the modules whose last access time is more than `age_thresh_del`
+          seconds ago,
+        - the unversioned modules and the compilations in ``staging`` left
+          by processes that crashed, after `age_thresh_del_unversioned`
+          seconds,
+        - if `delete_if_problem`, the modules whose KeyData file can not be
+          unpickled.
+
+        The modules known by this ModuleCache are never removed. Once the
+        whole directory was walked, the index is compacted.
+
+        Parameters
+        ----------
+        age_thresh_del
+            Defaults to `age_thresh_del`.
+        delete_if_problem : bool
+            See above.
+
+        """
+        if age_thresh_del is None:
+            age_thresh_del = self.age_thresh_del
+        # Copies, as this may run in another thread than the one that uses
+        # the cache.
+        with self._lock:
+            names = list(self.module_from_name)
+            key_datas = list(self.module_hash_to_key_data.values())
+        in_use = {os.path.dirname(name) for name in names}
+        in_use.update(os.path.dirname(key_data.get_entry()) for key_data in key_datas)
+        try:
+            names = sorted(os.listdir(self.dirname))
+        except OSError:
             return
-        with compilelock.lock_ctx():
-            # Update the age of modules that have been accessed by other
-            # processes and get all module that are too old to use
-            # (not loaded in self.entry_from_key).
-
-            for entry in too_old_to_use:
-                # TODO: we are assuming that modules that haven't been
-                # accessed in over age_thresh_del are not currently in
-                # use by other processes, but that could be false for
-                # long-running jobs, or if age_thresh_del < 0.
-                assert entry not in self.module_from_name
-                parent = os.path.dirname(entry)
-                assert parent.startswith(os.path.join(self.dirname, "tmp"))
+        for name in names:
+            path = os.path.join(self.dirname, name)
+            if name in ("lock_dir", "key_locks", "staging"):
+                continue
+            if path not in in_use and path != config.gpuarray.cache_path:
+                self._cleanup_dir(path, age_thresh_del, delete_if_problem)
+            yield
+
+        staging = os.path.join(self.dirname, "staging")
+        try:
+            names = sorted(os.listdir(staging))
+        except OSError:
+            names = []
+        for name in names:
+            path = os.path.join(staging, name)
+            try:
+                age = time.time() - last_access_time(path)
+            except OSError:
+                continue
+            if age > self.age_thresh_del_unversioned:
+                _rmtree(path, ignore_nocleanup=True, msg="old compilation")
+            yield
+
+        self._compact_index()
+
+    def _cleanup_dir(self, path, age_thresh_del, delete_if_problem):
+        """
+        Remove the cache directory `path` if needed, see `cleanup_steps`.
+
+        """
+        time_now = time.time()
+        try:
+            if not os.path.isdir(path):
+                return
+            files = os.listdir(path)
+            if not files:
+                # Leave some time to the process that created it to fill it.
+                if time_now - os.path.getmtime(path) > 60 * 60:
+                    _rmtree(path, ignore_nocleanup=True, msg="empty dir")
+                return
+            if "delete.me" in files:
+                _rmtree(path, ignore_nocleanup=True, msg="delete.me found in dir")
+                return
+            if not os.path.basename(path).startswith("tmp"):
+                return
+            try:
+                entry = module_name_from_dir(path, err=False, files=files)
+            except ValueError:
+                entry = None
+            if "key.pkl" not in files:
+                # In normal case, the process that created this unversioned
+                # module deletes it. If it crashed, we wait one week before
+                # taking care of the clean-up, as we do not know if it is
+                # still used.
+                age = time_now - last_access_time(entry or path)
+                if age > self.age_thresh_del_unversioned:
+                    _rmtree(
+                        path,
+                        ignore_nocleanup=True,
+                        msg="old unversioned",
+                        level=logging.INFO,
+                    )
+                return
+            if entry is None:
                 _rmtree(
-                    parent,
-                    msg="old cache directory",
+                    path,
+                    ignore_nocleanup=True,
+                    msg="missing module file",
                     level=logging.INFO,
+                )
+                return
+            if time_now - last_access_time(entry) > age_thresh_del:
+                _rmtree(
+                    path,
                     ignore_nocleanup=True,
+                    msg="old cache directory",
+                    level=logging.INFO,
                 )
+                return
+            if delete_if_problem:
+                try:
+                    with open(os.path.join(path, "key.pkl"), "rb") as f:
+                        broken = not isinstance(pickle.load(f), KeyData)
+                except Exception:
+                    broken = True
+                if broken:
+                    _rmtree(
+                        path,
+                        ignore_nocleanup=True,
+                        msg="broken cache directory",
+                        level=logging.INFO,
+                    )
+        except OSError:
+            # Removed by another process in the meantime.
+            pass
+
+    def start_cleanup(self):
+        """
+        Run `cleanup_steps` in a background thread, unless a process already
+        started it less than `cleanup_interval` seconds ago.
+
+        Returns
+        -------
+        threading.Thread or None
+            The thread doing the cleanup, if it was started.
+
+        """
+        stamp = os.path.join(self.dirname, "last_cleanup")
+
+        def due():
+            try:
+                return time.time() - os.path.getmtime(stamp) > self.cleanup_interval
+            except OSError:
+                return os.path.isdir(self.dirname)
+
+        if not due():
+            return None
+        if compilelock.fcntl is None:
+            # The global lock, used without fcntl, can not be taken from
+            # another thread. Do the cleanup at exit instead.
+            atexit.register(self.clear_old)
+            return None
+        with self._lock_key("last_cleanup"):
+            if not due():
+                return None
+            open(stamp, "a").close()
+            os.utime(stamp)
+        thread = threading.Thread(
+            target=self._cleanup_in_background, name="ModuleCache cleanup", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _cleanup_in_background(self):
+        try:
+            for i, _ in enumerate(self.cleanup_steps()):
+                # Leave the disk to the process.
+                if i % 100 == 99:
+                    time.sleep(0.1)
+        except Exception:
+            _logger.warning(
+                "Cleanup of the cache %s interrupted", self.dirname, exc_info=True
+            )
 
     def clear(
         self, unversioned_min_age=None, clear_base_files=False, delete_if_problem=False
@@ -1461,44 +2075,7 @@ class ModuleCache:
         if min_age is None:
             min_age = self.age_thresh_del_unversioned
 
-        # As this delete object that we build and other don't use, we
-        # don't need the lock.
-        all_key_datas = list(self.module_hash_to_key_data.values())
-        for key_data in all_key_datas:
-            if not key_data.keys:
-                # May happen for broken versioned keys.
-                continue
-            for key_idx, key in enumerate(key_data.keys):
-                version, rest = key
-                if version:
-                    # Since the version is included in the module hash,
-                    # it should not be possible to mix versioned and
-                    # unversioned keys in the same KeyData object.
-                    assert key_idx == 0
-                    break
-            if not version:
-                # Note that unversioned keys cannot be broken, so we can
-                # set do_manual_check to False to speed things up.
-                key_data.delete_keys_from(self.entry_from_key, do_manual_check=False)
-                entry = key_data.get_entry()
-                # Entry is guaranteed to be in this dictionary, because
-                # an unversioned entry should never have been loaded via
-                # refresh.
-                assert entry in self.module_from_name
-
-                del self.module_from_name[entry]
-                del self.module_hash_to_key_data[key_data.module_hash]
-
-                parent = os.path.dirname(entry)
-                assert parent.startswith(os.path.join(self.dirname, "tmp"))
-                _rmtree(
-                    parent, msg="unversioned", level=logging.INFO, ignore_nocleanup=True
-                )
-
-        # Sanity check: all unversioned keys should have been removed at
-        # this point.
-        for key in self.entry_from_key:
-            assert key[0]
+        self._clear_own_unversioned()
 
         to_del = []
         time_now = time.time()
@@ -1544,22 +2121,73 @@ class ModuleCache:
                     if age > min_age:
                         to_del.append(os.path.join(self.dirname, filename))
 
+        # Modules left in the staging directory by processes that crashed
+        # while compiling them.
+        staging = os.path.join(self.dirname, "staging")
+        if os.path.isdir(staging):
+            for filename in os.listdir(staging):
+                path = os.path.join(staging, filename)
+                try:
+                    age = time_now - last_access_time(path)
+                except OSError:
+                    continue
+                if age > min_age:
+                    to_del.append(path)
+
         # No need to take the lock as it isn't shared.
         for f in to_del:
             _rmtree(f, msg="old unversioned", level=logging.INFO, ignore_nocleanup=True)
 
-    def _on_atexit(self):
-        # Note: no need to call refresh() since it is called by clear_old().
+    def _clear_own_unversioned(self):
+        """
+        Delete the unversioned modules compiled by this process.
+
+        """
+        # As this delete object that we build and other don't use, we
+        # don't need the lock.
+        all_key_datas = list(self.module_hash_to_key_data.values())
+        for key_data in all_key_datas:
+            if not key_data.keys:
+                # May happen for broken versioned keys.
+                continue
+            for key_idx, key in enumerate(key_data.keys):
+                version, rest = key
+                if version:
+                    # Since the version is included in the module hash,
+                    # it should not be possible to mix versioned and
+                    # unversioned keys in the same KeyData object.
+                    assert key_idx == 0
+                    break
+            if not version:
+                # Note that unversioned keys cannot be broken, so we can
+                # set do_manual_check to False to speed things up.
+                key_data.delete_keys_from(self.entry_from_key, do_manual_check=False)
+                entry = key_data.get_entry()
+                # Entry is guaranteed to be in this dictionary, because
+                # an unversioned entry should never have been loaded via
+                # refresh.
+                assert entry in self.module_from_name
 
-        # Note: no need to take the lock. For unversioned files, we
-        # don't need it as they aren't shared. For old unversioned
-        # files, this happen rarely, so we take the lock only when
-        # this happen.
+                with self._lock:
+                    del self.module_from_name[entry]
+                    del self.module_hash_to_key_data[key_data.module_hash]
 
-        # Note: for clear_old(), as this happen unfrequently, we only
-        # take the lock when it happen.
-        self.clear_old()
-        self.clear_unversioned()
+                parent = os.path.dirname(entry)
+                assert parent.startswith(os.path.join(self.dirname, "tmp"))
+                _rmtree(
+                    parent, msg="unversioned", level=logging.INFO, ignore_nocleanup=True
+                )
+
+        # Sanity check: all unversioned keys should have been removed at
+        # this point.
+        for key in self.entry_from_key:
+            assert key[0]
+
+    def _on_atexit(self):
+        # Note: no need to take the lock. Unversioned modules aren't
+        # shared. Old modules, and unversioned modules left by processes
+        # that crashed, are removed by `start_cleanup`.
+        self._clear_own_unversioned()
         _logger.debug("Time spent checking keys: %s", self.time_spent_in_check_key)
 
 
@@ -1629,6 +2257,7 @@ def get_module_cache(dirname, init_args=None):
     if _module_cache is None:
         _module_cache = ModuleCache(dirname, **init_args)
         atexit.register(_module_cache._on_atexit)
+        _module_cache.start_cleanup()
     elif init_args:
         _logger.warning(
             "Ignoring init arguments for module cache because it "
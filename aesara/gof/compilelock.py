@@ -1,6 +1,11 @@
 """
 Locking mechanism to ensure no two compilations occur simultaneously
 in the same compilation directory (which can cause crashes).
+
+`lock_ctx` locks the whole compilation directory. The C modules of
+`aesara.gof.cmodule.ModuleCache` are instead compiled under `lock_key`,
+a lock per module, so that different modules can be compiled at the same
+time.
 """
 import atexit
 import logging
@@ -14,6 +19,13 @@ import numpy as np
 from aesara import config
 
 
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+
+
 random = np.random.RandomState([2015, 8, 2])
 
 _logger = logging.getLogger("aesara.gof.compilelock")
@@ -42,6 +54,46 @@ def lock_ctx(lock_dir=None, keep_lock=False, **kw):
         release_lock()
 
 
+@contextmanager
+def lock_key(name, lock_dir=None):
+    """
+    Hold a lock specific to `name` (usually the hash of a module).
+
+    Contrary to `lock_ctx`, this lock only excludes the processes and threads
+    that want the same `name`. It relies on ``fcntl.flock``: waiting for it
+    does not poll, and it is released by the operating system if its owner
+    dies, so there is no timeout. Without ``fcntl`` (on Windows), the global
+    lock of `lock_ctx` is used instead.
+
+    Parameters
+    ----------
+    name : str
+        The name of the lock file.
+    lock_dir : str
+        The directory of the lock files. Defaults to the ``key_locks``
+        directory of the compiledir.
+
+    """
+    if fcntl is None:
+        with lock_ctx():
+            yield
+        return
+    if lock_dir is None:
+        lock_dir = os.path.join(config.compiledir, "key_locks")
+    os.makedirs(lock_dir, exist_ok=True)
+    # The lock files are never deleted, as another process may be waiting
+    # for them.
+    with open(os.path.join(lock_dir, name), "a") as lock_file:
+        use_lock = getattr(get_lock, "lock_is_enabled", True)
+        if use_lock:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if use_lock:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
 # We define this name with an underscore so that python shutdown
 # deletes this before non-underscore names (like os).  We need to do
 # it this way to avoid errors on shutdown.
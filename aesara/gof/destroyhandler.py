@@ -4,6 +4,7 @@ and inplace operations.
 
 """
 import itertools
+from bisect import bisect_left, bisect_right
 from collections import OrderedDict, deque
 
 import aesara
@@ -175,6 +176,214 @@ def _contains_cycle(fgraph, orderings):
     return visited != len(parent_counts)
 
 
+class _TopologicalOrder:
+    """
+    A topological order of the Apply nodes of a FunctionGraph, updated
+    incrementally as the graph changes.
+
+    This implements the dynamic topological sort of Pearce and Kelly
+    ("A Dynamic Topological Sort Algorithm for Directed Acyclic Graphs",
+    2006). Every node has a position, and an edge ``u -> v`` (``v`` uses an
+    output of ``u``, or ``u`` is in the orderings of ``v``) is respected
+    when ``pos[u] < pos[v]``. A new node is placed right after its inputs.
+    When a new edge is not respected, only the nodes whose position lies
+    between ``pos[v]`` and ``pos[u]`` are visited, to either move them or
+    find a cycle. This replaces a traversal of the whole graph for each
+    validation of the DestroyHandler.
+
+    Edges that may not be respected are kept in `pending` until a
+    validation either respects them, or sees that they were removed from
+    the graph. An edge that closes a cycle stays pending, so that the order
+    remains valid for all the other edges when the optimizer reverts the
+    change.
+
+    """
+
+    def __init__(self):
+        self.valid = False
+        self.pos = {}
+        self.sorted_pos = []
+        self.pending = set()
+        self.ords = {}
+
+    def invalidate(self):
+        self.valid = False
+        self.pos = {}
+        self.sorted_pos = []
+        self.pending = set()
+        self.ords = {}
+
+    def rebuild(self, fgraph, ords):
+        """
+        Compute the order from scratch. Return False if the graph
+        contains a cycle.
+
+        """
+        self.invalidate()
+        n_parents = {}
+        children = {}
+        ready = []
+        for app in fgraph.apply_nodes:
+            parents = {i.owner for i in app.inputs if i.owner is not None}
+            parents.update(ords.get(app, ()))
+            n_parents[app] = len(parents)
+            for parent in parents:
+                children.setdefault(parent, []).append(app)
+            if not parents:
+                ready.append(app)
+        order = []
+        while ready:
+            app = ready.pop()
+            order.append(app)
+            for child in children.get(app, ()):
+                n_parents[child] -= 1
+                if not n_parents[child]:
+                    ready.append(child)
+        if len(order) != len(n_parents):
+            return False
+        self.pos = {app: float(i) for i, app in enumerate(order)}
+        self.sorted_pos = [float(i) for i in range(len(order))]
+        self.ords = ords
+        self.valid = True
+        return True
+
+    def renumber(self):
+        order = sorted(self.pos, key=self.pos.__getitem__)
+        self.pos = {app: float(i) for i, app in enumerate(order)}
+        self.sorted_pos = [float(i) for i in range(len(order))]
+
+    def add_node(self, app):
+        """Place a newly imported node right after its inputs."""
+        pos = self.pos
+        while True:
+            try:
+                parents = [pos[i.owner] for i in app.inputs if i.owner is not None]
+            except KeyError:
+                # The inputs were imported before the order was built.
+                self.invalidate()
+                return
+            if parents:
+                lo = max(parents)
+                idx = bisect_right(self.sorted_pos, lo)
+                if idx < len(self.sorted_pos):
+                    new = (lo + self.sorted_pos[idx]) / 2
+                    if not lo < new < self.sorted_pos[idx]:
+                        # No float left between the two positions.
+                        self.renumber()
+                        continue
+                else:
+                    new = lo + 1.0
+            else:
+                idx = 0
+                new = self.sorted_pos[0] - 1.0 if self.sorted_pos else 0.0
+            break
+        pos[app] = new
+        self.sorted_pos.insert(idx, new)
+
+    def remove_node(self, app):
+        p = self.pos.pop(app)
+        del self.sorted_pos[bisect_left(self.sorted_pos, p)]
+
+    def check(self, fgraph, ords):
+        """
+        Update the order after the changes of the graph and of its
+        orderings. Return True if the graph contains a cycle.
+
+        """
+        if not self.valid:
+            return not self.rebuild(fgraph, ords)
+
+        pending = self.pending
+        old_ords = self.ords
+        for app, prereqs in ords.items():
+            old = old_ords.get(app, ())
+            for prereq in prereqs:
+                if prereq not in old:
+                    pending.add((prereq, app))
+        self.ords = ords
+        if not pending:
+            return False
+
+        pos = self.pos
+        ord_clients = None
+        cycle = False
+        for edge in list(pending):
+            u, v = edge
+            if (
+                u not in pos
+                or v not in pos
+                or not (u in ords.get(v, ()) or any(i.owner is u for i in v.inputs))
+            ):
+                # The edge was removed from the graph.
+                pending.discard(edge)
+                continue
+            if pos[u] < pos[v]:
+                pending.discard(edge)
+                continue
+            if ord_clients is None:
+                ord_clients = {}
+                for app, prereqs in ords.items():
+                    for prereq in prereqs:
+                        ord_clients.setdefault(prereq, []).append(app)
+            if self._reorder(u, v, ords, ord_clients):
+                pending.discard(edge)
+            else:
+                cycle = True
+        return cycle
+
+    def _reorder(self, u, v, ords, ord_clients):
+        """
+        Move the nodes between `v` and `u` so that ``pos[u] < pos[v]``.
+        Return False, without changing the order, if `v` reaches `u`.
+
+        """
+        pos = self.pos
+        lower = pos[v]
+        upper = pos[u]
+
+        # Nodes reachable from v that are placed before u.
+        forward = [v]
+        seen = {v}
+        stack = [v]
+        while stack:
+            node = stack.pop()
+            clients = [
+                client
+                for out in node.outputs
+                for client, _ in out.clients
+                if client != "output"
+            ]
+            clients.extend(ord_clients.get(node, ()))
+            for client in clients:
+                if client is u:
+                    return False
+                if client not in seen and pos[client] < upper:
+                    seen.add(client)
+                    forward.append(client)
+                    stack.append(client)
+
+        # Nodes that reach u and are placed after v.
+        backward = [u]
+        seen = {u}
+        stack = [u]
+        while stack:
+            node = stack.pop()
+            parents = [i.owner for i in node.inputs if i.owner is not None]
+            parents.extend(ords.get(node, ()))
+            for parent in parents:
+                if parent not in seen and pos[parent] > lower:
+                    seen.add(parent)
+                    backward.append(parent)
+                    stack.append(parent)
+
+        backward.sort(key=pos.__getitem__)
+        forward.sort(key=pos.__getitem__)
+        nodes = backward + forward
+        for node, p in zip(nodes, sorted(pos[node] for node in nodes)):
+            pos[node] = p
+        return True
+
+
 def _build_droot_impact(destroy_handler):
     droot = {}  # destroyed view + nonview variables -> foundation
     impact = {}  # destroyed nonview variable -> it + all views of it
@@ -287,7 +496,7 @@ class DestroyHandler(toolbox.Bookkeeper):  # noqa
 
     It is a work in progress. The following data structures have been
     converted to use the incremental strategy:
-        <none>
+        the topological order used to detect cycles (see _TopologicalOrder)
 
     The following data structures remain to be converted:
         <unknown>
@@ -383,6 +592,9 @@ class DestroyHandler(toolbox.Bookkeeper):  # noqa
         # clients: how many times does an apply use a given variable
         self.clients = OrderedDict()  # variable -> apply -> ninputs
         self.stale_droot = True
+        # Topological order used by validate() to detect cycles. It is only
+        # built by the first validation with the "regular" algorithm.
+        self.order = _TopologicalOrder()
 
         self.debug_all_apps = set()
         if self.do_imports_on_attach:
@@ -452,6 +664,7 @@ class DestroyHandler(toolbox.Bookkeeper):  # noqa
         del self.view_o
         del self.clients
         del self.stale_droot
+        del self.order
         assert self.fgraph.destroyer_handler is self
         delattr(self.fgraph, "destroyers")
         delattr(self.fgraph, "has_destroyers")
@@ -546,6 +759,9 @@ class DestroyHandler(toolbox.Bookkeeper):  # noqa
         for i, output in enumerate(app.outputs):
             self.clients.setdefault(output, OrderedDict())
 
+        if self.order.valid:
+            self.order.add_node(app)
+
         self.stale_droot = True
 
     def on_prune(self, fgraph, app, reason):
@@ -582,6 +798,9 @@ class DestroyHandler(toolbox.Bookkeeper):  # noqa
             if not self.view_o[i]:
                 del self.view_o[i]
 
+        if self.order.valid:
+            self.order.remove_node(app)
+
         self.stale_droot = True
         if app in self.fail_validate:
             del self.fail_validate[app]
@@ -626,6 +845,9 @@ class DestroyHandler(toolbox.Bookkeeper):  # noqa
 
                     self.view_o.setdefault(new_r, OrderedSet()).add(output)
 
+            if self.order.valid and new_r.owner is not None:
+                self.order.pending.add((new_r.owner, app))
+
             if self.algo == "fast":
                 if app in self.fail_validate:
                     del self.fail_validate[app]
@@ -661,7 +883,7 @@ class DestroyHandler(toolbox.Bookkeeper):  # noqa
                         raise app_err_pairs[app]
             else:
                 ords = self.orderings(fgraph, ordered=False)
-                if _contains_cycle(fgraph, ords):
+                if self.order.check(fgraph, ords):
                     raise InconsistencyError("Dependency graph contains cycles")
         else:
             # James's Conjecture:
@@ -139,6 +139,10 @@ class FunctionGraph(utils.object2):
         # outputs even if they aren't used in the graph.
         self.variables = set()
 
+        # The last result of toposort(), dropped on every change of the
+        # graph or of its features.
+        self._toposort_cache = None
+
         self.inputs = list(inputs)
         self.outputs = outputs
 
@@ -170,6 +174,7 @@ class FunctionGraph(utils.object2):
             self.inputs.append(input)
             self.__setup_r__(input)
             self.variables.add(input)
+            self._toposort_cache = None
 
     def __setup_r__(self, r):
         if hasattr(r, "fgraph") and r.fgraph is not None and r.fgraph is not self:
@@ -221,6 +226,7 @@ class FunctionGraph(utils.object2):
             del variable.clients
         self.apply_nodes = set()
         self.variables = set()
+        self._toposort_cache = None
         self.inputs = None
         self.outputs = None
         self.profile = None
@@ -302,6 +308,7 @@ class FunctionGraph(utils.object2):
                         apply_node.tag.removed_by = []
                     apply_node.tag.removed_by.append(str(reason))
                     self.apply_nodes.remove(apply_node)
+                    self._toposort_cache = None
                     # del apply_node.fgraph
                     self.variables.difference_update(apply_node.outputs)
                     # for var in apply_node.outputs:
@@ -346,13 +353,29 @@ class FunctionGraph(utils.object2):
         Given an apply_node, recursively search from this node to know graph,
         and then add all unknown variables and apply_nodes to this graph.
         """
-        node = apply_node
-
         # We import the nodes in topological order. We only are interested
-        # in new nodes, so we use all variables we know of as if they were the input set.
-        # (the functions in the graph module only use the input set to
-        # know where to stop going down)
-        new_nodes = graph.io_toposort(self.variables, apply_node.outputs)
+        # in new nodes, so we use all variables we know of as if they were
+        # the input set. This is the traversal of graph.io_toposort, without
+        # copying self.variables, which would make each import O(graph).
+        variables = self.variables
+        computed = set()
+        new_nodes = []
+        todo = [apply_node]
+        while todo:
+            node = todo.pop()
+            if node.outputs[0] in computed:
+                continue
+            missing = [
+                i.owner
+                for i in node.inputs
+                if i.owner is not None and i not in variables and i not in computed
+            ]
+            if missing:
+                todo.append(node)
+                todo.extend(missing)
+            else:
+                new_nodes.append(node)
+                computed.update(node.outputs)
 
         if check:
             for node in new_nodes:
@@ -377,6 +400,8 @@ class FunctionGraph(utils.object2):
                         )
                         raise MissingInputError(error_msg, variable=r)
 
+        if new_nodes:
+            self._toposort_cache = None
         for node in new_nodes:
             assert node not in self.apply_nodes
             self.__setup_node__(node)
@@ -437,6 +462,7 @@ class FunctionGraph(utils.object2):
         if r is new_r:
             return
 
+        self._toposort_cache = None
         self.__import_r__(new_r, reason=reason)
         self.__add_client__(new_r, (node, i))
         self.__remove_client__(r, (node, i), reason=reason)
@@ -569,6 +595,7 @@ class FunctionGraph(utils.object2):
 
         # Add the feature
         self._features.append(feature)
+        self._toposort_cache = None
 
     def remove_feature(self, feature):
         """
@@ -583,6 +610,7 @@ class FunctionGraph(utils.object2):
             self._features.remove(feature)
         except ValueError:
             return
+        self._toposort_cache = None
         detach = getattr(feature, "on_detach", None)
         if detach is not None:
             detach(self)
@@ -639,6 +667,9 @@ class FunctionGraph(utils.object2):
         this FunctionGraph as sole argument. It should return a dictionary of
         `{node: predecessors}` where predecessors is a list of nodes that
         should be computed before the key node.
+
+        The order is cached until the graph or its features change, so
+        calling this repeatedly on an unchanged graph is cheap.
         """
         if len(self.apply_nodes) < 2:
             # optimization
@@ -646,13 +677,22 @@ class FunctionGraph(utils.object2):
             # This special case happens a lot because the OpWiseCLinker
             # produces 1-element graphs.
             return list(self.apply_nodes)
+        cache = self._toposort_cache
+        if (
+            cache is not None
+            and cache[0] is self.inputs
+            and cache[1] is self.outputs
+            and len(cache[2]) == len(self.apply_nodes)
+        ):
+            return list(cache[2])
         fg = self
 
         ords = self.orderings()
 
         order = graph.io_toposort(fg.inputs, fg.outputs, ords)
+        self._toposort_cache = (self.inputs, self.outputs, order)
 
-        return order
+        return list(order)
 
     def orderings(self):
         """
@@ -826,11 +866,13 @@ class FunctionGraph(utils.object2):
         # be pickled as the decorators with parameters aren't pickable.
         if "execute_callbacks_times" in d:
             del d["execute_callbacks_times"]
+        d["_toposort_cache"] = None
 
         return d
 
     def __setstate__(self, dct):
         self.__dict__.update(dct)
+        self.__dict__.setdefault("_toposort_cache", None)
         for feature in self._features:
             if hasattr(feature, "unpickle"):
                 feature.unpickle(self)
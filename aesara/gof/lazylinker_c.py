@@ -14,7 +14,7 @@ from aesara.gof.compilelock import get_lock, release_lock
 _logger = logging.getLogger("aesara.gof.lazylinker_c")
 
 force_compile = False
-version = 0.211  # must match constant returned in function get_version()
+version = 0.212  # must match constant returned in function get_version()
 lazylinker_ext = None
 
 
@@ -849,13 +849,16 @@ class Op(object2, PureOp, CLinkerOp):
         node_input_storage = [storage_map[r] for r in node.inputs]
         node_output_storage = [storage_map[r] for r in node.outputs]
 
-        e = FunctionGraph(node.inputs, node.outputs)
-        e_no_recycling = [
-            new_o
-            for (new_o, old_o) in zip(e.outputs, node.outputs)
-            if old_o in no_recycling
-        ]
-        cl = aesara.gof.cc.CLinker().accept(e, no_recycling=e_no_recycling)
+        # Reuse the linker built by `compile_c_modules`, if any.
+        cl = aesara.gof.cc.prepared_linker(node, no_recycling)
+        if cl is None:
+            e = FunctionGraph(node.inputs, node.outputs)
+            e_no_recycling = [
+                new_o
+                for (new_o, old_o) in zip(e.outputs, node.outputs)
+                if old_o in no_recycling
+            ]
+            cl = aesara.gof.cc.CLinker().accept(e, no_recycling=e_no_recycling)
         # float16 gets special treatment since running
         # unprepared C code will get bad results.
         if not getattr(self, "_f16_ok", False):
@@ -1146,6 +1149,15 @@ class OpenMPOp(Op):
 
     """
 
+    num_threads = None
+    """
+    The number of threads of the parallel loops of this op, or None to use
+    the `openmp_num_threads` flag. It is set when the thunk runs and is not
+    part of the C code, so it is not compared by __eq__: set it on the op
+    of a node before compiling the function.
+
+    """
+
     def __init__(self, openmp=None):
         if openmp is None:
             openmp = aesara.config.openmp
@@ -1223,6 +1235,34 @@ int main( int argc, const char* argv[] )
         if impl == "c":
             self.update_self_openmp()
 
+    def make_c_thunk(self, node, storage_map, compute_map, no_recycling):
+        """
+        Like Op.make_c_thunk, but run the thunk with the thread budget of
+        this op, if it has one.
+
+        """
+        rval = super().make_c_thunk(node, storage_map, compute_map, no_recycling)
+        n_threads = self.num_threads or aesara.config.openmp_num_threads
+        if not self.openmp or not n_threads:
+            return rval
+        from aesara.gof.openmp import set_num_threads
+
+        def budget_rval():
+            prev = set_num_threads(n_threads)
+            try:
+                rval()
+            finally:
+                if prev is not None:
+                    set_num_threads(prev)
+
+        # Without the cthunk attribute, the CVM calls the thunk through
+        # Python, so the budget is applied.
+        budget_rval.thunk = rval.thunk
+        budget_rval.inputs = rval.inputs
+        budget_rval.outputs = rval.outputs
+        budget_rval.lazy = False
+        return budget_rval
+
 
 def simple_meth(tag):
     def f(self):
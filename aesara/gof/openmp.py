@@ -0,0 +1,262 @@
+"""
+Control at runtime the number of threads used by OpenMP and BLAS.
+
+The C code of the ops inheriting from `OpenMPOp` runs its parallel loops
+with the number of threads of the OpenMP runtime, which is process-wide
+by default (``OMP_NUM_THREADS``). The functions here change it while the
+process runs, through the OpenMP runtime and the BLAS library that Aesara
+links with (see the ``blas.ldflags`` flag), so that functions run
+concurrently in several Python threads don't oversubscribe the cores.
+
+The OpenMP thread count is a per-thread setting: calling
+`set_num_threads` or entering `num_threads` in a Python thread only
+changes the parallel regions started from that thread. The BLAS thread
+count is global to the process.
+
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import re
+import time
+from contextlib import contextmanager
+
+from aesara import config
+from aesara.configparser import change_flags
+
+
+_logger = logging.getLogger("aesara.gof.openmp")
+
+# The names of the OpenMP runtimes of GCC, Intel and LLVM.
+OMP_LIB_NAMES = ["gomp", "iomp5", "omp"]
+
+# For each BLAS library, the functions setting and getting its number of
+# threads.
+BLAS_THREAD_FUNCTIONS = [
+    ("openblas_set_num_threads", "openblas_get_num_threads"),
+    ("MKL_Set_Num_Threads", "MKL_Get_Max_Threads"),
+    ("bli_thread_set_num_threads", "bli_thread_get_num_threads"),
+]
+
+
+def _load_lib(name):
+    lib_name = ctypes.util.find_library(name)
+    if lib_name is None:
+        return None
+    try:
+        return ctypes.cdll.LoadLibrary(lib_name)
+    except OSError:
+        return None
+
+
+def _omp_lib():
+    """Return the OpenMP runtime, or None if it can't be loaded."""
+    if _omp_lib.handle is False:
+        _omp_lib.handle = None
+        for name in OMP_LIB_NAMES:
+            lib = _load_lib(name)
+            if lib is not None and hasattr(lib, "omp_set_num_threads"):
+                _omp_lib.handle = lib
+                break
+        else:
+            _logger.debug("Could not load an OpenMP runtime")
+    return _omp_lib.handle
+
+
+_omp_lib.handle = False
+
+
+def _blas_funcs():
+    """
+    Return the functions setting and getting the number of threads of the
+    BLAS library, or None if it isn't known or can't be loaded.
+
+    """
+    if _blas_funcs.funcs is False:
+        _blas_funcs.funcs = None
+        names = re.findall(r"-l(\S+)", config.blas.ldflags)
+        for name in names:
+            lib = _load_lib(name)
+            if lib is None:
+                continue
+            for set_name, get_name in BLAS_THREAD_FUNCTIONS:
+                if hasattr(lib, set_name) and hasattr(lib, get_name):
+                    set_fn = getattr(lib, set_name)
+                    get_fn = getattr(lib, get_name)
+                    get_fn.restype = ctypes.c_int
+                    _blas_funcs.funcs = (set_fn, get_fn)
+                    return _blas_funcs.funcs
+        _logger.debug("Could not control the threads of BLAS (%s)", names)
+    return _blas_funcs.funcs
+
+
+_blas_funcs.funcs = False
+
+
+def get_num_threads():
+    """
+    Return the maximum number of threads of the next OpenMP parallel
+    regions started from this thread, or None if the OpenMP runtime can't
+    be loaded.
+
+    """
+    lib = _omp_lib()
+    if lib is None:
+        return None
+    return lib.omp_get_max_threads()
+
+
+def set_num_threads(n):
+    """
+    Set the number of threads of the next OpenMP parallel regions started
+    from this thread.
+
+    Returns
+    -------
+    int or None
+        The previous number of threads, or None if the OpenMP runtime can't
+        be loaded, in which case nothing is changed.
+
+    """
+    lib = _omp_lib()
+    if lib is None:
+        return None
+    prev = lib.omp_get_max_threads()
+    lib.omp_set_num_threads(int(n))
+    return prev
+
+
+def get_blas_num_threads():
+    """
+    Return the number of threads used by BLAS, or None if it isn't known.
+
+    """
+    funcs = _blas_funcs()
+    if funcs is None:
+        return None
+    return funcs[1]()
+
+
+def set_blas_num_threads(n):
+    """
+    Set the number of threads used by BLAS, in the whole process.
+
+    Returns
+    -------
+    int or None
+        The previous number of threads, or None if the threads of the BLAS
+        library can't be controlled, in which case nothing is changed.
+
+    """
+    funcs = _blas_funcs()
+    if funcs is None:
+        return None
+    prev = funcs[1]()
+    funcs[0](int(n))
+    return prev
+
+
+@contextmanager
+def num_threads(n, blas=True):
+    """
+    Run the block with `n` OpenMP threads, and `n` BLAS threads if `blas`.
+
+    This gives a thread budget to the Aesara functions called in the
+    block. For instance, to call two functions concurrently on a 4 cores
+    machine::
+
+        def run(f, x):
+            with num_threads(2):
+                return f(x)
+
+    The previous numbers of threads are restored when leaving the block.
+
+    """
+    prev = set_num_threads(n)
+    prev_blas = set_blas_num_threads(n) if blas else None
+    try:
+        yield
+    finally:
+        if prev is not None:
+            set_num_threads(prev)
+        if prev_blas is not None:
+            set_blas_num_threads(prev_blas)
+
+
+def calibrate_elemwise_minsize(sizes=None, n_calls=10, apply=True):
+    """
+    Measure the smallest size for which OpenMP speeds up elemwise ops.
+
+    This times a cheap elemwise operation compiled with and without OpenMP,
+    with the number of threads of the OpenMP runtime, on vectors of
+    increasing sizes. The threshold is the smallest size from which OpenMP
+    is faster for all the larger sizes measured.
+
+    Parameters
+    ----------
+    sizes
+        The sizes measured, in increasing order. By default, the powers of
+        2 from 2**10 to 2**22.
+    n_calls
+        The number of calls of each function; the fastest one is kept.
+    apply
+        If True, set the ``openmp_elemwise_minsize`` flag to the result.
+        The elemwise ops compiled after that use it.
+
+    Returns
+    -------
+    int or None
+        The threshold, or None if OpenMP was never faster, or isn't
+        supported by the compiler.
+
+    """
+    import numpy as np
+
+    import aesara
+    from aesara.gof.op import OpenMPOp
+
+    if sizes is None:
+        sizes = [2 ** i for i in range(10, 23)]
+    if not OpenMPOp.test_gxx_support():
+        _logger.warning("The compiler doesn't support OpenMP")
+        return None
+
+    s = aesara.scalar.float64()
+    cheap = aesara.scalar.Composite([s], [s * 2 + 1])
+    fns = []
+    for openmp in (False, True):
+        with change_flags(openmp_elemwise_minsize=0):
+            x = aesara.tensor.dvector("x")
+            op = aesara.tensor.Elemwise(cheap, openmp=openmp)
+            fns.append(aesara.function([x], op(x)))
+
+    faster = []
+    for size in sizes:
+        value = np.ones(size)
+        timings = []
+        for fn in fns:
+            fn(value)
+            best = None
+            for _ in range(n_calls):
+                t0 = time.perf_counter()
+                fn(value)
+                t = time.perf_counter() - t0
+                if best is None or t < best:
+                    best = t
+            timings.append(best)
+        _logger.debug(
+            "size %d: %.3gs without OpenMP, %.3gs with OpenMP", size, *timings
+        )
+        faster.append(timings[1] < timings[0])
+
+    minsize = None
+    for size, is_faster in reversed(list(zip(sizes, faster))):
+        if not is_faster:
+            break
+        minsize = size
+    if minsize is not None and apply:
+        config.openmp_elemwise_minsize = minsize
+    if minsize is None:
+        _logger.info("OpenMP did not speed up elemwise ops up to size %d", sizes[-1])
+    return minsize
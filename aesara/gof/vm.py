@@ -5,7 +5,9 @@ A VM is not actually different from a Linker, we just decided
 VM was a better name at some point.
 
 """
+import concurrent.futures
 import logging
+import os
 import platform
 import sys
 import time
@@ -120,6 +122,88 @@ def calculate_reallocate_info(order, fgraph, storage_map, compute_map_re, depend
     return reallocated_info
 
 
+def calculate_memory_plan(order, fgraph):
+    """
+    Statically assign the intermediate results of a graph to shared buffers.
+
+    The intermediate results are walked in `order`. Once a variable is dead
+    (its last client has run), its buffer is released into a pool, and a
+    later variable of the same type and, when the graph has a
+    `ShapeFeature`, the same symbolic shape, takes it over instead of
+    asking for a new allocation. The last variable of each buffer hands it
+    back to the first one, so the buffers also survive across calls.
+
+    Only variables that are neither outputs of the graph, nor views of or
+    destroyed by another variable, take part in the plan, as only those
+    can have their memory reused by an unrelated Op without side effects.
+
+    Parameters
+    ----------
+    order
+        The list of Apply nodes in execution order.
+    fgraph
+        The FunctionGraph the nodes come from.
+
+    Returns
+    -------
+    list of lists
+        One list of variables per buffer, in the order in which they use it.
+
+    """
+    shape_of = getattr(getattr(fgraph, "shape_feature", None), "shape_of", {})
+    outputs = set(fgraph.outputs)
+
+    # Variables that are viewed or destroyed by another one, or that are
+    # themselves a view or destroyed version of another one.
+    aliased = set()
+    last_use = {}
+    for idx, node in enumerate(order):
+        for imap in (
+            getattr(node.op, "destroy_map", {}),
+            getattr(node.op, "view_map", {}),
+        ):
+            for o, ins in imap.items():
+                aliased.add(node.outputs[o])
+                aliased.update(node.inputs[i] for i in ins)
+        for inp in node.inputs:
+            last_use[inp] = idx
+
+    def shape_key(var):
+        shape = shape_of.get(var)
+        if shape is None:
+            return None
+        return tuple(
+            int(s.data) if isinstance(s, aesara.gof.Constant) else s for s in shape
+        )
+
+    keys = {}
+    slot_of = {}
+    slots = []
+    pool = defaultdict(list)
+    for idx, node in enumerate(order):
+        for out in node.outputs:
+            if (
+                out in outputs
+                or out in aliased
+                or out not in last_use
+                or getattr(out.type, "ndim", None) is None
+                or getattr(out.type, "dtype", None) is None
+            ):
+                continue
+            keys[out] = key = (out.type, shape_key(out))
+            if pool[key]:
+                slot = pool[key].pop()
+                slot.append(out)
+            else:
+                slot = [out]
+                slots.append(slot)
+            slot_of[out] = slot
+        for inp in set(node.inputs):
+            if inp in slot_of and last_use[inp] == idx:
+                pool[keys[inp]].append(slot_of[inp])
+    return slots
+
+
 class VM:
     """
     A VM object's __call__ method evaluates a Aesara program.
@@ -232,35 +316,64 @@ class VM:
             self.call_counts[i] = 0
 
 
+def _transfer_buffers(transfers):
+    """Move the buffers of dead variables to the variables that reuse them."""
+    for src, dst in transfers:
+        dst[0] = src[0]
+        src[0] = None
+
+
 class Loop(VM):
     """
     Unconditional start-to-finish program execution in Python.
     No garbage collection is allowed on intermediate results.
 
+    Parameters
+    ----------
+    post_thunk_transfer
+        Optional list, one per node, of (source, destination) storage pairs.
+        After each thunk, the values of the sources are moved to the
+        destinations. This implements the plan of `calculate_memory_plan`.
+
     """
 
     # Some other part of Aesara query that information
     allow_gc = False
 
+    def __init__(self, nodes, thunks, pre_call_clear, post_thunk_transfer=None):
+        super().__init__(nodes, thunks, pre_call_clear)
+        if post_thunk_transfer is None:
+            post_thunk_transfer = [[] for _ in nodes]
+        if len(post_thunk_transfer) != len(nodes):
+            raise ValueError()
+        self.post_thunk_transfer = post_thunk_transfer
+
     def __call__(self):
         if self.time_thunks:
             for cont in self.pre_call_clear:
                 cont[0] = None
             try:
-                for i, (thunk, node) in enumerate(zip(self.thunks, self.nodes)):
+                for i, (thunk, node, transfers) in enumerate(
+                    zip(self.thunks, self.nodes, self.post_thunk_transfer)
+                ):
                     t0 = time.time()
                     thunk()
                     t1 = time.time()
                     self.call_counts[i] += 1
                     self.call_times[i] += t1 - t0
+                    _transfer_buffers(transfers)
             except Exception:
                 link.raise_with_op(node, thunk)
         else:
             for cont in self.pre_call_clear:
                 cont[0] = None
             try:
-                for thunk, node in zip(self.thunks, self.nodes):
+                for thunk, node, transfers in zip(
+                    self.thunks, self.nodes, self.post_thunk_transfer
+                ):
                     thunk()
+                    if transfers:
+                        _transfer_buffers(transfers)
             except Exception:
                 link.raise_with_op(node, thunk)
 
@@ -270,14 +383,34 @@ class LoopGC(VM):
     Unconditional start-to-finish program execution in Python.
     Garbage collection is possible on intermediate results.
 
+    Parameters
+    ----------
+    post_thunk_transfer
+        See `Loop`.
+
     """
 
-    def __init__(self, nodes, thunks, pre_call_clear, post_thunk_clear):
+    def __init__(
+        self,
+        nodes,
+        thunks,
+        pre_call_clear,
+        post_thunk_clear,
+        post_thunk_transfer=None,
+    ):
         super().__init__(nodes, thunks, pre_call_clear)
         self.post_thunk_clear = post_thunk_clear
+        if post_thunk_transfer is None:
+            post_thunk_transfer = [[] for _ in nodes]
+        self.post_thunk_transfer = post_thunk_transfer
         # Some other part of Aesara query that information
         self.allow_gc = True
-        if not (len(nodes) == len(thunks) == len(post_thunk_clear)):
+        if not (
+            len(nodes)
+            == len(thunks)
+            == len(post_thunk_clear)
+            == len(post_thunk_transfer)
+        ):
             raise ValueError()
 
     def __call__(self):
@@ -286,8 +419,11 @@ class LoopGC(VM):
                 cont[0] = None
             try:
                 i = 0
-                for thunk, node, old_storage in zip(
-                    self.thunks, self.nodes, self.post_thunk_clear
+                for thunk, node, old_storage, transfers in zip(
+                    self.thunks,
+                    self.nodes,
+                    self.post_thunk_clear,
+                    self.post_thunk_transfer,
                 ):
                     t0 = time.time()
                     thunk()
@@ -296,6 +432,7 @@ class LoopGC(VM):
                     self.call_times[i] += t1 - t0
                     for old_s in old_storage:
                         old_s[0] = None
+                    _transfer_buffers(transfers)
                     i += 1
             except Exception:
                 link.raise_with_op(node, thunk)
@@ -303,12 +440,17 @@ class LoopGC(VM):
             for cont in self.pre_call_clear:
                 cont[0] = None
             try:
-                for thunk, node, old_storage in zip(
-                    self.thunks, self.nodes, self.post_thunk_clear
+                for thunk, node, old_storage, transfers in zip(
+                    self.thunks,
+                    self.nodes,
+                    self.post_thunk_clear,
+                    self.post_thunk_transfer,
                 ):
                     thunk()
                     for old_s in old_storage:
                         old_s[0] = None
+                    if transfers:
+                        _transfer_buffers(transfers)
             except Exception:
                 link.raise_with_op(node, thunk)
 
@@ -687,6 +829,175 @@ class Stack(VM):
         self.node_cleared_order.append(final_index)
 
 
+class ParallelLoop(VM):
+    """
+    Dependency-driven program execution on a pool of threads.
+
+    Apply nodes are dispatched to worker threads as soon as all the
+    variables they depend on have been computed, so independent branches
+    of the graph run concurrently. The scheduling itself happens in the
+    calling thread: only the thunks run on the workers. Thunks that
+    release the GIL (e.g. NumPy/BLAS based `perform` implementations) will
+    overlap in time; the others are simply interleaved.
+
+    Parameters
+    ----------
+    nodes
+        A list of nodes in toposort order.
+    thunks
+        A list of thunks to execute those nodes, in toposort order.
+    pre_call_clear
+        A list of containers to empty at the beginning of each call.
+    storage_map
+        The storage map of the function.
+    fgraph
+        The FunctionGraph. Its `orderings` are used to respect the
+        constraints induced by `destroy_map` and `view_map`.
+    allow_gc
+        If True, an intermediate result is freed once every node using it
+        has run.
+    n_threads
+        The number of worker threads. If None or 0, use the Aesara flag
+        `vm.parallel_threads`, and if that is 0 too, the number of cores.
+
+    Notes
+    -----
+    This VM does not support lazy evaluation. `VM_Linker` falls back to
+    `Stack` when the graph contains lazy thunks.
+
+    """
+
+    def __init__(
+        self,
+        nodes,
+        thunks,
+        pre_call_clear,
+        storage_map,
+        fgraph,
+        allow_gc,
+        n_threads=None,
+    ):
+        super().__init__(nodes, thunks, pre_call_clear)
+        if any(th.lazy for th in thunks):
+            raise ValueError("ParallelLoop does not support lazy thunks")
+
+        self.allow_gc = allow_gc
+        if not n_threads:
+            n_threads = config.vm.parallel_threads
+        if not n_threads:
+            n_threads = os.cpu_count() or 1
+        self.n_threads = n_threads
+        self._executor = None
+
+        node_idx = {node: i for i, node in enumerate(nodes)}
+        ords = fgraph.orderings()
+
+        # n_deps[i] is the number of distinct nodes that must have run before
+        # nodes[i], and successors[i] lists the nodes waiting on nodes[i].
+        n_deps = [0] * len(nodes)
+        successors = [[] for _ in nodes]
+        for i, node in enumerate(nodes):
+            prereqs = {inp.owner for inp in node.inputs if inp.owner is not None}
+            prereqs.update(ords.get(node, []))
+            for prereq in prereqs:
+                successors[node_idx[prereq]].append(i)
+            n_deps[i] = len(prereqs)
+        self.n_deps = n_deps
+        self.successors = successors
+        self.roots = [i for i, n in enumerate(n_deps) if n == 0]
+
+        # For each node, the (storage, n_users index) pairs of the
+        # intermediate results it reads and which can be freed once all
+        # their users have run.
+        self.gc_inputs = [[] for _ in nodes]
+        self.n_users = []
+        if allow_gc:
+            outputs = set(fgraph.outputs)
+            users_idx = {}
+            for i, node in enumerate(nodes):
+                for inp in set(node.inputs):
+                    if inp.owner is None or inp in outputs:
+                        continue
+                    if inp not in users_idx:
+                        users_idx[inp] = len(self.n_users)
+                        self.n_users.append(0)
+                    self.n_users[users_idx[inp]] += 1
+                    self.gc_inputs[i].append((storage_map[inp], users_idx[inp]))
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.n_threads, thread_name_prefix="aesara_vm"
+            )
+        return self._executor
+
+    def _timed_thunk(self, i):
+        t0 = time.time()
+        self.thunks[i]()
+        self.call_times[i] += time.time() - t0
+        self.call_counts[i] += 1
+
+    def __call__(self):
+        for cont in self.pre_call_clear:
+            cont[0] = None
+
+        thunks = self.thunks
+        n_users = list(self.n_users)
+        gc_inputs = self.gc_inputs
+        if self.n_threads == 1 or len(thunks) < 2:
+            # Nothing to overlap, avoid the scheduling overhead.
+            for i in range(len(thunks)):
+                try:
+                    if self.time_thunks:
+                        self._timed_thunk(i)
+                    else:
+                        thunks[i]()
+                except Exception:
+                    link.raise_with_op(self.nodes[i], thunks[i])
+                for storage, u in gc_inputs[i]:
+                    n_users[u] -= 1
+                    if n_users[u] == 0:
+                        storage[0] = None
+            return
+
+        executor = self._get_executor()
+        n_deps = list(self.n_deps)
+        successors = self.successors
+        if self.time_thunks:
+            run = self._timed_thunk
+        else:
+
+            def run(i):
+                thunks[i]()
+
+        running = {executor.submit(run, i): i for i in self.roots}
+        while running:
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for fut in done:
+                i = running.pop(fut)
+                try:
+                    fut.result()
+                except Exception:
+                    # Let the other thunks finish before reporting, so that
+                    # nothing keeps running after we return.
+                    concurrent.futures.wait(running)
+                    link.raise_with_op(self.nodes[i], thunks[i])
+                for storage, u in gc_inputs[i]:
+                    n_users[u] -= 1
+                    if n_users[u] == 0:
+                        storage[0] = None
+                for j in successors[i]:
+                    n_deps[j] -= 1
+                    if n_deps[j] == 0:
+                        running[executor.submit(run, j)] = j
+
+    def __del__(self):
+        if getattr(self, "_executor", None) is not None:
+            self._executor.shutdown(wait=False)
+
+
 try:
     # If cxx is explicitely set to an empty string, we do not want to import neither lazylinker C code
     # nor lazylinker compiled C code from cache.
@@ -748,6 +1059,13 @@ class VM_Linker(link.LocalLinker):
     allow_partial_eval
         If True, enforces usage of Stack or CVM, to allow for partial
         evaluation of functions (calculating a subset of outputs).
+    parallel
+        Useful only when use_cloop is False. If True, use the ParallelLoop
+        VM to run independent nodes concurrently on a pool of threads when
+        the graph has no lazy node.
+    n_threads
+        The number of threads used when parallel is True. If None, use
+        the Aesara flag vm.parallel_threads.
 
     """
 
@@ -761,6 +1079,8 @@ class VM_Linker(link.LocalLinker):
         schedule=None,
         c_thunks=None,
         allow_partial_eval=None,
+        parallel=False,
+        n_threads=None,
     ):
         # Note: if more parameters are added to __init__, make sure to forward
         # them in the "type(self)(...)" call in the "accept" method below.
@@ -776,6 +1096,8 @@ class VM_Linker(link.LocalLinker):
             c_thunks = bool(aesara.config.cxx)
         self.c_thunks = c_thunks
         self.allow_partial_eval = allow_partial_eval
+        self.parallel = parallel
+        self.n_threads = n_threads
         self.updated_vars = {}
         if schedule:
             self.schedule = schedule
@@ -839,6 +1161,8 @@ class VM_Linker(link.LocalLinker):
                 schedule=self.schedule,
                 c_thunks=self.c_thunks,
                 allow_partial_eval=self.allow_partial_eval,
+                parallel=self.parallel,
+                n_threads=self.n_threads,
             ).accept(fgraph, no_recycling, profile)
         self.fgraph = fgraph
         self.no_recycling = no_recycling
@@ -908,6 +1232,7 @@ class VM_Linker(link.LocalLinker):
         computed,
         compute_map,
         updated_vars,
+        post_thunk_transfer=None,
     ):
 
         pre_call_clear = [storage_map[v] for v in self.no_recycling]
@@ -1003,6 +1328,9 @@ class VM_Linker(link.LocalLinker):
                     var_owner[i] = nodes_idx[var.owner]
 
             is_lazy_list = [int(th.lazy) for th in thunks]
+            # The C code selects the branch of the IfElse nodes itself
+            # instead of calling their thunk.
+            ifelse_list = [getattr(th, "ifelse_info", None) for th in thunks]
             output_vars = [vars_idx[v] for v in self.fgraph.outputs]
 
             # builds the list of prereqs induced by e.g. destroy_handler
@@ -1057,6 +1385,7 @@ class VM_Linker(link.LocalLinker):
                 node_output_size=node_output_size,
                 update_storage=update_storage,
                 dependencies=dependency_map_list,
+                ifelse_list=ifelse_list,
             )
 
             if platform.python_implementation() == "CPython":
@@ -1069,18 +1398,30 @@ class VM_Linker(link.LocalLinker):
                 lazy = not all([(not th.lazy) for th in thunks])
             if not lazy:
                 # there is no conditional in the graph
-                if self.allow_gc:
+                if self.parallel:
+                    vm = ParallelLoop(
+                        nodes,
+                        thunks,
+                        pre_call_clear,
+                        storage_map,
+                        self.fgraph,
+                        self.allow_gc,
+                        n_threads=self.n_threads,
+                    )
+                elif self.allow_gc:
                     vm = LoopGC(
                         nodes,
                         thunks,
                         pre_call_clear,
                         post_thunk_clear,
+                        post_thunk_transfer,
                     )
                 else:
                     vm = Loop(
                         nodes,
                         thunks,
                         pre_call_clear,
+                        post_thunk_transfer,
                     )
             else:
                 # Needed when allow_gc=True and profiling
@@ -1135,6 +1476,8 @@ class VM_Linker(link.LocalLinker):
         impl = None
         if self.c_thunks is False:
             impl = "py"
+        else:
+            aesara.gof.cc.compile_c_modules(order, storage_map, compute_map, [])
         for node in order:
             try:
                 thunk_start = time.time()
@@ -1172,17 +1515,42 @@ class VM_Linker(link.LocalLinker):
             lazy = config.vm.lazy
         if lazy is None:
             lazy = not all([(not th.lazy) for th in thunks])
-        if not (
+        # Loop and LoopGC run the thunks in `order`, the other VMs don't.
+        in_order = not (
             lazy
             or ((config.profile or config.print_global_stats) and config.profile_memory)
             or self.use_cloop
+            or self.parallel
             or self.callback
             or self.callback_input
-        ):
+        )
+
+        computed, last_user = link.gc_helper(order)
+        planned = set()
+        post_thunk_transfer = None
+        if in_order and not self.allow_partial_eval and config.vm.memory_plan:
+            post_thunk_transfer = {node: [] for node in order}
+            reallocated = {v for pair in reallocated_info.values() for v in pair}
+            applied = []
+            for slot in calculate_memory_plan(order, fgraph):
+                if any(v in reallocated for v in slot):
+                    continue
+                applied.append(slot)
+                planned.update(slot)
+                for v, next_v in zip(slot, slot[1:] + slot[:1]):
+                    if v is not next_v:
+                        post_thunk_transfer[last_user[v]].append(
+                            (storage_map[v], storage_map[next_v])
+                        )
+            post_thunk_transfer = [post_thunk_transfer[node] for node in order]
+            if self.profile:
+                # Only the plan that is applied is reported.
+                self.profile.memory_plan[fgraph] = applied
+
+        if in_order:
             for pair in reallocated_info.values():
                 storage_map[pair[1]] = storage_map[pair[0]]
 
-        computed, last_user = link.gc_helper(order)
         if self.allow_gc:
             post_thunk_clear = []
             for node in order:
@@ -1193,6 +1561,7 @@ class VM_Linker(link.LocalLinker):
                         and input not in fgraph.outputs
                         and node == last_user[input]
                         and input not in reallocated_info
+                        and input not in planned
                     ):
                         clear_after_this_thunk.append(storage_map[input])
                 post_thunk_clear.append(clear_after_this_thunk)
@@ -1209,6 +1578,7 @@ class VM_Linker(link.LocalLinker):
             computed,
             compute_map,
             self.updated_vars,
+            post_thunk_transfer,
         )
 
         vm.storage_map = storage_map
@@ -1236,3 +1606,6 @@ class VM_Linker(link.LocalLinker):
             self.allow_partial_eval = None
         if not hasattr(self, "callback_input"):
             self.callback_input = None
+        if not hasattr(self, "parallel"):
+            self.parallel = False
+            self.n_threads = None
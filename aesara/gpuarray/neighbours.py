@@ -26,6 +26,10 @@ class GpuImages2Neibs(GpuKernelBase, Images2Neibs, Op):
 
     params_type = ParamsType(mode=Images2Neibs.BORDER_MODE, context=gpu_context_type)
 
+    def __init__(self, mode="valid"):
+        # The kernels don't use OpenMP.
+        Images2Neibs.__init__(self, mode, openmp=False)
+
     def get_params(self, node):
         return self.params_type.get_params(self, context=node.inputs[0].type.context)
 
@@ -301,6 +301,8 @@ class IfElse(Op):
                         return []
 
         thunk.lazy = True
+        # Lets the CVM select the branch without calling this thunk.
+        thunk.ifelse_info = (self.n_outs, self.as_view)
         thunk.inputs = [storage_map[v] for v in node.inputs]
         thunk.outputs = [storage_map[v] for v in node.outputs]
         return thunk
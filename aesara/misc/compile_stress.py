@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""
+Stress test of the compilation cache.
+
+Start N processes at the same time, each compiling a graph that shares
+part of its C modules with the graphs of the other processes, and report
+the time from the start of each process to the end of the first call of
+its function.
+
+By default, a new compiledir is used, so that all the modules have to be
+compiled. For example, to compare the concurrent compilation with the
+serial one::
+
+    python compile_stress.py -n 16
+    python compile_stress.py -n 16 --flags cmodule.compilation_workers=1
+
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def worker(index, n_ops):
+    start = time.time()
+    import numpy as np
+
+    import aesara
+    import aesara.tensor as tt
+
+    imported = time.time()
+    unary = [tt.exp, tt.log1p, tt.tanh, tt.sqrt, tt.cos, tt.sin, tt.abs_, tt.sgn]
+    dtypes = ["float64", "float32", "int64", "int32"]
+    outputs = []
+    x = tt.dvector("x")
+    for j in range(n_ops):
+        # Consecutive processes share most of their modules.
+        k = index + j
+        out = unary[k % len(unary)](tt.cast(x, dtypes[(k // len(unary)) % 4]))
+        outputs.append(out.sum(acc_dtype="float64"))
+    f = aesara.function([x], outputs)
+    compiled = time.time()
+    f(np.arange(10, dtype="float64"))
+    end = time.time()
+    print(
+        json.dumps(
+            {
+                "index": index,
+                "import": imported - start,
+                "compile": compiled - imported,
+                "first_call": end - start,
+            }
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "-n", type=int, default=os.cpu_count(), help="Number of processes"
+    )
+    parser.add_argument(
+        "--ops", type=int, default=16, help="Number of Ops in each graph"
+    )
+    parser.add_argument(
+        "--compiledir",
+        help="Compiledir to use, defaults to a new temporary directory",
+    )
+    parser.add_argument("--flags", default="", help="Additional THEANO_FLAGS")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        worker(args.worker, args.ops)
+        return
+
+    compiledir = args.compiledir or tempfile.mkdtemp(prefix="aesara_stress_")
+    env = dict(os.environ)
+    env["THEANO_FLAGS"] = ",".join(
+        f
+        for f in (env.get("THEANO_FLAGS", ""), "compiledir=" + compiledir, args.flags)
+        if f
+    )
+    try:
+        start = time.time()
+        procs = [
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    os.path.abspath(__file__),
+                    "--worker",
+                    str(i),
+                    "--ops",
+                    str(args.ops),
+                ],
+                env=env,
+                stdout=subprocess.PIPE,
+            )
+            for i in range(args.n)
+        ]
+        results = []
+        for proc in procs:
+            out, _ = proc.communicate()
+            if proc.returncode:
+                print("A worker failed with status %i" % proc.returncode)
+                sys.exit(1)
+            results.append(json.loads(out.decode().strip().split("\n")[-1]))
+        total = time.time() - start
+    finally:
+        if args.compiledir is None:
+            shutil.rmtree(compiledir, ignore_errors=True)
+
+    times = sorted(r["first_call"] for r in results)
+    print("%i processes, %i Ops per graph" % (args.n, args.ops))
+    print(
+        "Time to first call: min %.2fs, median %.2fs, max %.2fs"
+        % (times[0], times[len(times) // 2], times[-1])
+    )
+    print(
+        "Mean compilation time: %.2fs"
+        % (sum(r["compile"] for r in results) / len(results))
+    )
+    print("Total time: %.2fs" % total)
+
+
+if __name__ == "__main__":
+    main()
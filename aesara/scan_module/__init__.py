@@ -44,5 +44,6 @@ __contact__ = "Razvan Pascanu <r.pascanu@gmail>"
 from aesara.scan_module import scan_opt
 from aesara.scan_module.scan import scan
 from aesara.scan_module.scan_checkpoints import scan_checkpoints
+from aesara.scan_module.scan_stream import scan_stream
 from aesara.scan_module.scan_utils import clone, until
 from aesara.scan_module.scan_views import foldl, foldr, map, reduce
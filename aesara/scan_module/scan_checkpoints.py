@@ -1,5 +1,61 @@
+import logging
+import math
+
+import numpy as np
+
 import aesara
-from aesara.tensor.basic import Join
+from aesara.tensor.basic import Join, NotScalarConstantError, get_scalar_constant_value
+
+
+_logger = logging.getLogger("aesara.scan_module.scan_checkpoints")
+
+
+def checkpoint_schedule(n_steps, max_states=None):
+    """Number of steps between two checkpoints of `scan_checkpoints`.
+
+    With ``N`` steps between checkpoints, the gradient of a scan of
+    ``n_steps`` steps holds about ``n_steps / N`` checkpoints and the ``N``
+    states of the segment it recomputes, and recomputes each step once.
+
+    Parameters
+    ----------
+    n_steps
+        The number of steps of the scan, as an int or Aesara scalar.
+    max_states
+        The number of states that may be held at once, as an int or Aesara
+        scalar. If None, or if it is too small for any schedule, the number
+        of states held is minimized with ``N = ceil(sqrt(n_steps))``.
+        Otherwise, ``N`` is the largest number of steps, so the smallest
+        number of segments, that fits.
+
+    Returns
+    -------
+    int or Aesara scalar
+        ``N``, between 1 and ``n_steps``. It is an int if the arguments are
+        constants.
+
+    """
+    try:
+        n = int(get_scalar_constant_value(n_steps))
+        k = None if max_states is None else int(get_scalar_constant_value(max_states))
+    except NotScalarConstantError:
+        pass
+    else:
+        every = math.ceil(math.sqrt(n))
+        if k is not None and k ** 2 >= 4 * n:
+            # Largest N such that n / N + N <= k.
+            every = int((k + math.sqrt(k ** 2 - 4 * n)) // 2)
+        return min(max(every, 1), max(n, 1))
+
+    tt = aesara.tensor
+    n_steps = tt.cast(n_steps, "int64")
+    every = tt.ceil(tt.sqrt(n_steps))
+    if max_states is not None:
+        k = tt.cast(max_states, "float64")
+        delta = k ** 2 - 4 * n_steps
+        largest = tt.floor((k + tt.sqrt(tt.maximum(delta, 0))) / 2)
+        every = tt.switch(tt.ge(delta, 0), largest, every)
+    return tt.cast(tt.clip(every, 1, tt.maximum(n_steps, 1)), "int64")
 
 
 def scan_checkpoints(
@@ -11,6 +67,7 @@ def scan_checkpoints(
     n_steps=None,
     save_every_N=10,
     padding=True,
+    memory_budget=None,
 ):
     """Scan function that uses less memory, but is more restrictive.
 
@@ -29,7 +86,7 @@ def scan_checkpoints(
     * If ``n_steps`` is specified, it has the same value as the length of
       any sequence.
     * The value of ``save_every_N`` divides the number of steps the scan
-      will run without remainder.
+      will run without remainder, unless ``padding`` is True.
     * Only singly-recurrent and non-recurrent outputs are used.
       No multiple recurrences.
     * Only the last timestep of any output will ever be used.
@@ -67,7 +124,8 @@ def scan_checkpoints(
     save_every_N
         ``save_every_N`` is the number of steps to go without storing
         the computations of ``scan`` (ie they will have to be recomputed
-        during the gradient computation).
+        during the gradient computation). If None, it is chosen by
+        :func:`checkpoint_schedule`, from ``memory_budget`` if given.
 
     padding
         If the length of the sequences is not a multiple of ``save_every_N``,
@@ -76,6 +134,11 @@ def scan_checkpoints(
         avoided by setting ``padding`` to False, but you need to make
         sure the length of the sequences is a multple of ``save_every_N``.
 
+    memory_budget
+        The number of bytes that the states of the recurrent outputs may
+        use at once during the gradient computation, as an int or Aesara
+        scalar. Only used when ``save_every_N`` is None.
+
     Returns
     -------
     tuple
@@ -113,6 +176,28 @@ def scan_checkpoints(
     if n_steps is None:
         n_steps = sequences[0].shape[0]
 
+    if save_every_N is None:
+        max_states = None
+        if memory_budget is not None:
+            states = [
+                aesara.tensor.as_tensor_variable(
+                    o["initial"] if isinstance(o, dict) else o
+                )
+                for o in outputs_info
+                if o is not None
+            ]
+            state_bytes = sum(o.size * np.dtype(o.dtype).itemsize for o in states)
+            max_states = memory_budget // aesara.tensor.maximum(state_bytes, 1)
+        save_every_N = checkpoint_schedule(n_steps, max_states)
+        if isinstance(save_every_N, int):
+            _logger.info("%s: saving a checkpoint every %d steps", name, save_every_N)
+        else:
+            _logger.info(
+                "%s: the number of steps between checkpoints depends on "
+                "the inputs and is computed at run time",
+                name,
+            )
+
     # Compute the number of steps of the outer scan
     o_n_steps = aesara.tensor.cast(aesara.tensor.ceil(n_steps / save_every_N), "int64")
 
@@ -127,14 +212,16 @@ def scan_checkpoints(
         # Since padding could be an empty tensor, Join returns a view of s.
         join = Join(view=0)
         for i, s in enumerate(sequences):
-            n = s.shape[0] % save_every_N
-            z = aesara.tensor.zeros((n, s.shape[1:]), dtype=s.dtype)
-            sequences[i] = join(0, [s, z])
+            n = (-s.shape[0]) % save_every_N
+            z = aesara.tensor.zeros(
+                [n] + [s.shape[d] for d in range(1, s.ndim)], dtype=s.dtype
+            )
+            sequences[i] = join(0, s, z)
 
     # Establish the input variables of the outer scan
     o_sequences = [
         s.reshape(
-            [s.shape[0] / save_every_N, save_every_N]
+            [s.shape[0] // save_every_N, save_every_N]
             + [s.shape[i] for i in range(1, s.ndim)],
             s.ndim + 1,
         )
@@ -147,9 +234,10 @@ def scan_checkpoints(
     def outer_step(*args):
         # Separate the received arguments into their respective (seq, outputs
         # from previous iterations, nonseqs) categories
+        start_non_seqs = len(args) - len(o_nonsequences)
         i_sequences = list(args[: len(o_sequences)])
-        i_prev_outputs = list(args[len(o_sequences) : -len(o_nonsequences)])
-        i_non_sequences = list(args[-len(o_nonsequences) :])
+        i_prev_outputs = list(args[len(o_sequences) : start_non_seqs])
+        i_non_sequences = list(args[start_non_seqs:])
         i_outputs_infos = (
             i_prev_outputs
             + [
@@ -51,7 +51,9 @@ relies on the following elements to work properly :
 import copy
 import itertools
 import logging
+import threading
 import time
+import weakref
 from collections import OrderedDict
 
 import numpy as np
@@ -79,6 +81,49 @@ __contact__ = "Razvan Pascanu <r.pascanu@gmail>"
 # Logging function for sending warning or info
 _logger = logging.getLogger("aesara.scan_module.scan_op")
 
+# Inner functions compiled by Scan ops, so that equal ops (i.e. with the
+# same inner graph) optimize it only once. Maps an op to a dict from the
+# compilation settings to the signature of its inner graph (see
+# `_inner_graph_signature`) and the function. See `Scan.make_thunk`.
+_inner_fn_cache = weakref.WeakKeyDictionary()
+
+
+def _inner_graph_signature(inputs, outputs):
+    """
+    Return a hashable description of the graph from `inputs` to `outputs`.
+
+    Two graphs have the same signature when they have the same structure,
+    the same ops, types and constant values. Unlike `Scan.__eq__`, the inner
+    graphs of nested Scan ops are described with all of their `info`, so a
+    compiled inner function is only shared between identical graphs.
+
+    """
+    index = {}
+    for i, var in enumerate(inputs):
+        index[var] = ("input", i, var.type)
+
+    def describe(var):
+        if var in index:
+            return index[var]
+        if isinstance(var, gof.Constant):
+            return ("constant", var.type, var.signature())
+        # A variable that is not an input of the graph.
+        return ("free", id(var))
+
+    nodes = []
+    for node in gof.graph.io_toposort(inputs, outputs):
+        op = node.op
+        if isinstance(op, Scan):
+            op = (
+                type(op),
+                tuple(sorted((k, repr(v)) for k, v in op.info.items() if k != "name")),
+                _inner_graph_signature(op.inputs, op.outputs),
+            )
+        nodes.append((op, tuple(describe(var) for var in node.inputs)))
+        for j, var in enumerate(node.outputs):
+            index[var] = ("node", len(nodes) - 1, j, var.type)
+    return tuple(nodes), tuple(describe(var) for var in outputs)
+
 
 class Scan(PureOp):
     """
@@ -112,6 +157,9 @@ class Scan(PureOp):
 
     """
 
+    # Initial length of the growing nit_sot buffers of while loops.
+    while_initial_steps = 16
+
     def __init__(
         self,
         inputs,
@@ -179,6 +227,9 @@ class Scan(PureOp):
         self.mode_instance = mode_instance.clone(
             link_kwargs=dict(allow_gc=self.allow_gc), message=message
         )
+        # The clone above is different for every op, so the inner function
+        # cache is keyed on the original mode.
+        self._base_mode = mode_instance
 
         if not hasattr(self, "name") or self.name is None:
             self.name = "scan_fn"
@@ -272,6 +323,13 @@ class Scan(PureOp):
                         "that it shouldn't be the case"
                     )
 
+    def __getstate__(self):
+        d = dict(self.__dict__)
+        # Locks can't be pickled, make_thunk creates a new one.
+        d.pop("_fn_lock", None)
+        d.pop("_base_mode", None)
+        return d
+
     def __setstate__(self, d):
         self.__dict__.update(d)
         if "allow_gc" not in self.__dict__:
@@ -953,15 +1011,52 @@ class Scan(PureOp):
             profile = self.profile
         # make_thunk can be called many times on the same op
         # we do not want to recompile the inner fct every time.
+        cache_key = cached = None
         if not getattr(self, "fn", None):
-            self.fn = function(
-                wrapped_inputs,
-                wrapped_outputs,
-                mode=compilation_mode,
-                name=self.name,
-                profile=profile,
-                on_unused_input="ignore",
-            )
+            fn = None
+            base_mode = getattr(self, "_base_mode", None)
+            if (
+                base_mode is not None
+                and type(self.mode_instance) is compile.mode.Mode
+                and not profile
+            ):
+                cache_key = (
+                    base_mode,
+                    self.allow_gc,
+                    impl,
+                    config.scan.allow_output_prealloc,
+                    config.scan.fuse_inner,
+                )
+                signature = _inner_graph_signature(self.inputs, self.outputs)
+                cached = _inner_fn_cache.get(self, {}).get(cache_key)
+                # Scan.__eq__ found an equal op, check that its inner graph
+                # is exactly the same.
+                if cached is not None and cached[0] == signature:
+                    # Its copy skips the optimization and reuses the compiled
+                    # modules, but has its own storage.
+                    fn = cached[1].copy(name=self.name, profile=profile)
+            if fn is None and config.scan.fuse_inner and impl != "py":
+                fn = self.make_fused_fn(
+                    wrapped_inputs, wrapped_outputs, compilation_mode, profile
+                )
+            if fn is None:
+                fn = function(
+                    wrapped_inputs,
+                    wrapped_outputs,
+                    mode=compilation_mode,
+                    name=self.name,
+                    profile=profile,
+                    on_unused_input="ignore",
+                )
+            self.fn = fn
+        # The thunks of all the nodes of this op share the storage of the
+        # inner function, so they must not run it concurrently, e.g. on the
+        # threads of a parallel VM. Nodes of different ops can.
+        if getattr(self, "_fn_lock", None) is None:
+            self._fn_lock = threading.Lock()
+        fn_lock = self._fn_lock
+        if cache_key is not None and cached is None:
+            _inner_fn_cache.setdefault(self, {})[cache_key] = (signature, self.fn)
 
         # Analyse the compile inner function to determine which inputs and
         # outputs are on the gpu and speed up some checks during the execution
@@ -1064,11 +1159,12 @@ class Scan(PureOp):
         def rval(
             p=p, i=node_input_storage, o=node_output_storage, n=node, allow_gc=allow_gc
         ):
-            r = p(n, [x[0] for x in i], o)
+            with fn_lock:
+                r = p(n, [x[0] for x in i], o)
+                if allow_gc:
+                    self.fn.free()
             for o in node.outputs:
                 compute_map[o][0] = True
-            if allow_gc:
-                self.fn.free()
             return r
 
         rval.inputs = node_input_storage
@@ -1077,6 +1173,42 @@ class Scan(PureOp):
         rval.lazy = False
         return rval
 
+    def make_fused_fn(self, inputs, outputs, mode, profile):
+        """
+        Compile the inner function with the C linker.
+
+        The whole inner graph then runs as one C function at each step,
+        instead of going through the VM. The loop over the steps is not
+        changed: it still runs in ``scan_perform``, which calls this
+        function once per step. Return None if the mode does not use a VM
+        linker, or if some inner Op has no C code.
+
+        """
+        if (
+            not config.cxx
+            or type(mode) is not compile.mode.Mode
+            or not isinstance(mode.linker, gof.vm.VM_Linker)
+        ):
+            return None
+        fused_mode = compile.mode.Mode(
+            linker=gof.CLinker(), optimizer=mode.provided_optimizer
+        )
+        try:
+            return function(
+                inputs,
+                outputs,
+                mode=fused_mode,
+                name=self.name,
+                profile=profile,
+                on_unused_input="ignore",
+            )
+        except (gof.utils.MethodNotDefined, NotImplementedError):
+            _logger.debug(
+                "Some Ops of the inner graph of %s have no C code, using the VM",
+                self.name,
+            )
+            return None
+
     def inner_seqs(self, list_inputs):
         # Given the list of inner inputs this function grabs those
         # corresponding to sequences
@@ -1305,11 +1437,39 @@ class Scan(PureOp):
             (-self.mintaps[idx]) % store_steps[idx]
             for idx in range(self.n_outs + self.n_nit_sot)
         ]
+        # A while loop can stop long before n_steps. Its mit_sot, sit_sot and
+        # nit_sot outputs that keep every step start with a small buffer that
+        # doubles in size when it is full, instead of being allocated for
+        # n_steps. This is also done for the outputs that could be computed
+        # inplace of their initial state.
+        grow_outs = []
+        if self.as_while:
+            grow_outs = [
+                idx
+                for idx in range(self.n_mit_mot, self.n_outs + self.n_nit_sot)
+                if store_steps[idx] == n_steps - self.mintaps[idx]
+                and store_steps[idx] > 1
+            ]
         if not getattr(self, "destroy_map", None):
             self.destroy_map = OrderedDict()
         # 2.1 Create storage space for outputs
         for idx in range(self.n_outs):
-            if idx in self.destroy_map:
+            if idx in grow_outs:
+                # Only the initial state is copied.
+                l = -self.mintaps[idx]
+                init = args[self.seqs_arg_offset + idx]
+                n_alloc = min(store_steps[idx], l + self.while_initial_steps)
+                if (
+                    outs[idx][0] is not None
+                    and outs[idx][0].shape[1:] == init.shape[1:]
+                    and outs[idx][0].shape[0] >= n_alloc
+                ):
+                    outs[idx][0] = outs[idx][0][:n_alloc]
+                else:
+                    shape = (n_alloc,) + init.shape[1:]
+                    outs[idx][0] = node.outputs[idx].type.value_zeros(shape)
+                outs[idx][0][:l] = init[:l]
+            elif idx in self.destroy_map:
                 # ^ Case 1. Outputs should be computed inplace of their
                 # initial state
                 outs[idx][0] = args[self.seqs_arg_offset + idx]
@@ -1396,6 +1556,14 @@ class Scan(PureOp):
 
             # 4.2. Collect slices for mitsots, sitsots and nitsots
             if i != 0:
+                for idx in grow_outs:
+                    if pos[idx] == outs[idx][0].shape[0]:
+                        old = outs[idx][0]
+                        shape = (min(2 * old.shape[0], store_steps[idx]),)
+                        shape += old.shape[1:]
+                        outs[idx][0] = node.outputs[idx].type.value_zeros(shape)
+                        outs[idx][0][: old.shape[0]] = old
+                        del old
                 for idx in range(self.n_outs + self.n_nit_sot - self.n_mit_mot):
                     if (
                         store_steps[idx + self.n_mit_mot] == 1
@@ -1598,17 +1766,20 @@ class Scan(PureOp):
 
                 if i == 0:
                     jout = j + offset_out
-                    shape = (store_steps[j],) + output_storage[jout].storage[0].shape
+                    n_alloc = store_steps[j]
+                    if j in grow_outs:
+                        n_alloc = min(n_alloc, self.while_initial_steps)
+                    shape = (n_alloc,) + output_storage[jout].storage[0].shape
                     dtype = output_storage[jout].storage[0].dtype
                     if (
                         outs[j][0] is None
-                        or outs[j][0].shape[0] < store_steps[j]
+                        or outs[j][0].shape[0] < n_alloc
                         or outs[j][0].shape[1:] != shape[1:]
                         or outs[j][0].dtype != dtype
                     ):
                         outs[j][0] = node.outputs[j].type.value_zeros(shape)
-                    elif outs[j][0].shape[0] != store_steps[j]:
-                        outs[j][0] = outs[j][0][: store_steps[j]]
+                    elif outs[j][0].shape[0] != n_alloc:
+                        outs[j][0] = outs[j][0][:n_alloc]
                     outs[j][0][pos[j]] = output_storage[jout].storage[0]
                 elif store_steps[j] == 1 or self.vector_outs[j]:
                     outs[j][0][pos[j]] = output_storage[j + offset_out].storage[0]
@@ -1646,7 +1817,13 @@ class Scan(PureOp):
         begin = self.n_mit_mot
         end = self.n_outs + self.n_nit_sot
         for idx in range(begin, end):
-            if store_steps[idx] < i - self.mintaps[idx] and pos[idx] < store_steps[idx]:
+            if idx in grow_outs:
+                # Only the first i steps were computed, return a view on
+                # them.
+                outs[idx][0] = outs[idx][0][: i - self.mintaps[idx]]
+            elif (
+                store_steps[idx] < i - self.mintaps[idx] and pos[idx] < store_steps[idx]
+            ):
 
                 pdx = pos[idx]
                 if pdx >= store_steps[idx] // 2:
@@ -2671,6 +2848,9 @@ class Scan(PureOp):
             info["name"] = None
         info["mode"] = self.mode
         info["allow_gc"] = self.allow_gc
+        # The sequences are the traces of this loop, do not create more (see
+        # `PushOutSeqScan.keep_inside`).
+        info["recompute_seqs"] = True
 
         outer_inputs = (
             [grad_steps]
@@ -4,7 +4,8 @@ The Optimization provided in this file:
 
 local opt: remove_constants_and_unused_inputs_scan,
            constant_folding_for_scan2,
-           scan_merge_inouts
+           scan_merge_inouts,
+           scan_vectorize_map
            They are wrapped in in2out to create global opt.
 global opt: ScanInplaceOptimizer,
             PushOutNonSeqScan,
@@ -19,7 +20,8 @@ optdb: scan_eqopt1 (.1), scan_eqopt2(1.6), scan_inplace(75)
 scan_eqopt1 -> scan_seqopt1
 scan_seqopt1 -> in2out(remove_constants_and_unused_inputs_scan)(1),
                 PushOutNonSeqScan(2),
-                PushOutSeqScan(3), PushOutDot1(4)
+                PushOutSeqScan(3), PushOutDot1(4),
+                PushOutScanOutput(5), in2out(scan_vectorize_map)(6)
 scan_eqopt2 -> They are all global optimizer. (in2out convert local to global).
                This is important, as the order is important and all global
                optimizer run before local optimizer in the order they where
@@ -432,6 +434,58 @@ class PushOutNonSeqScan(gof.Optimizer):
             return False
 
 
+# Scalar ops whose cost is dominated by reading their inputs, so that
+# computing them again at each step of a scan is cheap.
+_cheap_scalar_ops = (
+    scalar.Add,
+    scalar.Mul,
+    scalar.Sub,
+    scalar.TrueDiv,
+    scalar.Neg,
+    scalar.Abs,
+    scalar.Sqr,
+    scalar.Maximum,
+    scalar.Minimum,
+    scalar.LogicalComparison,
+    scalar.Switch,
+    scalar.Second,
+    scalar.Identity,
+    scalar.Cast,
+)
+
+
+def is_cheap_to_recompute(op):
+    """Tell if the Elemwise `op` does only cheap scalar operations."""
+    scalar_op = op.scalar_op
+    if isinstance(scalar_op, scalar.Composite):
+        return all(
+            isinstance(n.op, _cheap_scalar_ops) for n in scalar_op.fgraph.toposort()
+        )
+    return isinstance(scalar_op, _cheap_scalar_ops)
+
+
+def static_size(fgraph, var):
+    """
+    Number of elements of `var` if its shape is known at compile time.
+
+    The shape is taken from the ShapeFeature of `fgraph` if it has one.
+    Return None if some dimension is unknown.
+
+    """
+    shape_feature = getattr(fgraph, "shape_feature", None)
+    if shape_feature is not None and var in shape_feature.shape_of:
+        shape = shape_feature.shape_of[var]
+    else:
+        shape = [var.shape[i] for i in range(var.ndim)]
+    size = 1
+    for dim in shape:
+        try:
+            size *= int(get_scalar_constant_value(dim))
+        except tensor.NotScalarConstantError:
+            return None
+    return size
+
+
 # This is a global opt for historical reason
 # It should be possible to change it to a local opt.
 class PushOutSeqScan(gof.Optimizer):
@@ -451,6 +505,36 @@ class PushOutSeqScan(gof.Optimizer):
         for node in nodelist:
             self.process_node(fgraph, node)
 
+    def keep_inside(self, fgraph, node, nd, outside_ins):
+        """
+        Tell if the Elemwise `nd` of the Scan `node` should be recomputed at
+        each step.
+
+        The sequences of the backward scan built by `Scan.L_op` are the
+        traces of the forward loop. Pushing `nd` out of it creates another
+        array holding its outputs for all the steps. When `nd` is cheap to
+        recompute and this array would be larger than
+        ``config.scan.pushout_seqs_max_bytes``, or of unknown size, `nd`
+        stays in the inner graph.
+
+        """
+        max_bytes = aesara.config.scan.pushout_seqs_max_bytes
+        if (
+            max_bytes < 0
+            or not node.op.info.get("recompute_seqs", False)
+            or not is_cheap_to_recompute(nd.op)
+        ):
+            return False
+        sizes = [
+            static_size(fgraph, x)
+            for x in outside_ins
+            if not isinstance(x, aesara.Constant)
+        ]
+        if None in sizes:
+            return True
+        itemsize = sum(np.dtype(out.dtype).itemsize for out in nd.outputs)
+        return max(sizes) * itemsize > max_bytes
+
     def process_node(self, fgraph, node):
         """
         IMPORTANT NOTE: This function uses set and dictionary data structure.
@@ -547,6 +631,9 @@ class PushOutSeqScan(gof.Optimizer):
                     # scan.
                     continue
 
+                if self.keep_inside(fgraph, node, nd, outside_ins):
+                    continue
+
                 to_remove_set.add(nd)
 
                 # Do not call make_node for test_value
@@ -1716,6 +1803,8 @@ class ScanMerge(gof.Optimizer):
         info["as_while"] = as_while
         info["profile"] = nodes[0].op.profile
         info["allow_gc"] = nodes[0].op.allow_gc
+        if all(nd.op.info.get("recompute_seqs", False) for nd in nodes):
+            info["recompute_seqs"] = True
 
         # We keep the inner_ins and inner_outs of each original node separated.
         # To be able to recombine them in the right order after the clone,
@@ -2137,6 +2226,57 @@ def scan_merge_inouts(node):
     return na.outer_outputs
 
 
+@gof.local_optimizer([scan_op.Scan])
+def scan_vectorize_map(node):
+    """
+    Replace a Scan without recurrent state by a vectorized graph.
+
+    A Scan with only sequences, non-sequences and nit-sot outputs (like the
+    ones built by `map`) computes independent steps. Its inner graph is
+    rebuilt with a leading axis over the steps (see
+    `aesara.tensor.vectorize`), so that the whole loop runs as a few large
+    operations. Scans whose inner graph contains an Op without a
+    vectorization rule are left as they are.
+
+    """
+    from aesara.tensor.vectorize import vectorize
+
+    op = node.op
+    if (
+        not isinstance(op, scan_op.Scan)
+        or op.as_while
+        or op.n_seqs == 0
+        or op.n_nit_sot != len(op.outputs)
+        or op.info.get("gpua", False)
+    ):
+        return False
+
+    n_steps = node.inputs[0]
+    outputs = scan_utils.clone(
+        op.outputs,
+        replace=list(zip(op.inner_non_seqs(op.inputs), op.outer_non_seqs(node))),
+    )
+    replace = OrderedDict(
+        (inner, outer[:n_steps])
+        for inner, outer in zip(op.inner_seqs(op.inputs), op.outer_seqs(node))
+    )
+    try:
+        new_outputs = vectorize(outputs, replace, map_fallback=False)
+    except (NotImplementedError, TypeError):
+        return False
+
+    rval = []
+    for old, new in zip(node.outputs, new_outputs):
+        # A broadcastable leading dimension means the steps were not
+        # stacked along it, so the graph would not hold one entry per step.
+        if new.type != old.type or new.broadcastable[0]:
+            return False
+        # Each step must be kept: check that the leading dimension is as
+        # long as the loop instead of trusting the vectorization rules.
+        rval.append(tensor.opt.assert_op(new, tensor.eq(new.shape[0], n_steps)))
+    return rval
+
+
 class PushOutDot1(gof.Optimizer):
     """
     Graph optimizer for Scan(makes it run inplace).
@@ -2384,6 +2524,16 @@ scan_seqopt1.register(
 )
 
 
+# Opt-in only (not in fast_run nor under the "scan" tag): the vectorized
+# graph holds the intermediate results of all the steps at once.
+scan_seqopt1.register(
+    "scan_vectorize_map",
+    opt.in2out(scan_vectorize_map, ignore_newtrees=True),
+    6,
+    "more_mem",
+)
+
+
 scan_eqopt2.register(
     "constant_folding_for_scan2",
     opt.in2out(tensor.opt.constant_folding, ignore_newtrees=True),
@@ -64,7 +64,7 @@ from aesara import gof
 
 
 def get_version():
-    return 0.296
+    return 0.297
 
 @cython.boundscheck(False)
 def perform(
@@ -185,6 +185,8 @@ def perform(
     cdef int pos[500] # put a maximum of 500 outputs
     cdef unsigned int len_store_steps = n_mit_mot + n_mit_sot + n_sit_sot + n_nit_sot
     cdef int store_steps[500]
+    cdef int grow[500]
+    cdef unsigned int n_alloc
     cdef unsigned int l
     cdef unsigned int offset
     cdef int tap
@@ -239,10 +241,32 @@ def perform(
     for idx in range(n_outs + n_nit_sot):
         pos[idx] = (-mintaps[idx])%store_steps[idx]
 
+    # A while loop can stop long before n_steps. Its mit_sot, sit_sot and
+    # nit_sot outputs that keep every step start with a small buffer that
+    # doubles in size when it is full, instead of being allocated for
+    # n_steps. This is also done for the outputs that could be computed
+    # inplace of their initial state.
+    for idx in range(n_outs + n_nit_sot):
+        grow[idx] = (as_while and idx >= n_mit_mot and
+                     store_steps[idx] == n_steps - mintaps[idx] and
+                     store_steps[idx] > 1)
 
     # 2.1 Create storage space for outputs
     for idx in range(n_outs):
-        if destroy_map[idx] != 0:
+        if grow[idx]:
+            # Only the initial state is copied.
+            l = - mintaps[idx]
+            init = args[<unsigned int>(seqs_arg_offset + idx)]
+            n_alloc = min(store_steps[idx], l + self.while_initial_steps)
+            if ( outs[idx][0] is not None and
+                outs[idx][0].shape[1:] == init.shape[1:] and
+                outs[idx][0].shape[0] >= n_alloc ):
+                outs[idx][0] = outs[idx][0][:n_alloc]
+            else:
+                shape = (n_alloc,) + init.shape[1:]
+                outs[idx][0] = node.outputs[idx].type.value_zeros(shape)
+            outs[idx][0][:l] = init[:l]
+        elif destroy_map[idx] != 0:
             # ^ Case 1. Outputs should be computed inplace of their
             # initial state
             outs[idx][0] = args[ <unsigned int>(1+ n_seqs + idx)]
@@ -335,6 +359,14 @@ def perform(
 
         # 4.2. Collect slices for mitsots, sitsots and nitsots
         if i != 0:
+            for idx in range(n_mit_mot, lenpos):
+                if grow[idx] and pos[idx] == outs[idx][0].shape[0]:
+                    old = outs[idx][0]
+                    shape = ((min(2 * old.shape[0], store_steps[idx]),) +
+                             old.shape[1:])
+                    outs[idx][0] = node.outputs[idx].type.value_zeros(shape)
+                    outs[idx][0][:old.shape[0]] = old
+                    old = None
             for idx in range(n_outs + n_nit_sot - n_mit_mot):
                 if ( store_steps[<unsigned int>(idx+n_mit_mot)] == 1 or
                     vector_outs[<unsigned int>(idx+n_mit_mot)] == 1):
@@ -515,15 +547,18 @@ def perform(
 
             if i == 0:
                 jout = j+offset_out
-                shape = (store_steps[j],) + output_storage[jout].storage[0].shape
+                n_alloc = store_steps[j]
+                if grow[j]:
+                    n_alloc = min(n_alloc, self.while_initial_steps)
+                shape = (n_alloc,) + output_storage[jout].storage[0].shape
                 dtype = output_storage[jout].storage[0].dtype
                 if (outs[j][0] is None or
-                        outs[j][0].shape[0] < store_steps[j] or
+                        outs[j][0].shape[0] < n_alloc or
                         outs[j][0].shape[1:] != shape[1:] or
                         outs[j][0].dtype != dtype ):
                     outs[j][0] = node.outputs[j].type.value_zeros(shape)
-                elif outs[j][0].shape[0] != store_steps[j]:
-                    outs[j][0] = outs[j][0][:store_steps[j]]
+                elif outs[j][0].shape[0] != n_alloc:
+                    outs[j][0] = outs[j][0][:n_alloc]
                 outs[j][0][pos[j]] = output_storage[jout].storage[0]
             elif store_steps[j] == 1 or vector_outs[j] == 1:
                 outs[j][0][pos[j]] = output_storage[j+offset_out].storage[0]
@@ -572,7 +607,10 @@ def perform(
     begin = n_mit_mot
     end   = n_outs + n_nit_sot
     for idx in range(begin, end):
-        if ( store_steps[idx] < i-mintaps[idx] and
+        if grow[idx]:
+            # Only the first i steps were computed, return a view on them.
+            outs[idx][0] = outs[idx][0][:<unsigned int>(i - mintaps[idx])]
+        elif ( store_steps[idx] < i-mintaps[idx] and
             pos[idx] < store_steps[idx] ):
 
             pdx = pos[idx]
@@ -2,6 +2,8 @@
 To update the scan Cython code in Aesara you must
 - update the version in this file and scan_perform.py
 - call "cd aesara/scan_module/; cython scan_perform.pyx; patch scan_perform.c numpy_api_changes.diff"
+  (the patch is only needed with Cython older than 0.29)
+- move the generated scan_perform.c to the c_code directory
 
 """
 
@@ -24,7 +26,7 @@ from aesara.gof.compilelock import get_lock, release_lock
 _logger = logging.getLogger("aesara.scan_module.scan_perform")
 
 
-version = 0.296  # must match constant returned in function get_version()
+version = 0.297  # must match constant returned in function get_version()
 
 need_reload = False
 
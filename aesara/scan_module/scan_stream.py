@@ -0,0 +1,261 @@
+"""
+Run a scan over sequences that do not fit in memory.
+
+`scan_stream` compiles one scan over a chunk of the sequences, and the
+returned `StreamingScan` calls it on each chunk in turn, carrying the state
+of the recurrent outputs from one chunk to the next. The sequences can be
+memory-mapped arrays (for instance ``.npy`` files, as loaded by
+`aesara.tensor.io.load` with ``mmap_mode``) or iterables, and the outputs
+can be written to memory-mapped arrays or passed to callbacks, so that
+memory is bounded by the chunk size.
+
+"""
+
+import itertools
+import logging
+
+import numpy as np
+
+import aesara
+from aesara.compile import SharedVariable
+
+
+_logger = logging.getLogger("aesara.scan_module.scan_stream")
+
+
+class StreamingScan:
+    """
+    A scan compiled to be evaluated chunk by chunk.
+
+    Use `scan_stream` to build it.
+
+    Parameters
+    ----------
+    fn
+        The compiled function of one chunk. Its inputs are the chunks of the
+        sequences, the initial states and the non-sequences, and its outputs
+        the outputs of the scan over the chunk.
+    n_seqs
+        The number of sequences.
+    n_outs
+        The number of outputs of the scan.
+    state_idx
+        The index, among the outputs, of each recurrent output.
+    chunk_size
+        The number of steps computed by each call to `fn`.
+
+    """
+
+    def __init__(self, fn, n_seqs, n_outs, state_idx, chunk_size):
+        self.fn = fn
+        self.n_seqs = n_seqs
+        self.n_outs = n_outs
+        self.state_idx = state_idx
+        self.chunk_size = chunk_size
+
+    def _chunks(self, seq):
+        """Yield the chunks of `seq`, an array, a .npy path or an iterable."""
+        if isinstance(seq, str):
+            seq = np.load(seq, mmap_mode="r")
+        if hasattr(seq, "shape") and hasattr(seq, "__getitem__"):
+            for start in range(0, seq.shape[0], self.chunk_size):
+                yield seq[start : start + self.chunk_size]
+        else:
+            it = iter(seq)
+            while True:
+                steps = list(itertools.islice(it, self.chunk_size))
+                if not steps:
+                    return
+                yield np.asarray(steps)
+
+    def __call__(self, sequences, outputs_info=None, non_sequences=None, sinks=None):
+        """
+        Run the scan over the whole `sequences`.
+
+        Parameters
+        ----------
+        sequences
+            One value per sequence: an array (a `numpy.memmap` is read one
+            chunk at a time), the path of a ``.npy`` file, which is
+            memory-mapped, or an iterable over the steps of the sequence.
+            The scan stops at the end of the shortest sequence.
+        outputs_info
+            The initial value of each recurrent output.
+        non_sequences
+            The value of each non-sequence that is not a shared variable or a
+            constant.
+        sinks
+            Where to write each output of the scan. None collects the
+            output in memory; an array (e.g. a `numpy.memmap`) receives the
+            steps in order; a callable is called with each chunk of the
+            output, as it is computed. That chunk can be overwritten by the
+            next one, so the callable must copy what it keeps.
+
+        Returns
+        -------
+        list
+            One element per output: the whole output if its sink is None,
+            the sink if it is an array, and the last computed step if the
+            sink is a callable.
+
+        """
+        if len(sequences) != self.n_seqs:
+            raise ValueError(
+                "Expected %d sequences, got %d" % (self.n_seqs, len(sequences))
+            )
+        states = [np.asarray(s) for s in (outputs_info or [])]
+        if len(states) != len(self.state_idx):
+            raise ValueError(
+                "Expected %d initial states, got %d"
+                % (len(self.state_idx), len(states))
+            )
+        non_sequences = list(non_sequences or [])
+        n_outs = self.n_outs
+        if sinks is None:
+            sinks = [None] * n_outs
+        if len(sinks) != n_outs:
+            raise ValueError("Expected %d sinks, got %d" % (n_outs, len(sinks)))
+
+        collected = [[] for _ in range(n_outs)]
+        last = [None] * n_outs
+        pos = 0
+        for chunks in zip(*[self._chunks(s) for s in sequences]):
+            n_steps = min(len(c) for c in chunks)
+            if n_steps == 0:
+                break
+            chunks = [c[:n_steps] for c in chunks]
+            outs = self.fn(*(chunks + states + non_sequences))
+            for i, (out, sink) in enumerate(zip(outs, sinks)):
+                if sink is None:
+                    collected[i].append(np.array(out))
+                elif callable(sink):
+                    sink(out)
+                    last[i] = np.array(out[-1])
+                else:
+                    sink[pos : pos + n_steps] = out
+            # The function can reuse its output storage in the next call.
+            states = [np.array(outs[i][-1]) for i in self.state_idx]
+            pos += n_steps
+            _logger.debug("streamed %d steps", pos)
+
+        rval = []
+        for i, sink in enumerate(sinks):
+            if sink is None:
+                if not collected[i]:
+                    raise ValueError("scan_stream needs at least one step")
+                rval.append(np.concatenate(collected[i]))
+            elif callable(sink):
+                rval.append(last[i])
+            else:
+                if hasattr(sink, "flush"):
+                    sink.flush()
+                rval.append(sink)
+        return rval
+
+
+def scan_stream(
+    fn,
+    sequences,
+    outputs_info=None,
+    non_sequences=None,
+    chunk_size=1024,
+    mode=None,
+    name="stream_fn",
+):
+    """
+    Compile a scan to run over sequences that do not fit in memory.
+
+    The arguments have the same meaning as for :func:`~aesara.scan`, with
+    the restrictions of :func:`~aesara.scan_checkpoints`: every sequence is
+    iterated one step at a time and the recurrent outputs only use their
+    previous step (no taps).
+
+    Parameters
+    ----------
+    fn
+        The function computing one step, as for :func:`~aesara.scan`.
+    sequences
+        The sequences, as symbolic variables. They only give the type of
+        the values passed when calling the result.
+    outputs_info
+        The initial state of each recurrent output, as a symbolic variable
+        giving its type, or None for the outputs that are not recurrent.
+    non_sequences
+        The inputs that are the same at every step. They must be inputs of
+        the graph: variables without owner, shared variables or constants.
+    chunk_size
+        The number of steps loaded and computed at once. The memory used is
+        proportional to it.
+    mode
+        The compilation mode of the function computing one chunk.
+    name
+        The name of the scan.
+
+    Returns
+    -------
+    StreamingScan
+        Call it with the values of the sequences, initial states and
+        non-sequences to run the scan, chunk by chunk.
+
+    See Also
+    --------
+    :func:`~aesara.scan`: Looping in Aesara.
+
+    """
+    if not isinstance(sequences, list):
+        sequences = [sequences]
+    if not sequences:
+        raise ValueError("scan_stream needs at least one sequence")
+    if outputs_info is None:
+        outputs_info = []
+    elif not isinstance(outputs_info, list):
+        outputs_info = [outputs_info]
+    if non_sequences is None:
+        non_sequences = []
+    elif not isinstance(non_sequences, list):
+        non_sequences = [non_sequences]
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive, got %s" % chunk_size)
+
+    for element in outputs_info:
+        if isinstance(element, dict):
+            raise RuntimeError("scan_stream doesn't work with taps.")
+
+    tt = aesara.tensor
+    seq_chunks = [tt.as_tensor_variable(s).type() for s in sequences]
+    init_states = [
+        tt.as_tensor_variable(o).type() for o in outputs_info if o is not None
+    ]
+    states = list(init_states)
+    i_outputs_info = [None if o is None else states.pop(0) for o in outputs_info]
+
+    results, updates = aesara.scan(
+        fn=fn,
+        sequences=seq_chunks,
+        outputs_info=i_outputs_info or None,
+        non_sequences=non_sequences,
+        name=name,
+    )
+    if not isinstance(results, list):
+        results = [results]
+    if outputs_info and len(results) != len(outputs_info):
+        raise ValueError(
+            "fn returned %d outputs, but outputs_info has %d elements"
+            % (len(results), len(outputs_info))
+        )
+    state_idx = [i for i, o in enumerate(outputs_info) if o is not None]
+
+    # Shared variables and constants are not inputs of the function.
+    non_seq_inputs = [
+        v
+        for v in non_sequences
+        if not isinstance(v, (SharedVariable, aesara.gof.Constant))
+    ]
+    f = aesara.function(
+        seq_chunks + init_states + non_seq_inputs,
+        results,
+        updates=updates,
+        mode=mode,
+        name=name,
+    )
+    return StreamingScan(f, len(sequences), len(results), state_idx, chunk_size)
@@ -867,6 +867,8 @@ def compress_outs(op, not_required, inputs):
     info["as_while"] = op.info["as_while"]
     info["profile"] = op.info["profile"]
     info["allow_gc"] = op.info["allow_gc"]
+    if "recompute_seqs" in op.info:
+        info["recompute_seqs"] = op.info["recompute_seqs"]
 
     op_inputs = op.inputs[: op.n_seqs]
     op_outputs = []
@@ -1132,6 +1134,7 @@ class scan_args:
             "as_while",
             "profile",
             "allow_gc",
+            "recompute_seqs",
         ):
             if k in info:
                 self.other_info[k] = info[k]
@@ -57,6 +57,7 @@ from aesara.tensor.var import (
     TensorVariable,
     _tensor_py_operators,
 )
+from aesara.tensor.vectorize import register_vectorize, vectorize
 
 
 # These imports cannot be performed here because the modules depend on tensor.  This is done at the
@@ -16,7 +16,7 @@ from aesara import scalar as scal
 
 # For history
 from aesara.compile import Rebroadcast, Shape, shape
-from aesara.gof import Apply, Constant, Op, ParamsType, Variable
+from aesara.gof import Apply, Constant, Op, OpenMPOp, ParamsType, Variable
 from aesara.gof.type import Generic
 
 # We use these exceptions as well.
@@ -1339,10 +1339,13 @@ def cast(x, dtype):
 ##########################
 
 
-class MaxAndArgmax(Op):
+class MaxAndArgmax(OpenMPOp):
     """
     Calculate the max and argmax over a given axis or over all axes.
 
+    If `openmp` is True, the C code computes them in parallel for large
+    inputs. It defaults to the ``openmp`` flag.
+
     """
 
     nin = 2  # tensor, axis
@@ -1352,8 +1355,12 @@ class MaxAndArgmax(Op):
     __props__ = ("axis",)
     _f16_ok = True
 
-    def __init__(self, axis):
+    # The number of elements reduced by one task of the parallel loop.
+    _openmp_chunk_size = 4096
+
+    def __init__(self, axis, openmp=None):
         assert isinstance(axis, list)
+        super().__init__(openmp=openmp)
         self.axis = tuple(axis)
 
     def get_params(self, node):
@@ -1433,6 +1440,7 @@ class MaxAndArgmax(Op):
             %(fail)s
         }
 
+        %(parallel_code)s
         Py_CLEAR(%(max)s);
         Py_CLEAR(%(argmax)s);//todo pass them as out parameter.
 
@@ -1466,11 +1474,169 @@ class MaxAndArgmax(Op):
             Py_DECREF(%(argmax)s);
             %(argmax)s = (PyArrayObject*)tmp;
         }
+        %(parallel_end)s
         """
+        dtype = node.inputs[0].type.dtype
+        if (
+            self.openmp
+            and dtype in discrete_dtypes + ["float32", "float64"]
+            # The parallel loop needs a dimension to reduce.
+            and len(self.axis) > 0
+        ):
+            parallel_code = self._c_parallel_code(node, x, out, fail)
+            parallel_end = "}"
+        else:
+            parallel_code = parallel_end = ""
         return ret % locals()
 
+    def _c_parallel_code(self, node, x, out, fail):
+        """
+        Return the C code computing the max and argmax of large inputs with
+        OpenMP, followed by the beginning of the else block of the NumPy
+        implementation.
+
+        The reduced elements of each output are split in chunks of
+        `_openmp_chunk_size` elements, that the threads reduce separately.
+        The partial results are then combined pairwise, keeping the first
+        maximum (or the first NaN, as NumPy does), so the result does not
+        depend on the number of threads.
+
+        """
+        ndim = node.inputs[0].type.ndim
+        red = sorted(a + ndim if a < 0 else a for a in self.axis)
+        kept = [d for d in range(ndim) if d not in red]
+        return """
+        if (PyArray_SIZE(%(x)s) > 0 && PyArray_SIZE(%(x)s) >= %(minsize)s) {
+        const npy_intp chunk = %(chunk)s;
+        const int n_kept = %(n_kept)s;
+        const int n_red = %(n_red)s;
+        const int kept_axes[] = {%(kept_axes)s};
+        const int red_axes[] = {%(red_axes)s};
+        npy_intp kept_dims[%(kept_size)s], kept_strides[%(kept_size)s];
+        npy_intp red_dims[%(n_red)s], red_strides[%(n_red)s];
+        npy_intp n_out = 1;
+        npy_intp n_elems = 1;
+        for (int k = 0; k < n_kept; ++k) {
+            kept_dims[k] = PyArray_DIMS(%(x)s)[kept_axes[k]];
+            kept_strides[k] = PyArray_STRIDES(%(x)s)[kept_axes[k]];
+            n_out *= kept_dims[k];
+        }
+        for (int k = 0; k < n_red; ++k) {
+            red_dims[k] = PyArray_DIMS(%(x)s)[red_axes[k]];
+            red_strides[k] = PyArray_STRIDES(%(x)s)[red_axes[k]];
+            n_elems *= red_dims[k];
+        }
+        Py_CLEAR(%(max)s);
+        Py_CLEAR(%(argmax)s);
+        %(max)s = (PyArrayObject*)PyArray_EMPTY(
+            n_kept, kept_dims, PyArray_TYPE(%(x)s), 0);
+        %(argmax)s = (PyArrayObject*)PyArray_EMPTY(n_kept, kept_dims, NPY_INT64, 0);
+        if (%(max)s == NULL || %(argmax)s == NULL) {
+            %(fail)s
+        }
+        dtype_%(x)s* max_data = (dtype_%(x)s*)PyArray_DATA(%(max)s);
+        npy_int64* argmax_data = (npy_int64*)PyArray_DATA(%(argmax)s);
+        const npy_intp n_chunks = (n_elems + chunk - 1) / chunk;
+        const npy_intp n_tasks = n_out * n_chunks;
+        dtype_%(x)s* partial = (dtype_%(x)s*)malloc(
+            n_tasks * sizeof(dtype_%(x)s));
+        npy_intp* partial_idx = (npy_intp*)malloc(n_tasks * sizeof(npy_intp));
+        if (partial == NULL || partial_idx == NULL) {
+            free(partial);
+            free(partial_idx);
+            PyErr_NoMemory();
+            %(fail)s
+        }
+
+        // Find the first maximum of each chunk of each output. The reduced
+        // dimensions are walked in C order, so the indices are those of
+        // NumPy.
+        #pragma omp parallel for schedule(static)
+        for (npy_intp t = 0; t < n_tasks; ++t) {
+            const npy_intp start = (t %% n_chunks) * chunk;
+            const npy_intp end = start + chunk < n_elems ? start + chunk : n_elems;
+            const char* p = PyArray_BYTES(%(x)s);
+            npy_intp rem = t / n_chunks;
+            for (int k = n_kept - 1; k >= 0; --k) {
+                p += (rem %% kept_dims[k]) * kept_strides[k];
+                rem /= kept_dims[k];
+            }
+            npy_intp idx[%(n_red)s];
+            rem = start;
+            for (int k = n_red - 1; k >= 0; --k) {
+                idx[k] = rem %% red_dims[k];
+                p += idx[k] * red_strides[k];
+                rem /= red_dims[k];
+            }
+            const npy_intp inner_dim = red_dims[n_red - 1];
+            const npy_intp inner_stride = red_strides[n_red - 1];
+            dtype_%(x)s best = *(const dtype_%(x)s*)p;
+            npy_intp best_idx = start;
+            npy_intp j = start;
+            while (j < end) {
+                npy_intp run = inner_dim - idx[n_red - 1];
+                if (run > end - j)
+                    run = end - j;
+                for (npy_intp r = 0; r < run; ++r) {
+                    const dtype_%(x)s v = *(const dtype_%(x)s*)(p + r * inner_stride);
+                    if (v > best || (v != v && best == best)) {
+                        best = v;
+                        best_idx = j + r;
+                    }
+                }
+                j += run;
+                p += run * inner_stride;
+                idx[n_red - 1] += run;
+                for (int k = n_red - 1; k > 0 && idx[k] == red_dims[k]; --k) {
+                    p += red_strides[k - 1] - red_dims[k] * red_strides[k];
+                    idx[k] = 0;
+                    idx[k - 1] += 1;
+                }
+            }
+            partial[t] = best;
+            partial_idx[t] = best_idx;
+        }
+
+        // Combine the chunks of each output pairwise. The left one comes
+        // first, so it is kept when they are equal.
+        #pragma omp parallel for schedule(static)
+        for (npy_intp o = 0; o < n_out; ++o) {
+            dtype_%(x)s* part = partial + o * n_chunks;
+            npy_intp* part_idx = partial_idx + o * n_chunks;
+            for (npy_intp width = 1; width < n_chunks; width *= 2) {
+                for (npy_intp i = 0; i + width < n_chunks; i += 2 * width) {
+                    const dtype_%(x)s l = part[i];
+                    const dtype_%(x)s r = part[i + width];
+                    if (r > l || (r != r && l == l)) {
+                        part[i] = r;
+                        part_idx[i] = part_idx[i + width];
+                    }
+                }
+            }
+            max_data[o] = part[0];
+            argmax_data[o] = part_idx[0];
+        }
+        free(partial);
+        free(partial_idx);
+        } else {
+        """ % dict(
+            x=x,
+            max=out[0],
+            argmax=out[1],
+            fail=fail,
+            minsize=config.openmp_elemwise_minsize,
+            chunk=self._openmp_chunk_size,
+            n_kept=len(kept),
+            n_red=len(red),
+            kept_axes=", ".join(map(str, kept)) or "0",
+            red_axes=", ".join(map(str, red)),
+            kept_size=len(kept) or 1,
+        )
+
     def c_code_cache_version(self):
-        return (5,)
+        if self.openmp:
+            return (6, "openmp", config.openmp_elemwise_minsize)
+        return (6,)
 
     def infer_shape(self, node, shapes):
         ishape = shapes[0]
@@ -3310,7 +3476,9 @@ pprint.assign(tensor_copy, printing.IgnorePrinter())
 
 
 @constructor
-def sum(input, axis=None, dtype=None, keepdims=False, acc_dtype=None):
+def sum(
+    input, axis=None, dtype=None, keepdims=False, acc_dtype=None, summation="naive"
+):
     """
     Computes the sum along the given axis(es) of a tensor `input`.
 
@@ -3327,10 +3495,14 @@ def sum(input, axis=None, dtype=None, keepdims=False, acc_dtype=None):
         If this is set to True, the axes which are reduced are left in
         the result as dimensions with size one. With this option, the result
         will broadcast correctly against the original tensor.
+    summation: {"naive", "pairwise", "kahan"}
+        How the C code sums floats, see ``tensor.elemwise.Sum``.
 
     """
 
-    out = elemwise.Sum(axis=axis, dtype=dtype, acc_dtype=acc_dtype)(input)
+    out = elemwise.Sum(
+        axis=axis, dtype=dtype, acc_dtype=acc_dtype, summation=summation
+    )(input)
 
     if keepdims:
         out = makeKeepDims(input, out, axis)
@@ -729,14 +729,14 @@ class GemmRelated(Op):
                 //double t0 = time_time();
                 switch(unit)
                 {
-                    case 0x000: sgemm_(&N, &N, &Nz1, &Nz0, &Nx1, &a, y, &sy_0, x, &sx_0, &b, z, &sz_0); break;
-                    case 0x100: sgemm_(&N, &T, &Nz1, &Nz0, &Nx1, &a, y, &sy_0, x, &sx_1, &b, z, &sz_0); break;
-                    case 0x010: sgemm_(&T, &N, &Nz1, &Nz0, &Nx1, &a, y, &sy_1, x, &sx_0, &b, z, &sz_0); break;
-                    case 0x110: sgemm_(&T, &T, &Nz1, &Nz0, &Nx1, &a, y, &sy_1, x, &sx_1, &b, z, &sz_0); break;
-                    case 0x001: sgemm_(&T, &T, &Nz0, &Nz1, &Nx1, &a, x, &sx_0, y, &sy_0, &b, z, &sz_1); break;
-                    case 0x101: sgemm_(&N, &T, &Nz0, &Nz1, &Nx1, &a, x, &sx_1, y, &sy_0, &b, z, &sz_1); break;
-                    case 0x011: sgemm_(&T, &N, &Nz0, &Nz1, &Nx1, &a, x, &sx_0, y, &sy_1, &b, z, &sz_1); break;
-                    case 0x111: sgemm_(&N, &N, &Nz0, &Nz1, &Nx1, &a, x, &sx_1, y, &sy_1, &b, z, &sz_1); break;
+                    case 0x000: AESARA_BLAS_NOGIL(sgemm_(&N, &N, &Nz1, &Nz0, &Nx1, &a, y, &sy_0, x, &sx_0, &b, z, &sz_0)); break;
+                    case 0x100: AESARA_BLAS_NOGIL(sgemm_(&N, &T, &Nz1, &Nz0, &Nx1, &a, y, &sy_0, x, &sx_1, &b, z, &sz_0)); break;
+                    case 0x010: AESARA_BLAS_NOGIL(sgemm_(&T, &N, &Nz1, &Nz0, &Nx1, &a, y, &sy_1, x, &sx_0, &b, z, &sz_0)); break;
+                    case 0x110: AESARA_BLAS_NOGIL(sgemm_(&T, &T, &Nz1, &Nz0, &Nx1, &a, y, &sy_1, x, &sx_1, &b, z, &sz_0)); break;
+                    case 0x001: AESARA_BLAS_NOGIL(sgemm_(&T, &T, &Nz0, &Nz1, &Nx1, &a, x, &sx_0, y, &sy_0, &b, z, &sz_1)); break;
+                    case 0x101: AESARA_BLAS_NOGIL(sgemm_(&N, &T, &Nz0, &Nz1, &Nx1, &a, x, &sx_1, y, &sy_0, &b, z, &sz_1)); break;
+                    case 0x011: AESARA_BLAS_NOGIL(sgemm_(&T, &N, &Nz0, &Nz1, &Nx1, &a, x, &sx_0, y, &sy_1, &b, z, &sz_1)); break;
+                    case 0x111: AESARA_BLAS_NOGIL(sgemm_(&N, &N, &Nz0, &Nz1, &Nx1, &a, x, &sx_1, y, &sy_1, &b, z, &sz_1)); break;
                     default: PyErr_SetString(PyExc_ValueError, "some matrix has no unit stride"); %(fail)s;
                 };
                 //fprintf(stderr, "Calling sgemm %%i %%i %%i %%i took %%f\\n", unit, Nz1, Nz0, Nx1, time_time() - t0);
@@ -768,22 +768,22 @@ class GemmRelated(Op):
                 //);
                 switch(unit)
                 {
-                    case 0x000: dgemm_(&N, &N, &Nz1, &Nz0, &Nx1, &a, y,
-                                       &sy_0, x, &sx_0, &b, z, &sz_0); break;
-                    case 0x100: dgemm_(&N, &T, &Nz1, &Nz0, &Nx1, &a, y,
-                                       &sy_0, x, &sx_1, &b, z, &sz_0); break;
-                    case 0x010: dgemm_(&T, &N, &Nz1, &Nz0, &Nx1, &a, y,
-                                       &sy_1, x, &sx_0, &b, z, &sz_0); break;
-                    case 0x110: dgemm_(&T, &T, &Nz1, &Nz0, &Nx1, &a, y,
-                                       &sy_1, x, &sx_1, &b, z, &sz_0); break;
-                    case 0x001: dgemm_(&T, &T, &Nz0, &Nz1, &Nx1, &a, x,
-                                       &sx_0, y, &sy_0, &b, z, &sz_1); break;
-                    case 0x101: dgemm_(&N, &T, &Nz0, &Nz1, &Nx1, &a, x,
-                                       &sx_1, y, &sy_0, &b, z, &sz_1); break;
-                    case 0x011: dgemm_(&T, &N, &Nz0, &Nz1, &Nx1, &a, x,
-                                       &sx_0, y, &sy_1, &b, z, &sz_1); break;
-                    case 0x111: dgemm_(&N, &N, &Nz0, &Nz1, &Nx1, &a, x,
-                                       &sx_1, y, &sy_1, &b, z, &sz_1); break;
+                    case 0x000: AESARA_BLAS_NOGIL(dgemm_(&N, &N, &Nz1, &Nz0, &Nx1, &a, y,
+                                                         &sy_0, x, &sx_0, &b, z, &sz_0)); break;
+                    case 0x100: AESARA_BLAS_NOGIL(dgemm_(&N, &T, &Nz1, &Nz0, &Nx1, &a, y,
+                                                         &sy_0, x, &sx_1, &b, z, &sz_0)); break;
+                    case 0x010: AESARA_BLAS_NOGIL(dgemm_(&T, &N, &Nz1, &Nz0, &Nx1, &a, y,
+                                                         &sy_1, x, &sx_0, &b, z, &sz_0)); break;
+                    case 0x110: AESARA_BLAS_NOGIL(dgemm_(&T, &T, &Nz1, &Nz0, &Nx1, &a, y,
+                                                         &sy_1, x, &sx_1, &b, z, &sz_0)); break;
+                    case 0x001: AESARA_BLAS_NOGIL(dgemm_(&T, &T, &Nz0, &Nz1, &Nx1, &a, x,
+                                                         &sx_0, y, &sy_0, &b, z, &sz_1)); break;
+                    case 0x101: AESARA_BLAS_NOGIL(dgemm_(&N, &T, &Nz0, &Nz1, &Nx1, &a, x,
+                                                         &sx_1, y, &sy_0, &b, z, &sz_1)); break;
+                    case 0x011: AESARA_BLAS_NOGIL(dgemm_(&T, &N, &Nz0, &Nz1, &Nx1, &a, x,
+                                                         &sx_0, y, &sy_1, &b, z, &sz_1)); break;
+                    case 0x111: AESARA_BLAS_NOGIL(dgemm_(&N, &N, &Nz0, &Nz1, &Nx1, &a, x,
+                                                         &sx_1, y, &sy_1, &b, z, &sz_1)); break;
                     default: PyErr_SetString(PyExc_ValueError,
                                              "some matrix has no unit stride");
                              %(fail)s;
@@ -832,7 +832,7 @@ class GemmRelated(Op):
         )
 
     def build_gemm_version(self):
-        return (13, blas_header_version())
+        return (14, blas_header_version())
 
 
 class Gemm(GemmRelated):
@@ -2205,14 +2205,14 @@ class BatchedDot(Op):
             for (int i = 0; i < Nz[0]; i++) {
                 switch(unit)
                 {
-                    case 0x000: gemm(&N, &N, &Nz2, &Nz1, &Nx2, &a, y, &sy_1, x, &sx_1, &b, z, &sz_1); break;
-                    case 0x100: gemm(&N, &T, &Nz2, &Nz1, &Nx2, &a, y, &sy_1, x, &sx_2, &b, z, &sz_1); break;
-                    case 0x010: gemm(&T, &N, &Nz2, &Nz1, &Nx2, &a, y, &sy_2, x, &sx_1, &b, z, &sz_1); break;
-                    case 0x110: gemm(&T, &T, &Nz2, &Nz1, &Nx2, &a, y, &sy_2, x, &sx_2, &b, z, &sz_1); break;
-                    case 0x001: gemm(&T, &T, &Nz1, &Nz2, &Nx2, &a, x, &sx_1, y, &sy_1, &b, z, &sz_2); break;
-                    case 0x101: gemm(&N, &T, &Nz1, &Nz2, &Nx2, &a, x, &sx_2, y, &sy_1, &b, z, &sz_2); break;
-                    case 0x011: gemm(&T, &N, &Nz1, &Nz2, &Nx2, &a, x, &sx_1, y, &sy_2, &b, z, &sz_2); break;
-                    case 0x111: gemm(&N, &N, &Nz1, &Nz2, &Nx2, &a, x, &sx_2, y, &sy_2, &b, z, &sz_2); break;
+                    case 0x000: AESARA_BLAS_NOGIL(gemm(&N, &N, &Nz2, &Nz1, &Nx2, &a, y, &sy_1, x, &sx_1, &b, z, &sz_1)); break;
+                    case 0x100: AESARA_BLAS_NOGIL(gemm(&N, &T, &Nz2, &Nz1, &Nx2, &a, y, &sy_1, x, &sx_2, &b, z, &sz_1)); break;
+                    case 0x010: AESARA_BLAS_NOGIL(gemm(&T, &N, &Nz2, &Nz1, &Nx2, &a, y, &sy_2, x, &sx_1, &b, z, &sz_1)); break;
+                    case 0x110: AESARA_BLAS_NOGIL(gemm(&T, &T, &Nz2, &Nz1, &Nx2, &a, y, &sy_2, x, &sx_2, &b, z, &sz_1)); break;
+                    case 0x001: AESARA_BLAS_NOGIL(gemm(&T, &T, &Nz1, &Nz2, &Nx2, &a, x, &sx_1, y, &sy_1, &b, z, &sz_2)); break;
+                    case 0x101: AESARA_BLAS_NOGIL(gemm(&N, &T, &Nz1, &Nz2, &Nx2, &a, x, &sx_2, y, &sy_1, &b, z, &sz_2)); break;
+                    case 0x011: AESARA_BLAS_NOGIL(gemm(&T, &N, &Nz1, &Nz2, &Nx2, &a, x, &sx_1, y, &sy_2, &b, z, &sz_2)); break;
+                    case 0x111: AESARA_BLAS_NOGIL(gemm(&N, &N, &Nz1, &Nz2, &Nx2, &a, x, &sx_2, y, &sy_2, &b, z, &sz_2)); break;
                     default: PyErr_SetString(PyExc_ValueError, "some matrix has no unit stride"); return 1;
                 };
                 x += Sx[0] / type_size;
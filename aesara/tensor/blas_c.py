@@ -267,18 +267,18 @@ def ger_c_code(A, a, x, y, Z, fail, params):
                 if (PyArray_DESCR(%(Z)s)->type_num == NPY_FLOAT)
                 {
                     float alpha = ((dtype_%(a)s*)PyArray_DATA(%(a)s))[0];
-                    sger_(&Nz0, &Nz1, &alpha,
-                        (float*)x_data, &Sx,
-                        (float*)y_data, &Sy,
-                        (float*)(PyArray_DATA(%(Z)s)), &Sz1);
+                    AESARA_BLAS_NOGIL(sger_(&Nz0, &Nz1, &alpha,
+                                          (float*)x_data, &Sx,
+                                          (float*)y_data, &Sy,
+                                          (float*)(PyArray_DATA(%(Z)s)), &Sz1));
                 }
                 else if (PyArray_DESCR(%(Z)s)->type_num == NPY_DOUBLE)
                 {
                     double alpha = ((dtype_%(a)s*)PyArray_DATA(%(a)s))[0];
-                    dger_(&Nz0, &Nz1, &alpha,
-                        (double*)x_data, &Sx,
-                        (double*)y_data, &Sy,
-                        (double*)(PyArray_DATA(%(Z)s)), &Sz1);
+                    AESARA_BLAS_NOGIL(dger_(&Nz0, &Nz1, &alpha,
+                                          (double*)x_data, &Sx,
+                                          (double*)y_data, &Sy,
+                                          (double*)(PyArray_DATA(%(Z)s)), &Sz1));
 
 
                 }
@@ -293,18 +293,18 @@ def ger_c_code(A, a, x, y, Z, fail, params):
                 if (PyArray_DESCR(%(Z)s)->type_num == NPY_FLOAT)
                 {
                     float alpha = ((dtype_%(a)s*)(PyArray_DATA(%(a)s)))[0];
-                    sger_(&Nz1, &Nz0, &alpha,
-                        (float*)y_data, &Sy,
-                        (float*)x_data, &Sx,
-                        (float*)(PyArray_DATA(%(Z)s)), &Sz0);
+                    AESARA_BLAS_NOGIL(sger_(&Nz1, &Nz0, &alpha,
+                                          (float*)y_data, &Sy,
+                                          (float*)x_data, &Sx,
+                                          (float*)(PyArray_DATA(%(Z)s)), &Sz0));
                 }
                 else if (PyArray_DESCR(%(Z)s)->type_num == NPY_DOUBLE)
                 {
                     double alpha = ((dtype_%(a)s*)PyArray_DATA(%(a)s))[0];
-                    dger_(&Nz1, &Nz0, &alpha,
-                        (double*)y_data, &Sy,
-                        (double*)x_data, &Sx,
-                        (double*)(PyArray_DATA(%(Z)s)), &Sz0);
+                    AESARA_BLAS_NOGIL(dger_(&Nz1, &Nz0, &alpha,
+                                          (double*)y_data, &Sy,
+                                          (double*)x_data, &Sx,
+                                          (double*)(PyArray_DATA(%(Z)s)), &Sz0));
                 }
                 else
                 {
@@ -340,7 +340,7 @@ class CGer(BaseBLAS, Ger):
         return code
 
     def c_code_cache_version(self):
-        return (11, blas_header_version())
+        return (12, blas_header_version())
 
 
 cger_inplace = CGer(True)
@@ -498,22 +498,22 @@ def gemv_c_code(y, A, x, z, alpha, beta, fail, force_init_beta=False, params=Non
                 if (PyArray_DESCR(%(A)s)->type_num == NPY_FLOAT)
                 {
                     float alpha = ((dtype_%(alpha)s*)PyArray_DATA(%(alpha)s))[0];
-                    sgemv_(&NOTRANS, &NA0, &NA1,
-                        &alpha,
-                        (float*)(PyArray_DATA(%(A)s)), &SA1,
-                        (float*)x_data, &Sx,
-                        &fbeta,
-                        (float*)z_data, &Sz);
+                    AESARA_BLAS_NOGIL(sgemv_(&NOTRANS, &NA0, &NA1,
+                                          &alpha,
+                                          (float*)(PyArray_DATA(%(A)s)), &SA1,
+                                          (float*)x_data, &Sx,
+                                          &fbeta,
+                                          (float*)z_data, &Sz));
                 }
                 else if (PyArray_DESCR(%(A)s)->type_num == NPY_DOUBLE)
                 {
                     double alpha = ((dtype_%(alpha)s*)PyArray_DATA(%(alpha)s))[0];
-                    dgemv_(&NOTRANS, &NA0, &NA1,
-                        &alpha,
-                        (double*)(PyArray_DATA(%(A)s)), &SA1,
-                        (double*)x_data, &Sx,
-                        &dbeta,
-                        (double*)z_data, &Sz);
+                    AESARA_BLAS_NOGIL(dgemv_(&NOTRANS, &NA0, &NA1,
+                                          &alpha,
+                                          (double*)(PyArray_DATA(%(A)s)), &SA1,
+                                          (double*)x_data, &Sx,
+                                          &dbeta,
+                                          (double*)z_data, &Sz));
                 }
                 else
                 {
@@ -538,18 +538,18 @@ def gemv_c_code(y, A, x, z, alpha, beta, fail, force_init_beta=False, params=Non
                         } else {
                           z_data[0] = 0.f;
                         }
-                        z_data[0] += alpha*sdot_(&NA1,
-                              (float*)(PyArray_DATA(%(A)s)), &SA1,
-                              (float*)x_data, &Sx);
+                        AESARA_BLAS_NOGIL(z_data[0] += alpha*sdot_(&NA1,
+                                                (float*)(PyArray_DATA(%(A)s)), &SA1,
+                                                (float*)x_data, &Sx));
                     }
                     else
                     {
-                        sgemv_(&TRANS, &NA1, &NA0,
-                            &alpha,
-                            (float*)(PyArray_DATA(%(A)s)), &SA0,
-                            (float*)x_data, &Sx,
-                            &fbeta,
-                            (float*)z_data, &Sz);
+                        AESARA_BLAS_NOGIL(sgemv_(&TRANS, &NA1, &NA0,
+                                              &alpha,
+                                              (float*)(PyArray_DATA(%(A)s)), &SA0,
+                                              (float*)x_data, &Sx,
+                                              &fbeta,
+                                              (float*)z_data, &Sz));
                     }
                 }
                 else if (PyArray_DESCR(%(A)s)->type_num == NPY_DOUBLE)
@@ -566,18 +566,18 @@ def gemv_c_code(y, A, x, z, alpha, beta, fail, force_init_beta=False, params=Non
                         } else {
                           z_data[0] = 0.;
                         }
-                        z_data[0] += alpha*ddot_(&NA1,
-                              (double*)(PyArray_DATA(%(A)s)), &SA1,
-                              (double*)x_data, &Sx);
+                        AESARA_BLAS_NOGIL(z_data[0] += alpha*ddot_(&NA1,
+                                                (double*)(PyArray_DATA(%(A)s)), &SA1,
+                                                (double*)x_data, &Sx));
                     }
                     else
                     {
-                        dgemv_(&TRANS, &NA1, &NA0,
-                            &alpha,
-                            (double*)(PyArray_DATA(%(A)s)), &SA0,
-                            (double*)x_data, &Sx,
-                            &dbeta,
-                            (double*)z_data, &Sz);
+                        AESARA_BLAS_NOGIL(dgemv_(&TRANS, &NA1, &NA0,
+                                              &alpha,
+                                              (double*)(PyArray_DATA(%(A)s)), &SA0,
+                                              (double*)x_data, &Sx,
+                                              &dbeta,
+                                              (double*)z_data, &Sz));
                     }
                 }
                 else
@@ -636,7 +636,7 @@ class CGemv(BaseBLAS, Gemv):
         return code
 
     def c_code_cache_version(self):
-        return (14, blas_header_version(), check_force_gemv_init())
+        return (15, blas_header_version(), check_force_gemv_init())
 
 
 cgemv_inplace = CGemv(inplace=True)
@@ -1010,6 +1010,27 @@ def blas_header_text():
                     """
             )
 
+    # Run the BLAS calls without the GIL, so that independent nodes can run
+    # them concurrently on the threads of the VM. The NumPy implementation
+    # of the BLAS functions uses the Python C-API, so it keeps the GIL.
+    if config.blas.ldflags:
+        header += textwrap.dedent(
+            """\
+            #ifndef AESARA_BLAS_NOGIL
+            #define AESARA_BLAS_NOGIL(...) \\
+                {Py_BEGIN_ALLOW_THREADS __VA_ARGS__; Py_END_ALLOW_THREADS}
+            #endif
+            """
+        )
+    else:
+        header += textwrap.dedent(
+            """\
+            #ifndef AESARA_BLAS_NOGIL
+            #define AESARA_BLAS_NOGIL(...) {__VA_ARGS__;}
+            #endif
+            """
+        )
+
     return header + blas_code
 
 
@@ -1062,7 +1083,7 @@ def openblas_threads_text():
 
 def blas_header_version():
     # Version for the base header
-    version = (9,)
+    version = (10,)
     if detect_macos_sdot_bug():
         if detect_macos_sdot_bug.fix_works:
             # Version with fix
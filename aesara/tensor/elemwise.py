@@ -1276,7 +1276,12 @@ second dimension
         version.append(self.scalar_op.c_code_cache_version_apply(scalar_node))
         for i in node.inputs + node.outputs:
             version.append(get_scalar_type(dtype=i.type.dtype).c_code_cache_version())
-        version.append(("openmp", self.openmp))
+        if self.openmp:
+            # The threshold is in the C code, so a new one, e.g. set by
+            # aesara.gof.openmp.calibrate_elemwise_minsize, is compiled in.
+            version.append(("openmp", True, config.openmp_elemwise_minsize))
+        else:
+            version.append(("openmp", False))
         if all(version):
             return tuple(version)
         else:
@@ -1296,7 +1301,7 @@ second dimension
 ################
 
 
-class CAReduce(Op):
+class CAReduce(OpenMPOp):
     """
     CAReduce = Commutative Associative Reduce
     Reduces a scalar operation along the specified axis(es).
@@ -1315,6 +1320,9 @@ class CAReduce(Op):
         - The dimension along which we want to reduce
         - List of dimensions that we want to reduce
         - If None, all dimensions are reduced
+    openmp
+        If True, the C code reduces large inputs in parallel with OpenMP.
+        Defaults to the ``openmp`` flag.
 
     Notes
     -----
@@ -1342,11 +1350,15 @@ class CAReduce(Op):
 
     __props__ = ("scalar_op", "axis")
 
-    def __init__(self, scalar_op, axis=None):
+    # How the C code sums floats, see `Sum`.
+    summation = "naive"
+
+    def __init__(self, scalar_op, axis=None, openmp=None):
         if scalar_op.nin not in [-1, 2] or scalar_op.nout != 1:
             raise NotImplementedError(
                 "CAReduce only supports binary functions with a single " "output."
             )
+        super().__init__(openmp=openmp)
         self.scalar_op = scalar_op
 
         if axis is None:
@@ -1437,7 +1449,7 @@ class CAReduce(Op):
         return d
 
     def __setstate__(self, d):
-        self.__dict__.update(d)
+        super().__setstate__(d)
         self.set_ufunc(self.scalar_op)
 
     def __str__(self):
@@ -1506,16 +1518,29 @@ class CAReduce(Op):
             ],
         )
 
-    def _c_all(self, node, name, inames, onames, sub):
+    def _c_all(self, node, name, inames, onames, sub, pre_scalar_op=None):
+        """
+        Return the C code of the reduction, in 5 parts.
 
+        If `pre_scalar_op` is given, `node` has one input per input of
+        `pre_scalar_op`, which is applied to each element of the inputs, and
+        its output is reduced instead of the input (see `FusedCAReduce`).
+
+        """
         input = node.inputs[0]
         output = node.outputs[0]
 
-        iname = inames[0]
         oname = onames[0]
 
-        idtype = input.type.dtype_specs()[1]
+        idtypes = [i.type.dtype_specs()[1] for i in node.inputs]
         odtype = output.type.dtype_specs()[1]
+        if pre_scalar_op is None:
+            # The dtype of the values that are reduced.
+            rdtype = input.type.dtype
+        else:
+            rdtype = pre_scalar_op.output_types(
+                [get_scalar_type(dtype=i.type.dtype) for i in node.inputs]
+            )[0].dtype
 
         if hasattr(self, "acc_dtype") and self.acc_dtype is not None:
             if self.acc_dtype == "float16":
@@ -1532,6 +1557,7 @@ class CAReduce(Op):
             axis = list(range(len(input.type.broadcastable)))
 
         if len(axis) == 0:
+            assert pre_scalar_op is None
             # The acc_dtype is never a downcast compared to the input dtype
             # So we just need a cast to the output dtype.
             var = aesara.tensor.cast(input, node.outputs[0].dtype)
@@ -1544,6 +1570,15 @@ class CAReduce(Op):
         order = order1 + list(axis)
 
         nnested = len(order1)
+        if len(node.inputs) == 1:
+            in_orders = [order]
+        else:
+            # The broadcastable dimensions of an input are broadcasted to
+            # the other inputs.
+            in_orders = [
+                ["x" if i.type.broadcastable[d] else d for d in order]
+                for i in node.inputs
+            ]
 
         sub = dict(sub)
         for i, (input, iname) in enumerate(zip(node.inputs, inames)):
@@ -1559,19 +1594,22 @@ class CAReduce(Op):
             # the output is the accumulator variable
             aname = oname
 
-        decl += cgen.make_declare([order], [idtype], sub)
-        checks = cgen.make_checks([order], [idtype], sub)
+        decl += cgen.make_declare(in_orders, idtypes, sub)
+        checks = cgen.make_checks(in_orders, idtypes, sub)
 
         alloc = ""
         i += 1
         sub["lv%i" % i] = oname
         sub["olv"] = oname
+        # Take the size of each kept dimension from an input that is not
+        # broadcastable there.
+        alloc_orders = [in_order[:nnested] for in_order in in_orders]
 
         # Allocate output buffer
         alloc += cgen.make_declare(
             [list(range(nnested)) + ["x"] * len(axis)], [odtype], dict(sub, lv0=oname)
         )
-        alloc += cgen.make_alloc([order1], odtype, sub)
+        alloc += cgen.make_alloc(alloc_orders, odtype, sub)
         alloc += cgen.make_checks(
             [list(range(nnested)) + ["x"] * len(axis)], [odtype], dict(sub, lv0=oname)
         )
@@ -1586,7 +1624,7 @@ class CAReduce(Op):
                 [adtype],
                 dict(sub, lv0=aname),
             )
-            alloc += cgen.make_alloc([order1], adtype, sub)
+            alloc += cgen.make_alloc(alloc_orders, adtype, sub)
             alloc += cgen.make_checks(
                 [list(range(nnested)) + ["x"] * len(axis)],
                 [adtype],
@@ -1598,22 +1636,22 @@ class CAReduce(Op):
         elif self.scalar_op in [scalar.maximum, scalar.minimum]:
             if self.scalar_op == scalar.maximum:
                 scal_name = "maximum"
-                if input.type.dtype in ["float32", "float64"]:
+                if rdtype in ["float32", "float64"]:
                     identity = "-__builtin_inf()"
-                elif input.type.dtype.startswith("uint") or input.type.dtype == "bool":
+                elif rdtype.startswith("uint") or rdtype == "bool":
                     # numpy does not define NPY_MIN_UINT* and NPY_MIN_BOOL
                     identity = "0"
                 else:
-                    identity = "NPY_MIN_" + str(input.type.dtype).upper()
+                    identity = "NPY_MIN_" + str(rdtype).upper()
             if self.scalar_op == scalar.minimum:
                 scal_name = "minimum"
-                if input.type.dtype in ["float32", "float64"]:
+                if rdtype in ["float32", "float64"]:
                     identity = "__builtin_inf()"
-                elif input.type.dtype == "bool":
+                elif rdtype == "bool":
                     # numpy does not define NPY_MAX_BOOL
                     identity = "1"
                 else:
-                    identity = "NPY_MAX_" + str(input.type.dtype).upper()
+                    identity = "NPY_MAX_" + str(rdtype).upper()
             fail = sub["fail"]
             pattern = [0] * len(node.inputs[0].broadcastable)
             axis = self.axis
@@ -1623,8 +1661,9 @@ class CAReduce(Op):
                 pattern[i] = 1
             pattern_ = str(pattern)[1:-1]
             decl += """int tosum[]={%(pattern_)s};""" % locals()
-            alloc += (
-                """
+            for iname in inames:
+                alloc += (
+                    """
                     for(int i=0;i<PyArray_NDIM(%(iname)s);i++){
                         if(PyArray_DIMS(%(iname)s)[i]==0 && tosum[i]){
                             PyErr_Format(PyExc_ValueError,
@@ -1633,35 +1672,61 @@ class CAReduce(Op):
                         }
                     }
                     """
-                % locals()
-            )
+                    % locals()
+                )
         else:
             raise TypeError("The CAReduce.scalar_op must have an identity field.")
 
-        task0_decl = (
-            "%(dtype)s& %(name)s_i = *%(name)s_iter;\n"
-            "%(name)s_i = %(identity)s;"
-            % dict(dtype=adtype, name=aname, identity=identity)
-        )
-
-        task1_decl = "%(dtype)s& %(name)s_i = *%(name)s_iter;\n" % dict(
-            dtype=idtype, name=inames[0]
+        task0_code = """
+        {
+            %(dtype)s* %(name)s_ptr = (%(dtype)s*)PyArray_DATA(%(name)s);
+            npy_intp %(name)s_size = PyArray_SIZE(%(name)s);
+            for (npy_intp i = 0; i < %(name)s_size; ++i) {
+                %(name)s_ptr[i] = %(identity)s;
+            }
+        }
+        """ % dict(
+            dtype=adtype, name=aname, identity=identity
         )
 
-        task1_code = self.scalar_op.c_code(
-            Apply(
-                self.scalar_op,
+        task1_decl = ""
+        if pre_scalar_op is None:
+            rname = "%s_i" % inames[0]
+        else:
+            # Compute the value to reduce from the elements of the inputs.
+            rname = "%s_pre" % aname
+            pre_node = Apply(
+                pre_scalar_op,
                 [
                     get_scalar_type(dtype=iv.type.dtype).make_variable()
-                    for iv in (node.inputs * 2)
+                    for iv in node.inputs
                 ],
-                [
-                    get_scalar_type(dtype=ov.type.dtype).make_variable()
-                    for ov in node.outputs
-                ],
-            ),
+                [get_scalar_type(dtype=rdtype).make_variable()],
+            )
+            task1_decl += "%s %s;\n" % (
+                get_scalar_type(dtype=rdtype).dtype_specs()[1],
+                rname,
+            )
+            task1_decl += pre_scalar_op.c_code(
+                pre_node,
+                name + "_pre_",
+                ["%s_i" % iname for iname in inames],
+                [rname],
+                sub,
+            )
+
+        scalar_node = Apply(
+            self.scalar_op,
+            [get_scalar_type(dtype=rdtype).make_variable() for _ in range(2)],
+            [
+                get_scalar_type(dtype=ov.type.dtype).make_variable()
+                for ov in node.outputs
+            ],
+        )
+        task1_code = self.scalar_op.c_code(
+            scalar_node,
             None,
-            ["%s_i" % aname, "%s_i" % inames[0]],
+            ["%s_i" % aname, rname],
             ["%s_i" % aname],
             sub,
         )
@@ -1675,24 +1740,74 @@ class CAReduce(Op):
             % locals()
         )
 
-        if node.inputs[0].type.ndim:
-            if len(axis) == 1:
-                all_code = [("", "")] * nnested + [(task0_decl, code1), ""]
-            else:
-                all_code = (
-                    [("", "")] * nnested
-                    + [(task0_decl, "")]
-                    + [("", "")] * (len(axis) - 2)
-                    + [("", code1), ""]
-                )
+        # The accumulator is initialized first, then the loops follow the
+        # memory layout of the input, so that the inner loop walks it
+        # contiguously. When reducing over the leading axis of a C-contiguous
+        # matrix, each row is accumulated into the whole output row.
+        # The loops are only reordered: they are not tiled, and carry no
+        # `omp simd` pragma, vectorization is left to the compiler.
+        ndim = node.inputs[0].type.ndim
+        if len(node.inputs) == 1:
+            layout_orders = [list(range(ndim))]
         else:
-            all_code = [task0_decl + code1]
-        loop = cgen.make_loop_careduce(
-            [order, list(range(nnested)) + ["x"] * len(axis)],
-            [idtype, adtype],
-            all_code,
+            layout_orders = [
+                ["x" if i.type.broadcastable[d] else d for d in range(ndim)]
+                for i in node.inputs
+            ]
+        acc_order = ["x" if d in axis else order1.index(d) for d in range(ndim)]
+        # Follow the input with the fewest broadcasted dimensions.
+        layout_idx = min(
+            range(len(node.inputs)),
+            key=lambda k: sum(node.inputs[k].type.broadcastable),
+        )
+        loop = task0_code + cgen.make_reordered_loop(
+            layout_orders + [acc_order],
+            layout_idx,
+            idtypes + [adtype],
+            code1,
             sub,
         )
+        acc_dtype = getattr(self, "acc_dtype", None) or output.type.dtype
+        if (
+            self.summation != "naive"
+            and pre_scalar_op is None
+            and acc_dtype in ("float32", "float64")
+        ):
+            # The summation loop is also used without OpenMP, for its
+            # accuracy.
+            chunked_loop = self._c_chunked_loop(
+                node, scalar_node, aname, adtype, identity, axis, sub, self.summation
+            )
+            loop = """
+            if (PyArray_SIZE(%(iname)s) > 0) {
+                %(chunked_loop)s
+            } else {
+                %(loop)s
+            }
+            """ % dict(
+                iname=inames[0], chunked_loop=chunked_loop, loop=loop
+            )
+        elif (
+            self.openmp
+            and pre_scalar_op is None
+            and isinstance(self.scalar_op, self._openmp_scalar_ops)
+        ):
+            chunked_loop = self._c_chunked_loop(
+                node, scalar_node, aname, adtype, identity, axis, sub
+            )
+            loop = """
+            if (PyArray_SIZE(%(iname)s) > 0
+                && PyArray_SIZE(%(iname)s) >= %(minsize)s) {
+                %(chunked_loop)s
+            } else {
+                %(loop)s
+            }
+            """ % dict(
+                iname=inames[0],
+                minsize=config.openmp_elemwise_minsize,
+                chunked_loop=chunked_loop,
+                loop=loop,
+            )
 
         end = ""
         if adtype != odtype:
@@ -1705,6 +1820,234 @@ class CAReduce(Op):
 
         return decl, checks, alloc, loop, end
 
+    # The scalar ops whose reductions are computed in parallel. Their C code
+    # does not jump to the failure label, which is not allowed in a
+    # parallel loop.
+    _openmp_scalar_ops = (
+        scalar.Add,
+        scalar.Mul,
+        scalar.Maximum,
+        scalar.Minimum,
+        scalar.AND,
+        scalar.OR,
+        scalar.XOR,
+    )
+
+    # The number of elements reduced by one task of the parallel loop.
+    _openmp_chunk_size = 4096
+
+    # For each summation strategy, the number of elements reduced by one
+    # task of the chunked loop and the number of independent accumulators
+    # of a task.
+    _summation_chunks = {
+        "naive": (_openmp_chunk_size, 1),
+        "pairwise": (128, 8),
+        "kahan": (_openmp_chunk_size, 4),
+    }
+
+    def _c_chunked_loop(
+        self, node, scalar_node, aname, adtype, identity, axis, sub, summation="naive"
+    ):
+        """
+        Return the C code reducing the input of `node` into `aname` by chunks.
+
+        The reduced elements of each output are split in chunks of a fixed
+        size, that are reduced separately, in parallel if `openmp` is True.
+        The partial results of each output are then combined pairwise, in a
+        tree that only depends on the shape of the input, so the result
+        does not depend on the number of threads.
+
+        With the "pairwise" `summation`, the chunks have 128 elements that
+        are summed with 8 accumulators, like NumPy does, so the rounding
+        error grows with the logarithm of the number of elements. With
+        "kahan", each chunk is summed with compensated summation.
+
+        """
+        ndim = node.inputs[0].type.ndim
+        kept = [d for d in range(ndim) if d not in axis]
+        red = list(axis)
+        chunk, n_lanes = self._summation_chunks[summation]
+
+        # Combine red_val into red_acc.
+        combine = self.scalar_op.c_code(
+            scalar_node, None, ["red_acc", "red_val"], ["red_acc"], sub
+        )
+        if summation == "naive":
+            lanes_decl = "%s red_acc = %s;" % (adtype, identity)
+            step = combine
+            lanes_end = ""
+        else:
+            lanes_decl = "%s red_lane[%d] = {0};" % (adtype, n_lanes)
+            if summation == "kahan":
+                lanes_decl += "\n%s red_comp[%d] = {0};" % (adtype, n_lanes)
+                step = """{
+                    const %(adtype)s red_y = red_val - red_comp[l];
+                    const %(adtype)s red_t = red_lane[l] + red_y;
+                    red_comp[l] = (red_t - red_lane[l]) - red_y;
+                    red_lane[l] = red_t;
+                }""" % dict(
+                    adtype=adtype
+                )
+            else:
+                step = "red_lane[l] += red_val;"
+            # Sum the accumulators pairwise.
+            lanes_end = ""
+            if summation == "kahan":
+                lanes_end += "".join(
+                    "red_lane[%d] -= red_comp[%d];\n" % (i, i) for i in range(n_lanes)
+                )
+            width = 1
+            while width < n_lanes:
+                lanes_end += "".join(
+                    "red_lane[%d] += red_lane[%d];\n" % (i, i + width)
+                    for i in range(0, n_lanes, 2 * width)
+                )
+                width *= 2
+            lanes_end += "%s red_acc = red_lane[0];" % adtype
+
+        if self.openmp:
+            omp_parallel = (
+                "#pragma omp parallel for schedule(static)"
+                " if(n_out * n_elems >= %d)" % config.openmp_elemwise_minsize
+            )
+        else:
+            omp_parallel = ""
+
+        return """
+        {
+        const npy_intp chunk = %(chunk)s;
+        const int n_kept = %(n_kept)s;
+        const int n_red = %(n_red)s;
+        const int kept_axes[] = {%(kept_axes)s};
+        const int red_axes[] = {%(red_axes)s};
+        npy_intp kept_dims[%(kept_size)s], kept_strides[%(kept_size)s];
+        npy_intp acc_strides[%(kept_size)s];
+        npy_intp red_dims[%(n_red)s], red_strides[%(n_red)s];
+        npy_intp n_out = 1;
+        npy_intp n_elems = 1;
+        for (int k = 0; k < n_kept; ++k) {
+            kept_dims[k] = PyArray_DIMS(%(iname)s)[kept_axes[k]];
+            kept_strides[k] = PyArray_STRIDES(%(iname)s)[kept_axes[k]];
+            acc_strides[k] = PyArray_STRIDES(%(aname)s)[k];
+            n_out *= kept_dims[k];
+        }
+        for (int k = 0; k < n_red; ++k) {
+            red_dims[k] = PyArray_DIMS(%(iname)s)[red_axes[k]];
+            red_strides[k] = PyArray_STRIDES(%(iname)s)[red_axes[k]];
+            n_elems *= red_dims[k];
+        }
+        // Walk the reduced dimension with the smallest stride innermost.
+        for (int k = 1; k < n_red; ++k) {
+            for (int l = k; l > 0; --l) {
+                npy_intp s0 = red_strides[l - 1] < 0 ? -red_strides[l - 1] : red_strides[l - 1];
+                npy_intp s1 = red_strides[l] < 0 ? -red_strides[l] : red_strides[l];
+                if (s1 <= s0)
+                    break;
+                std::swap(red_strides[l - 1], red_strides[l]);
+                std::swap(red_dims[l - 1], red_dims[l]);
+            }
+        }
+        const npy_intp n_chunks = (n_elems + chunk - 1) / chunk;
+        const npy_intp n_tasks = n_out * n_chunks;
+        %(adtype)s* partial = (%(adtype)s*)malloc(n_tasks * sizeof(%(adtype)s));
+        if (partial == NULL) {
+            PyErr_NoMemory();
+            %(fail)s
+        }
+
+        // Reduce each chunk of each output.
+        %(omp_parallel)s
+        for (npy_intp t = 0; t < n_tasks; ++t) {
+            const npy_intp start = (t %% n_chunks) * chunk;
+            const npy_intp end = start + chunk < n_elems ? start + chunk : n_elems;
+            const char* p = PyArray_BYTES(%(iname)s);
+            npy_intp rem = t / n_chunks;
+            for (int k = n_kept - 1; k >= 0; --k) {
+                p += (rem %% kept_dims[k]) * kept_strides[k];
+                rem /= kept_dims[k];
+            }
+            npy_intp idx[%(n_red)s];
+            rem = start;
+            for (int k = n_red - 1; k >= 0; --k) {
+                idx[k] = rem %% red_dims[k];
+                p += idx[k] * red_strides[k];
+                rem /= red_dims[k];
+            }
+            const npy_intp inner_dim = red_dims[n_red - 1];
+            const npy_intp inner_stride = red_strides[n_red - 1];
+            %(lanes_decl)s
+            npy_intp j = start;
+            while (j < end) {
+                npy_intp run = inner_dim - idx[n_red - 1];
+                if (run > end - j)
+                    run = end - j;
+                npy_intp r = 0;
+                for (; r + %(n_lanes)s <= run; r += %(n_lanes)s) {
+                    for (int l = 0; l < %(n_lanes)s; ++l) {
+                        const %(idtype)s red_val = *(const %(idtype)s*)(p + (r + l) * inner_stride);
+                        %(step)s;
+                    }
+                }
+                for (; r < run; ++r) {
+                    const int l = 0;
+                    const %(idtype)s red_val = *(const %(idtype)s*)(p + r * inner_stride);
+                    %(step)s;
+                }
+                j += run;
+                p += run * inner_stride;
+                idx[n_red - 1] += run;
+                for (int k = n_red - 1; k > 0 && idx[k] == red_dims[k]; --k) {
+                    p += red_strides[k - 1] - red_dims[k] * red_strides[k];
+                    idx[k] = 0;
+                    idx[k - 1] += 1;
+                }
+            }
+            %(lanes_end)s
+            partial[t] = red_acc;
+        }
+
+        // Combine the partial results of each output pairwise.
+        %(omp_parallel)s
+        for (npy_intp o = 0; o < n_out; ++o) {
+            %(adtype)s* part = partial + o * n_chunks;
+            for (npy_intp width = 1; width < n_chunks; width *= 2) {
+                for (npy_intp i = 0; i + width < n_chunks; i += 2 * width) {
+                    %(adtype)s red_acc = part[i];
+                    const %(adtype)s red_val = part[i + width];
+                    %(combine)s;
+                    part[i] = red_acc;
+                }
+            }
+            char* a = PyArray_BYTES(%(aname)s);
+            npy_intp rem = o;
+            for (int k = n_kept - 1; k >= 0; --k) {
+                a += (rem %% kept_dims[k]) * acc_strides[k];
+                rem /= kept_dims[k];
+            }
+            *(%(adtype)s*)a = part[0];
+        }
+        free(partial);
+        }
+        """ % dict(
+            chunk=chunk,
+            n_kept=len(kept),
+            n_red=len(red),
+            kept_axes=", ".join(map(str, kept)) or "0",
+            red_axes=", ".join(map(str, red)),
+            kept_size=max(len(kept), 1),
+            iname=sub["lv0"],
+            idtype=node.inputs[0].type.dtype_specs()[1],
+            aname=aname,
+            adtype=adtype,
+            n_lanes=n_lanes,
+            lanes_decl=lanes_decl,
+            step=step,
+            lanes_end=lanes_end,
+            combine=combine,
+            omp_parallel=omp_parallel,
+            fail=sub["fail"],
+        )
+
     def c_code(self, node, name, inames, onames, sub):
         code = "\n".join(self._c_all(node, name, inames, onames, sub))
         return code
@@ -1713,9 +2056,15 @@ class CAReduce(Op):
         # Sometimes, Elemwise's c_code is returned, so we need its headers
         return ["<vector>", "<algorithm>"]
 
+    def c_no_compile_args(self):
+        if self.summation == "kahan":
+            # It would let the compiler cancel the compensation.
+            return ["-ffast-math"]
+        return []
+
     def c_code_cache_version_apply(self, node):
         # the version corresponding to the c code in this Op
-        version = [8]
+        version = [12]
 
         # now we insert versions for the ops on which we depend...
         scalar_node = Apply(
@@ -1732,6 +2081,10 @@ class CAReduce(Op):
         version.append(self.scalar_op.c_code_cache_version_apply(scalar_node))
         for i in node.inputs + node.outputs:
             version.append(get_scalar_type(dtype=i.type.dtype).c_code_cache_version())
+        if self.openmp:
+            version.append(("openmp", True, config.openmp_elemwise_minsize))
+        else:
+            version.append(("openmp", False))
         if all(version):
             return tuple(version)
         else:
@@ -2010,15 +2363,40 @@ class Sum(CAReduceDtype):
         - for float dtypes, we use at least float64;
         - for complex dtypes, we use at least complex128.
 
+    summation
+        How the C code sums floats:
+        - "naive" (default): the elements are added in turn;
+        - "pairwise": the elements are summed by blocks of 128, whose sums
+        are then added pairwise, like NumPy does. The rounding error grows
+        with the logarithm of the number of elements instead of linearly,
+        and it is as fast as "naive";
+        - "kahan": compensated summation, whose rounding error does not
+        depend on the number of elements. It is slower on data that is in
+        the cache.
+        With "pairwise" or "kahan", a float32 accumulator (``acc_dtype``)
+        is usually accurate enough, which avoids the conversions to
+        float64. They only apply to float32 and float64 accumulators.
+
     """
 
-    __props__ = ("axis", "dtype", "acc_dtype")
+    __props__ = ("axis", "dtype", "acc_dtype", "summation")
     nfunc_spec = ("sum", 1, 1)
+    summations = ("naive", "pairwise", "kahan")
 
-    def __init__(self, axis=None, dtype=None, acc_dtype=None):
+    def __init__(self, axis=None, dtype=None, acc_dtype=None, summation="naive"):
         CAReduceDtype.__init__(
             self, scalar.add, axis=axis, dtype=dtype, acc_dtype=acc_dtype
         )
+        if summation not in self.summations:
+            raise ValueError(
+                "summation must be one of %s, got %s" % (self.summations, summation)
+            )
+        self.summation = summation
+
+    def __setstate__(self, d):
+        super().__setstate__(d)
+        if "summation" not in d:
+            self.summation = "naive"
 
     def __str__(self):
         name = self.__class__.__name__
@@ -2026,7 +2404,12 @@ class Sum(CAReduceDtype):
         if self.axis is not None:
             axis = ", ".join(str(x) for x in self.axis)
             axis = "axis=[%s], " % axis
-        return "{}{{{}acc_dtype={}}}".format(name, axis, str(self.acc_dtype))
+        summation = ""
+        if self.summation != "naive":
+            summation = ", summation=%s" % self.summation
+        return "{}{{{}acc_dtype={}{}}}".format(
+            name, axis, str(self.acc_dtype), summation
+        )
 
     def L_op(self, inp, out, grads):
         (x,) = inp
@@ -2266,3 +2649,122 @@ class ProdWithoutZeros(CAReduceDtype):
             "`product(a, no_zeros_in_input=True)`.",
         )
         return [a_grad]
+
+
+class FusedCAReduce(Op):
+    """
+    Reduce the output of a scalar op applied elementwise, without allocating
+    that output.
+
+    ``FusedCAReduce(pre_scalar_op, careduce)(*inputs)`` computes
+    ``careduce(Elemwise(pre_scalar_op)(*inputs))``. In the C code, the loop
+    of the reduction applies `pre_scalar_op` to the elements of the inputs
+    and accumulates its output directly. It is introduced by the
+    `local_careduce_fusion` optimization.
+
+    Parameters
+    ----------
+    pre_scalar_op
+        A scalar op with a single output, usually a `Composite`.
+    careduce
+        The `CAReduce` applied to the output of `pre_scalar_op`. It must
+        reduce at least one axis.
+
+    Notes
+    -----
+    The Python implementation computes the Elemwise, then the reduction.
+
+    """
+
+    __props__ = ("pre_scalar_op", "careduce")
+
+    def __init__(self, pre_scalar_op, careduce):
+        if pre_scalar_op.nout != 1:
+            raise NotImplementedError(
+                "FusedCAReduce only supports scalar ops with a single output."
+            )
+        if careduce.axis is not None and len(careduce.axis) == 0:
+            raise ValueError("FusedCAReduce must reduce at least one axis.")
+        self.pre_scalar_op = pre_scalar_op
+        self.careduce = careduce
+
+    def __str__(self):
+        return "FusedCAReduce{{{}, {}}}".format(self.pre_scalar_op, self.careduce)
+
+    def _inner_nodes(self, node):
+        """Return the Elemwise and CAReduce nodes that `node` computes."""
+        elem_node = Elemwise(self.pre_scalar_op).make_node(*node.inputs)
+        return elem_node, self.careduce.make_node(elem_node.outputs[0])
+
+    def make_node(self, *inputs):
+        inputs = [as_tensor_variable(i) for i in inputs]
+        if len({i.type.ndim for i in inputs}) > 1:
+            raise TypeError(
+                "The inputs of FusedCAReduce must have the same number of "
+                "dimensions, got %s" % [i.type.ndim for i in inputs]
+            )
+        elem_out = Elemwise(self.pre_scalar_op).make_node(*inputs).outputs[0]
+        red_node = self.careduce.make_node(elem_out)
+        op = self
+        if red_node.op is not self.careduce:
+            # The negative axes were made positive.
+            op = FusedCAReduce(self.pre_scalar_op, red_node.op)
+        return Apply(op, inputs, [red_node.outputs[0].type()])
+
+    def perform(self, node, inputs, output_storage):
+        fused_nodes = getattr(node.tag, "fused_nodes", None)
+        if fused_nodes is None:
+            fused_nodes = node.tag.fused_nodes = self._inner_nodes(node)
+            fused_nodes[0].op.prepare_node(fused_nodes[0], None, None, "py")
+        elem_node, red_node = fused_nodes
+        elem_storage = [[None]]
+        elem_node.op.perform(elem_node, inputs, elem_storage)
+        red_node.op.perform(red_node, [elem_storage[0][0]], output_storage)
+
+    def infer_shape(self, node, shapes):
+        elem_shape = []
+        for d in range(node.inputs[0].type.ndim):
+            dims = [
+                shape[d]
+                for i, shape in zip(node.inputs, shapes)
+                if not i.type.broadcastable[d]
+            ]
+            elem_shape.append(dims[0] if dims else 1)
+        red_node = self._inner_nodes(node)[1]
+        return self.careduce.infer_shape(red_node, [elem_shape])
+
+    def c_code(self, node, name, inames, onames, sub):
+        code = "\n".join(
+            self.careduce._c_all(
+                node, name, inames, onames, sub, pre_scalar_op=self.pre_scalar_op
+            )
+        )
+        return code
+
+    def c_headers(self):
+        return self.careduce.c_headers()
+
+    def c_support_code(self):
+        return self.pre_scalar_op.c_support_code()
+
+    def c_support_code_apply(self, node, nodename):
+        return self.pre_scalar_op.c_support_code_apply(node, nodename + "_pre_")
+
+    def c_code_cache_version_apply(self, node):
+        elem_node, red_node = self._inner_nodes(node)
+        version = [1, self.careduce.c_code_cache_version_apply(red_node)]
+        pre_node = Apply(
+            self.pre_scalar_op,
+            [
+                get_scalar_type(dtype=input.type.dtype).make_variable()
+                for input in node.inputs
+            ],
+            [get_scalar_type(dtype=elem_node.outputs[0].type.dtype).make_variable()],
+        )
+        version.append(self.pre_scalar_op.c_code_cache_version_apply(pre_node))
+        for i in node.inputs:
+            version.append(get_scalar_type(dtype=i.type.dtype).c_code_cache_version())
+        if all(version):
+            return tuple(version)
+        else:
+            return ()
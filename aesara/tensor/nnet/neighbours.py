@@ -6,12 +6,12 @@ import numpy as np
 
 import aesara
 import aesara.tensor as tt
-from aesara import Apply, Op
-from aesara.gof import EnumList
+from aesara import Apply
+from aesara.gof import EnumList, OpenMPOp
 from aesara.gradient import grad_not_implemented, grad_undefined
 
 
-class Images2Neibs(Op):
+class Images2Neibs(OpenMPOp):
     """
     Reshapes the input as a 2D tensor where each row is an pooling
     example.
@@ -33,6 +33,9 @@ class Images2Neibs(Op):
             of the input is not a multiple of the pooling factor(s).
         - 'wrap_centered' :
             ?? TODO comment
+    openmp : bool
+        If True, compute the patches of the images in parallel with
+        OpenMP. Defaults to the ``openmp`` flag.
 
     """
 
@@ -49,7 +52,8 @@ class Images2Neibs(Op):
     def get_params(self, node):
         return self.mode
 
-    def __init__(self, mode="valid"):
+    def __init__(self, mode="valid", openmp=None):
+        super().__init__(openmp=openmp)
         implemented_modes = self.BORDER_MODE.get_aliases()
         if mode not in implemented_modes:
             raise NotImplementedError(
@@ -65,6 +69,8 @@ class Images2Neibs(Op):
         self.__dict__.update(d)
         if not hasattr(self, "mode"):
             self.mode = "valid"
+        if not hasattr(self, "openmp"):
+            self.openmp = False
 
     def make_node(self, ten4, neib_shape, neib_step=None):
         """
@@ -186,7 +192,7 @@ class Images2Neibs(Op):
         ]
 
     def c_code_cache_version(self):
-        return (10,)
+        return (11, self.openmp)
 
     def perform(self, node, inp, out_, params):
         ten4, neib_shape, neib_step = inp
@@ -372,6 +378,11 @@ class Images2Neibs(Op):
         return [(z_dim0, z_dim1)]
 
     def c_code(self, node, name, inp, out, sub):
+        if self.openmp:
+            # run in parallel over the images and their stacks
+            omp_parallel = "#pragma omp parallel for schedule(static)"
+        else:
+            omp_parallel = ""
         return """
 #ifndef CEIL_INTDIV
 #define CEIL_INTDIV(a, b) ((a/b) + ((a %% b) ? 1: 0))
@@ -586,8 +597,11 @@ class Images2Neibs(Op):
         const int wrap_centered_half_idx_shift_x = c/2;
         const int wrap_centered_half_idx_shift_y = d/2;
         // Oh this is messed up...
-        for (int n = 0; n < nb_batch; n++)              // loop over batches
-            for (int s = 0; s < nb_stack; s++)          // loop over stacks
+        %(omp_parallel)s
+        for (int ns = 0; ns < nb_batch * nb_stack; ns++)   // loop over batches and stacks
+        {
+            const int n = ns / nb_stack;
+            const int s = ns %% nb_stack;
                 for (int a = 0; a < grid_c; a++)        // loop over the number of patch in height
                     for (int b = 0; b < grid_d; b++)    // loop over the number of patch in width
                     {
@@ -631,6 +645,7 @@ class Images2Neibs(Op):
                             }
                         }
                     }
+        }
         } // END NESTED SCOPE
         """ % dict(
             ten4=inp[0],
@@ -639,6 +654,7 @@ class Images2Neibs(Op):
             z=out[0],
             fail=sub["fail"],
             mode=sub["params"],
+            omp_parallel=omp_parallel,
         )
 
 
@@ -84,6 +84,7 @@ from aesara.tensor.elemwise import (
     CAReduce,
     DimShuffle,
     Elemwise,
+    FusedCAReduce,
     Prod,
     ProdWithoutZeros,
     Sum,
@@ -5827,6 +5828,22 @@ def local_useless_elemwise_comparison(node):
     return
 
 
+def _reduce_kwargs(op):
+    """
+    Return the arguments, other than the axis, of the CAReduceDtype `op`.
+
+    Rewrites that build a new reduction from `op` must pass them so that the
+    dtypes and the summation mode chosen by the user are kept.
+
+    """
+    kwargs = {"dtype": op.dtype, "acc_dtype": op.acc_dtype}
+    if isinstance(op, Sum):
+        kwargs["summation"] = op.summation
+    elif isinstance(op, Prod):
+        kwargs["no_zeros_in_input"] = op.no_zeros_in_input
+    return kwargs
+
+
 @register_canonicalize
 @register_specialize
 @local_optimizer([Sum, Prod])
@@ -5937,13 +5954,18 @@ def local_sum_prod_div_dimshuffle(node):
                                 " to False."
                             )
 
+                    kwargs = _reduce_kwargs(node.op)
                     if isinstance(node.op, Sum):
-                        op_on_compatible_dims = tt.sum(numerator, axis=compatible_dims)
+                        op_on_compatible_dims = Sum(axis=compatible_dims, **kwargs)(
+                            numerator
+                        )
                         rval = true_div(op_on_compatible_dims, optimized_dimshuffle)
                         if len(reordered_incompatible_dims) > 0:
-                            rval = tt.sum(rval, axis=reordered_incompatible_dims)
+                            rval = Sum(axis=reordered_incompatible_dims, **kwargs)(rval)
                     elif isinstance(node.op, Prod):
-                        op_on_compatible_dims = tt.prod(numerator, axis=compatible_dims)
+                        op_on_compatible_dims = Prod(axis=compatible_dims, **kwargs)(
+                            numerator
+                        )
                         dtype = numerator.dtype
                         rval = true_div(
                             op_on_compatible_dims,
@@ -5958,7 +5980,9 @@ def local_sum_prod_div_dimshuffle(node):
                             ),
                         )
                         if len(reordered_incompatible_dims) > 0:
-                            rval = tt.prod(rval, axis=reordered_incompatible_dims)
+                            rval = Prod(axis=reordered_incompatible_dims, **kwargs)(
+                                rval
+                            )
                     return [rval]
 
 
@@ -5977,7 +6001,7 @@ def local_sum_prod_all_to_none(node):
         if node.op.axis is None:
             return
         if set(node.op.axis) == set(range(node.inputs[0].type.ndim)):
-            return [opt_type(axis=None, dtype=node.op.dtype)(node.inputs[0])]
+            return [opt_type(axis=None, **_reduce_kwargs(node.op))(node.inputs[0])]
 
 
 @register_canonicalize
@@ -5992,16 +6016,31 @@ def local_op_of_op(node):
     if isinstance(node.op, Prod) or isinstance(node.op, Sum):
         opt_type = Sum if isinstance(node.op, Sum) else Prod
         (node_inps,) = node.inputs
-        out_dtype = node.op.dtype
         # We manipulate the graph so this is done to make sure the opt
         # doesn't affect other computations.
         if len(node_inps.clients) == 1:
             if node_inps.owner and (isinstance(node_inps.owner.op, node.op.__class__)):
+                kwargs = _reduce_kwargs(node.op)
+                # Keep the most accurate of the two accumulators.
+                kwargs["acc_dtype"] = ts.upcast(
+                    node.op.acc_dtype, node_inps.owner.op.acc_dtype
+                )
+                if opt_type is Sum:
+                    # Keep the most accurate of the two summations.
+                    kwargs["summation"] = max(
+                        node.op.summation,
+                        node_inps.owner.op.summation,
+                        key=Sum.summations.index,
+                    )
+                else:
+                    # The combined product runs over the inputs of the inner one.
+                    kwargs["no_zeros_in_input"] = node_inps.owner.op.no_zeros_in_input
 
                 # check to see either the inner or outer prod is doing a
                 # product over all axis, in which case we can remove it
                 if node_inps.owner.op.axis is None or node.op.axis is None:
-                    return [opt_type(None, dtype=out_dtype)(node_inps.owner.inputs[0])]
+                    combined = opt_type(None, **kwargs)
+                    return [combined(node_inps.owner.inputs[0])]
 
                 # figure out which axes were in the original sum
                 newaxis = list(tuple(node_inps.owner.op.axis))
@@ -6049,7 +6088,7 @@ def local_op_of_op(node):
                         "`warn.sum_sum_bug` to False."
                     )
 
-                combined = opt_type(newaxis, dtype=out_dtype)
+                combined = opt_type(newaxis, **kwargs)
                 return [combined(node_inps.owner.inputs[0])]
 
 
@@ -6192,6 +6231,10 @@ def local_reduce_broadcastable(node):
                     if type(node.op) == CAReduce:
                         # This happen for tt.max(), tt.min()
                         new_op = node.op.__class__(node.op.scalar_op, axis=new_axis)
+                    elif isinstance(node.op, (Sum, Prod)):
+                        new_op = node.op.__class__(
+                            axis=new_axis, **_reduce_kwargs(node.op)
+                        )
                     else:
                         new_op = node.op.__class__(axis=new_axis)
                     return [new_op(new_reduced)]
@@ -7878,6 +7921,67 @@ def local_add_mul_fusion(node):
         return [output]
 
 
+def local_careduce_fusion(node):
+    """Fuse a `CAReduce` with the `Elemwise` that computes its input.
+
+    The loop of the reduction computes the elements of its input itself,
+    so the output of the `Elemwise` is never allocated. For example,
+    ``sum((x - mu) ** 2, axis=1)`` does not allocate ``(x - mu) ** 2``.
+
+    """
+    if not isinstance(node.op, CAReduce) or not aesara.config.cxx:
+        return False
+    if node.op.axis is not None and len(node.op.axis) == 0:
+        return False
+    scalar_op = node.op.scalar_op
+    if not hasattr(scalar_op, "identity") and scalar_op not in [
+        ts.maximum,
+        ts.minimum,
+    ]:
+        # CAReduce has no C code for it.
+        return False
+    if getattr(node.op, "acc_dtype", None) == "float16":
+        return False
+    if node.op.summation != "naive":
+        # The fused loop sums naively.
+        return False
+
+    (elem_out,) = node.inputs
+    elem_node = elem_out.owner
+    if (
+        elem_node is None
+        or type(elem_node.op) is not Elemwise
+        or len(elem_node.outputs) > 1
+        or elem_node.op.inplace_pattern
+        # Do not duplicate the Elemwise.
+        or len(elem_out.clients) > 1
+        or "float16" in [i.dtype for i in elem_node.inputs + [elem_out]]
+    ):
+        return False
+    if node.op.openmp and isinstance(scalar_op, CAReduce._openmp_scalar_ops):
+        # The fused loop is sequential, while the loops of the CAReduce and
+        # of the Elemwise run in parallel on large inputs. Only fuse when
+        # the input is known to be small.
+        size = None
+        shape_feature = getattr(node.fgraph, "shape_feature", None)
+        if shape_feature is not None and elem_out in shape_feature.shape_of:
+            try:
+                size = np.prod(
+                    [
+                        int(get_scalar_constant_value(s))
+                        for s in shape_feature.shape_of[elem_out]
+                    ]
+                )
+            except NotScalarConstantError:
+                pass
+        if size is None or size >= aesara.config.openmp_elemwise_minsize:
+            return False
+
+    output = FusedCAReduce(elem_node.op.scalar_op, node.op)(*elem_node.inputs)
+    copy_stack_trace(node.outputs[0], output)
+    return [output]
+
+
 if config.tensor.local_elemwise_fusion:
     _logger.debug("enabling optimization fusion elemwise in fast_run")
     # Must be after gpu(48.5) and before AddDestroyHandler(49.5)
@@ -7896,6 +8000,13 @@ if config.tensor.local_elemwise_fusion:
         "fast_run",
         "fusion",
     )
+    fuse_seqopt.register(
+        "local_careduce_fusion",
+        FusionOptimizer(local_careduce_fusion),
+        2,
+        "fast_run",
+        "fusion",
+    )
     compile.optdb.register(
         "elemwise_fusion",
         fuse_seqopt,
@@ -668,10 +668,17 @@ class _tensor_py_operators:
 
     dot = __dot__
 
-    def sum(self, axis=None, dtype=None, keepdims=False, acc_dtype=None):
+    def sum(
+        self, axis=None, dtype=None, keepdims=False, acc_dtype=None, summation="naive"
+    ):
         """See `aesara.tensor.sum`."""
         return aesara.tensor.basic.sum(
-            self, axis=axis, dtype=dtype, keepdims=keepdims, acc_dtype=acc_dtype
+            self,
+            axis=axis,
+            dtype=dtype,
+            keepdims=keepdims,
+            acc_dtype=acc_dtype,
+            summation=summation,
         )
 
     def prod(self, axis=None, dtype=None, keepdims=False, acc_dtype=None):
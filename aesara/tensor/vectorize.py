@@ -0,0 +1,223 @@
+"""
+Add a leading batch dimension to the inputs of a graph.
+
+`vectorize` rebuilds a graph so that it computes, in one evaluation, the
+original graph for each element of a batch of inputs. Each Apply node that
+depends on a batched input is rewritten by the rule registered for its Op
+(see `register_vectorize`). Nodes without a rule are computed by a `map`
+over the batch, which is correct for any Op but much slower.
+
+"""
+
+import copy
+
+from aesara.compile.ops import Shape, Shape_i
+from aesara.gof import graph
+from aesara.tensor import basic as tt
+from aesara.tensor.blas import BatchedDot
+from aesara.tensor.elemwise import CAReduce, DimShuffle, Elemwise
+from aesara.tensor.subtensor import Subtensor
+
+
+__docformat__ = "restructuredtext en"
+
+# Map an Op class to the function that vectorizes its Apply nodes.
+_vectorizers = {}
+
+
+def register_vectorize(*op_classes):
+    """
+    Register a function that vectorizes the Apply nodes of the given Ops.
+
+    The function is called as ``fn(node, inputs, batched)``, where `inputs`
+    are the new inputs of `node` and `batched` tells which of them have a
+    leading batch dimension. It returns the new outputs of `node`, each with
+    a leading batch dimension, or None to fall back to a `map` over the batch.
+
+    """
+
+    def decorator(fn):
+        for op_class in op_classes:
+            _vectorizers[op_class] = fn
+        return fn
+
+    return decorator
+
+
+def _add_batch_dim(x):
+    """Add a broadcastable batch dimension in front of `x`."""
+    return x.dimshuffle(["x"] + list(range(x.ndim)))
+
+
+@register_vectorize(Elemwise)
+def _vectorize_elemwise(node, inputs, batched):
+    inputs = [x if b else _add_batch_dim(x) for x, b in zip(inputs, batched)]
+    if node.op.inplace_pattern:
+        # The inplace inputs could now be broadcasted.
+        return Elemwise(node.op.scalar_op)(*inputs, return_list=True)
+    return node.op(*inputs, return_list=True)
+
+
+@register_vectorize(DimShuffle)
+def _vectorize_dimshuffle(node, inputs, batched):
+    (x,) = inputs
+    new_order = [0] + [d if d == "x" else d + 1 for d in node.op.new_order]
+    return [x.dimshuffle(new_order)]
+
+
+@register_vectorize(CAReduce)
+def _vectorize_careduce(node, inputs, batched):
+    (x,) = inputs
+    op = copy.copy(node.op)
+    if op.axis is None:
+        op.axis = tuple(range(1, x.ndim))
+    else:
+        op.axis = tuple(a + 1 if a >= 0 else a for a in op.axis)
+    return [op(x)]
+
+
+@register_vectorize(tt.MaxAndArgmax)
+def _vectorize_max_and_argmax(node, inputs, batched):
+    (x,) = inputs
+    return tt.MaxAndArgmax([a + 1 for a in node.op.axis])(x, return_list=True)
+
+
+@register_vectorize(tt.Dot)
+def _vectorize_dot(node, inputs, batched):
+    a, b = inputs
+    if batched[0] and batched[1]:
+        return [BatchedDot()(a, b)]
+    if batched[0]:
+        # dot contracts the last axis of `a`, so it maps over the others.
+        return [tt.dot(a, b)]
+    # The batch axis of `b` ends up after the remaining axes of `a`.
+    out = tt.tensordot(a, b, [[a.ndim - 1], [1]])
+    axis = a.ndim - 1
+    order = [axis] + list(range(axis)) + list(range(axis + 1, out.ndim))
+    return [out.dimshuffle(order)]
+
+
+@register_vectorize(Subtensor)
+def _vectorize_subtensor(node, inputs, batched):
+    if any(batched[1:]):
+        # Each element of the batch uses different indices.
+        return None
+    op = Subtensor((slice(None, None, None),) + tuple(node.op.idx_list))
+    return [op(*inputs)]
+
+
+@register_vectorize(Shape)
+def _vectorize_shape(node, inputs, batched):
+    (x,) = inputs
+    # The same shape for each element of the batch.
+    return [tt.alloc(x.shape[1:], x.shape[0], x.ndim - 1)]
+
+
+@register_vectorize(Shape_i)
+def _vectorize_shape_i(node, inputs, batched):
+    (x,) = inputs
+    return [tt.alloc(Shape_i(node.op.i + 1)(x), x.shape[0])]
+
+
+def _vectorize_with_map(node, inputs, batched):
+    """Compute `node` for each element of the batch with a scan."""
+    from aesara.scalar import Scalar
+    from aesara.scan_module import map as scan_map
+
+    # Scan only handles tensors. The scalars (e.g. the indices of a
+    # Subtensor) are converted to tensors, and back in the step. A batch of
+    # scalars is a vector.
+    is_scalar = [isinstance(x.type, Scalar) for x in node.inputs]
+    inputs = [
+        tt.tensor_from_scalar(x) if isinstance(x.type, Scalar) else x for x in inputs
+    ]
+    sequences = [x for x, b in zip(inputs, batched) if b]
+    non_sequences = [x for x, b in zip(inputs, batched) if not b]
+
+    def step(*args):
+        seqs = list(args[: len(sequences)])
+        non_seqs = list(args[len(sequences) :])
+        step_inputs = [seqs.pop(0) if b else non_seqs.pop(0) for b in batched]
+        step_inputs = [
+            tt.scalar_from_tensor(x) if s else x for x, s in zip(step_inputs, is_scalar)
+        ]
+        return [
+            tt.tensor_from_scalar(out) if isinstance(out.type, Scalar) else out
+            for out in node.op.make_node(*step_inputs).outputs
+        ]
+
+    outputs, updates = scan_map(step, sequences, non_sequences=non_sequences)
+    if updates:
+        raise NotImplementedError(
+            "Cannot vectorize %s, it has updates when mapped over the batch" % node.op
+        )
+    if not isinstance(outputs, (list, tuple)):
+        outputs = [outputs]
+    return list(outputs)
+
+
+def vectorize(outputs, replace, map_fallback=True):
+    """
+    Rebuild `outputs` so that they are computed for a batch of inputs.
+
+    Parameters
+    ----------
+    outputs : Variable or list of Variables
+        The outputs of the graph.
+    replace : dict
+        Map input variables of the graph to their batched version, which
+        has one more (leading) dimension. The other inputs are shared by all
+        the elements of the batch.
+    map_fallback : bool
+        If False, raise NotImplementedError instead of computing the nodes
+        that have no vectorization rule with a `map` over the batch.
+
+    Returns
+    -------
+    Variable or list of Variables
+        The batched outputs: element ``i`` of each of them is the original
+        output computed with element ``i`` of each batched input. Outputs
+        that do not depend on a batched input are repeated along the batch.
+
+    """
+    unpack_single = not isinstance(outputs, (list, tuple))
+    if unpack_single:
+        outputs = [outputs]
+    if not replace:
+        raise ValueError("vectorize needs at least one batched input")
+    for var, new_var in replace.items():
+        if new_var.ndim != var.ndim + 1:
+            raise TypeError(
+                "The batched version of %s must have %d dimensions, got %d"
+                % (var, var.ndim + 1, new_var.ndim)
+            )
+
+    new = dict(replace)
+    for node in graph.io_toposort(list(replace), outputs):
+        if not any(i in new for i in node.inputs):
+            continue
+        inputs = [new.get(i, i) for i in node.inputs]
+        batched = [i in new for i in node.inputs]
+        new_outputs = None
+        for cls in type(node.op).__mro__:
+            if cls in _vectorizers:
+                new_outputs = _vectorizers[cls](node, inputs, batched)
+                break
+        if new_outputs is None:
+            if not map_fallback:
+                raise NotImplementedError("Cannot vectorize %s" % node.op)
+            new_outputs = _vectorize_with_map(node, inputs, batched)
+        assert len(new_outputs) == len(node.outputs)
+        new.update(zip(node.outputs, new_outputs))
+
+    batch_size = next(iter(replace.values())).shape[0]
+    rval = []
+    for out in outputs:
+        if out in new:
+            rval.append(new[out])
+        else:
+            shape = [out.shape[i] for i in range(out.ndim)]
+            rval.append(tt.alloc(out, batch_size, *shape))
+    if unpack_single:
+        return rval[0]
+    return rval
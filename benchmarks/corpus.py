@@ -0,0 +1,206 @@
+"""
+Corpus of representative graphs for the benchmarks.
+
+Each entry of `GRAPHS` maps a name to a function that builds a graph and
+returns ``(inputs, outputs, updates, values)``, where `values` are the
+arguments of the compiled function.
+
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+import aesara
+import aesara.tensor as tt
+
+
+GRAPHS = OrderedDict()
+
+
+def register(name):
+    def decorator(build):
+        GRAPHS[name] = build
+        return build
+
+    return decorator
+
+
+def _shared(rng, *shape):
+    return aesara.shared(
+        (rng.standard_normal(shape) * 0.1).astype(aesara.config.floatX)
+    )
+
+
+def _sgd(cost, params, lr=0.01):
+    grads = tt.grad(cost, params)
+    return [(p, p - lr * g) for p, g in zip(params, grads)]
+
+
+@register("tiny")
+def tiny():
+    """A very small graph, for the overhead of the calls."""
+    rng = np.random.default_rng(0)
+    x = tt.vector("x")
+    w = _shared(rng, 10)
+    values = [rng.standard_normal(10).astype(aesara.config.floatX)]
+    return [x], [tt.nnet.sigmoid(tt.dot(x, w))], [], values
+
+
+@register("mlp")
+def mlp():
+    """Training step of a 3-layer perceptron."""
+    rng = np.random.default_rng(0)
+    x = tt.matrix("x")
+    y = tt.ivector("y")
+    sizes = [784, 256, 256, 10]
+    params = []
+    h = x
+    for n_in, n_out in zip(sizes[:-1], sizes[1:]):
+        w = _shared(rng, n_in, n_out)
+        b = _shared(rng, n_out)
+        params.extend([w, b])
+        h = tt.dot(h, w) + b
+        if n_out != sizes[-1]:
+            h = tt.tanh(h)
+    cost = tt.nnet.categorical_crossentropy(tt.nnet.softmax(h), y).mean()
+    values = [
+        rng.standard_normal((64, 784)).astype(aesara.config.floatX),
+        rng.integers(0, 10, 64).astype("int32"),
+    ]
+    return [x, y], [cost], _sgd(cost, params), values
+
+
+@register("convnet")
+def convnet():
+    """Training step of a small convolutional network."""
+    from aesara.tensor.nnet.abstract_conv import conv2d
+    from aesara.tensor.signal.pool import pool_2d
+
+    rng = np.random.default_rng(0)
+    x = tt.tensor4("x")
+    y = tt.ivector("y")
+    w1 = _shared(rng, 8, 1, 5, 5)
+    w2 = _shared(rng, 16, 8, 3, 3)
+    w3 = _shared(rng, 16 * 5 * 5, 10)
+    h = tt.nnet.relu(conv2d(x, w1, filter_shape=(8, 1, 5, 5)))
+    h = pool_2d(h, ws=(2, 2), ignore_border=True)
+    h = tt.nnet.relu(conv2d(h, w2, filter_shape=(16, 8, 3, 3)))
+    h = pool_2d(h, ws=(2, 2), ignore_border=True)
+    h = tt.dot(h.flatten(2), w3)
+    cost = tt.nnet.categorical_crossentropy(tt.nnet.softmax(h), y).mean()
+    values = [
+        rng.standard_normal((16, 1, 28, 28)).astype(aesara.config.floatX),
+        rng.integers(0, 10, 16).astype("int32"),
+    ]
+    return [x, y], [cost], _sgd(cost, [w1, w2, w3]), values
+
+
+@register("scan_rnn")
+def scan_rnn():
+    """Training step of a recurrent network written with scan."""
+    rng = np.random.default_rng(0)
+    x = tt.tensor3("x")
+    w_in = _shared(rng, 32, 64)
+    w_rec = _shared(rng, 64, 64)
+    w_out = _shared(rng, 64, 1)
+    h0 = tt.zeros((x.shape[1], 64), dtype=aesara.config.floatX)
+
+    def step(x_t, h_tm1):
+        return tt.tanh(tt.dot(x_t, w_in) + tt.dot(h_tm1, w_rec))
+
+    h, _ = aesara.scan(step, sequences=[x], outputs_info=[h0])
+    cost = tt.sqr(tt.dot(h[-1], w_out)).mean()
+    values = [rng.standard_normal((50, 16, 32)).astype(aesara.config.floatX)]
+    return [x], [cost], _sgd(cost, [w_in, w_rec, w_out]), values
+
+
+@register("bidirectional")
+def bidirectional():
+    """
+    Training step of a bidirectional recurrent encoder.
+
+    The two directions are independent scans, that the parallel VM
+    (``linker=vm_parallel``) can run at the same time.
+
+    """
+    rng = np.random.default_rng(0)
+    x = tt.tensor3("x")
+    h0 = tt.zeros((x.shape[1], 64), dtype=aesara.config.floatX)
+    params = []
+    states = []
+    for go_backwards in [False, True]:
+        w_in = _shared(rng, 32, 64)
+        w_rec = _shared(rng, 64, 64)
+        params.extend([w_in, w_rec])
+
+        def step(x_t, h_tm1, w_in, w_rec):
+            return tt.tanh(tt.dot(x_t, w_in) + tt.dot(h_tm1, w_rec))
+
+        h, _ = aesara.scan(
+            step,
+            sequences=[x],
+            outputs_info=[h0],
+            non_sequences=[w_in, w_rec],
+            go_backwards=go_backwards,
+        )
+        states.append(h[-1])
+    w_out = _shared(rng, 128, 1)
+    params.append(w_out)
+    cost = tt.sqr(tt.dot(tt.concatenate(states, axis=1), w_out)).mean()
+    values = [rng.standard_normal((50, 16, 32)).astype(aesara.config.floatX)]
+    return [x], [cost], _sgd(cost, params), values
+
+
+@register("sparse")
+def sparse():
+    """Training step of a linear model over sparse features."""
+    import scipy.sparse
+
+    from aesara import sparse
+
+    rng = np.random.default_rng(0)
+    x = sparse.csr_matrix("x", dtype=aesara.config.floatX)
+    y = tt.vector("y")
+    w = _shared(rng, 5000, 1)
+    pred = tt.nnet.sigmoid(sparse.structured_dot(x, w)).flatten()
+    cost = tt.nnet.binary_crossentropy(pred, y).mean()
+    values = [
+        scipy.sparse.random(
+            128, 5000, density=0.01, format="csr", random_state=0
+        ).astype(aesara.config.floatX),
+        (rng.random(128) > 0.5).astype(aesara.config.floatX),
+    ]
+    return [x, y], [cost], _sgd(cost, [w]), values
+
+
+@register("canonizer")
+def canonizer(n_terms=60):
+    """Sums and ratios of products, rewritten by the Canonizers."""
+    x = tt.vector("x")
+    y = tt.vector("y")
+    z = tt.vector("z")
+    terms = []
+    for i in range(n_terms):
+        a = [x, y, z][i % 3]
+        b = [y, z, x][(i // 3) % 3]
+        num = a * b * (i + 1) * tt.exp(a)
+        den = b * (i + 2) * tt.exp(a)
+        terms.append(num / den - a * b / (b * (i + 3)))
+    values = [np.linspace(0.1, 1, 100).astype(aesara.config.floatX)] * 3
+    return [x, y, z], [tt.add(*terms)], [], values
+
+
+@register("canonizer_deep")
+def canonizer_deep(depth=30):
+    """A deep chain of multiplications and divisions."""
+    x = tt.matrix("x")
+    y = tt.matrix("y")
+    out = x
+    for i in range(depth):
+        if i % 2:
+            out = out * y / (x + i)
+        else:
+            out = (out + x) / y * (x + i)
+    values = [np.full((10, 10), 1.01, dtype=aesara.config.floatX)] * 2
+    return [x, y], [out.sum()], [], values
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""
+Microbenchmarks of the C loops of Elemwise and CAReduce against NumPy.
+
+Each case compiles one Aesara function and times it, and the NumPy
+expression computing the same result, on C-contiguous, Fortran-ordered and
+strided inputs. The error column is the largest relative error of the
+Aesara result against NumPy computing in float64, which compares the
+accuracy of the summation strategies of `Sum`. For example::
+
+    python benchmarks/loops.py
+    python benchmarks/loops.py --size 2000 -n 50 --case sum_axis0
+    AESARA_FLAGS=floatX=float32 python benchmarks/loops.py --size 4000 \
+        --case sum_naive --case sum_pairwise --case sum_kahan
+
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+
+def _cases():
+    """Map the name of each case to ``(build, numpy_fn)``.
+
+    `build` returns the inputs and output of the Aesara graph, and
+    `numpy_fn` computes the same output from the input values.
+
+    """
+    import aesara.tensor as tt
+
+    def reduction(fn, axis):
+        def build():
+            x = tt.matrix("x")
+            return [x], fn(x, axis=axis)
+
+        return build
+
+    def summation(summation):
+        # Accumulate in floatX, which the accurate strategies make usable
+        # with float32.
+        def build():
+            x = tt.matrix("x")
+            return [x], tt.sum(x, acc_dtype=x.dtype, summation=summation)
+
+        return build
+
+    def fused():
+        x = tt.matrix("x")
+        return [x], tt.sum((x - x.mean(axis=0)) ** 2, axis=1)
+
+    def elemwise():
+        x = tt.matrix("x")
+        return [x], tt.exp(x) * x + 1
+
+    return {
+        "sum_axis0": (reduction(tt.sum, 0), lambda x: x.sum(axis=0)),
+        "sum_axis1": (reduction(tt.sum, 1), lambda x: x.sum(axis=1)),
+        "sum_all": (reduction(tt.sum, None), lambda x: x.sum()),
+        "sum_naive": (summation("naive"), lambda x: x.sum()),
+        "sum_pairwise": (summation("pairwise"), lambda x: x.sum()),
+        "sum_kahan": (summation("kahan"), lambda x: x.sum()),
+        "max_axis0": (reduction(tt.max, 0), lambda x: x.max(axis=0)),
+        "sqdev_axis1": (
+            fused,
+            lambda x: ((x - x.mean(axis=0)) ** 2).sum(axis=1),
+        ),
+        "elemwise": (elemwise, lambda x: np.exp(x) * x + 1),
+    }
+
+
+def _layouts(size, dtype):
+    values = np.random.RandomState(0).rand(size, size).astype(dtype)
+    return {
+        "C": values,
+        "F": np.asfortranarray(values),
+        "strided": np.random.RandomState(0).rand(size, 2 * size).astype(dtype)[:, ::2],
+    }
+
+
+def _time(fn, args, n):
+    fn(*args)
+    times = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", type=int, default=1000, help="rows and columns")
+    parser.add_argument("-n", type=int, default=20, help="calls per measure")
+    parser.add_argument(
+        "--case", action="append", help="only run these cases (repeatable)"
+    )
+    args = parser.parse_args()
+
+    import aesara
+
+    dtype = aesara.config.floatX
+    cases = _cases()
+    names = args.case or list(cases)
+    print(
+        "%-16s %-8s %12s %12s %8s %10s"
+        % ("case", "layout", "aesara", "numpy", "ratio", "error")
+    )
+    for name in names:
+        build, numpy_fn = cases[name]
+        inputs, output = build()
+        f = aesara.function(inputs, output)
+        for layout, value in _layouts(args.size, dtype).items():
+            t_aesara = _time(f, [value], args.n)
+            t_numpy = _time(numpy_fn, [value], args.n)
+            expected = numpy_fn(value.astype("float64"))
+            error = np.max(np.abs(f(value) - expected) / np.abs(expected))
+            print(
+                "%-16s %-8s %10.3fms %10.3fms %8.2f %10.2e"
+                % (
+                    name,
+                    layout,
+                    t_aesara * 1000,
+                    t_numpy * 1000,
+                    t_aesara / t_numpy,
+                    error,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
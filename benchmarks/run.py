@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+"""
+Compilation and execution benchmarks of Aesara.
+
+Compile each graph of the corpus (see corpus.py) in a new process and
+record, in a JSON file:
+
+- the time spent in each phase of the optimizer, in the linker and in the
+  whole `aesara.function` call;
+- the number of C modules taken from the in-memory cache, loaded from the
+  compiledir and compiled;
+- the memory of the process before and after the compilation;
+- the latency of the calls of the compiled function, and the part of it
+  spent in `Function.__call__` rather than in the linked function.
+
+For example, to compare two commits::
+
+    python benchmarks/run.py -o before.json
+    git checkout other_branch
+    python benchmarks/run.py -o after.json
+    python benchmarks/run.py --compare before.json after.json
+
+By default, the usual compiledir is used, so most of the C modules come
+from the cache. Use ``--cold`` to compile them all in a new compiledir.
+
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+# Metrics shown by --compare, as (name, path in the results).
+COMPARED = [
+    ("compile", ("compile_time",)),
+    ("optimizer", ("optimizer_time",)),
+    ("linker", ("linker_time",)),
+    ("call", ("call", "median")),
+    ("overhead", ("call", "overhead")),
+    ("memory", ("compile_memory",)),
+]
+
+
+def _max_rss():
+    """Maximum resident memory of this process, in bytes."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux, but in bytes on macOS.
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def _optimizer_phases(optimizer_profile):
+    """Map the name of each phase of a SeqOptimizer to its time."""
+    if not optimizer_profile or not isinstance(optimizer_profile[0], list):
+        return {}
+    optimizer, prof = optimizer_profile
+    phases = {}
+    for opt, t in zip(optimizer, prof[1]):
+        name = getattr(opt, "name", None) or type(opt).__name__
+        phases[name] = phases.get(name, 0) + t
+    return phases
+
+
+def worker(name, n_calls, mode):
+    import aesara
+    from aesara.compile.profiling import ProfileStats
+    from aesara.gof.cc import get_module_cache
+
+    from corpus import GRAPHS
+
+    t0 = time.time()
+    inputs, outputs, updates, values = GRAPHS[name]()
+    build_time = time.time() - t0
+
+    cache = get_module_cache()
+    stats = list(cache.stats)
+    memory = _max_rss()
+    profile = ProfileStats(atexit_print=False, flag_time_thunks=False)
+    with aesara.change_flags(profile_optimizer=True, cache_optimizations=False):
+        t0 = time.time()
+        f = aesara.function(
+            inputs, outputs, updates=updates, mode=mode, profile=profile
+        )
+        compile_time = time.time() - t0
+    # Do not count the profiling in the calls.
+    f.profile = None
+    hits, loads, compiles = [b - a for a, b in zip(stats, cache.stats)]
+
+    opt_profile = profile.optimizer_profile
+    result = {
+        "build_time": build_time,
+        "compile_time": compile_time,
+        "optimizer_time": profile.optimizer_time,
+        "optimizer_phases": _optimizer_phases(opt_profile),
+        "linker_time": profile.linker_time,
+        "import_time": profile.import_time,
+        "nodes_before": opt_profile[1][4] if opt_profile else None,
+        "nodes_after": len(f.maker.fgraph.apply_nodes),
+        "cmodule": {"hits": hits, "loads": loads, "compiles": compiles},
+        "compile_memory": _max_rss() - memory,
+        "max_memory": _max_rss(),
+    }
+
+    t0 = time.time()
+    f(*values)
+    result["first_call"] = time.time() - t0
+    times = []
+    for _ in range(n_calls):
+        t0 = time.perf_counter()
+        f(*values)
+        times.append(time.perf_counter() - t0)
+    times.sort()
+    result["call"] = {
+        "n": n_calls,
+        "min": times[0],
+        "median": times[len(times) // 2],
+        "mean": sum(times) / len(times),
+    }
+    # The part of the calls spent outside of the linked function.
+    fn_time = f.maker.mode.fn_time
+    call_time = f.maker.mode.call_time
+    for _ in range(n_calls):
+        f(*values)
+    result["call"]["overhead"] = (
+        (f.maker.mode.call_time - call_time) - (f.maker.mode.fn_time - fn_time)
+    ) / n_calls
+    print(json.dumps(result))
+
+
+def _revision():
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "HEAD"],
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                stderr=subprocess.DEVNULL,
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    from corpus import GRAPHS
+
+    names = args.graphs or list(GRAPHS)
+    unknown = [n for n in names if n not in GRAPHS]
+    if unknown:
+        sys.exit("Unknown graphs: %s (known: %s)" % (unknown, ", ".join(GRAPHS)))
+
+    env = dict(os.environ)
+    compiledir = tempfile.mkdtemp(prefix="aesara_bench_") if args.cold else None
+    env["THEANO_FLAGS"] = ",".join(
+        f
+        for f in (
+            env.get("THEANO_FLAGS", ""),
+            compiledir and "compiledir=" + compiledir,
+            args.flags,
+        )
+        if f
+    )
+    results = {}
+    try:
+        for name in names:
+            samples = []
+            for _ in range(args.repeat):
+                proc = subprocess.run(
+                    [
+                        sys.executable,
+                        os.path.abspath(__file__),
+                        "--worker",
+                        name,
+                        "--calls",
+                        str(args.calls),
+                        "--mode",
+                        args.mode,
+                    ],
+                    env=env,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                )
+                if proc.returncode:
+                    err = proc.stderr.decode().strip().split("\n")[-1]
+                    samples.append({"error": err[:500]})
+                    break
+                samples.append(json.loads(proc.stdout.decode().strip().split("\n")[-1]))
+            results[name] = samples
+            sample = samples[-1]
+            if "error" in sample:
+                print("%-16s failed: %s" % (name, sample["error"]), file=sys.stderr)
+            else:
+                print(
+                    "%-16s compile %.2fs (optimizer %.2fs, linker %.2fs), "
+                    "call %.2es"
+                    % (
+                        name,
+                        sample["compile_time"],
+                        sample["optimizer_time"],
+                        sample["linker_time"],
+                        sample["call"]["median"],
+                    ),
+                    file=sys.stderr,
+                )
+    finally:
+        if compiledir is not None:
+            shutil.rmtree(compiledir, ignore_errors=True)
+
+    import aesara
+
+    report = {
+        "revision": _revision(),
+        "aesara_version": aesara.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "mode": args.mode,
+        "flags": args.flags,
+        "cold": args.cold,
+        "benchmarks": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=1, sort_keys=True)
+    else:
+        json.dump(report, sys.stdout, indent=1, sort_keys=True)
+        print()
+
+
+def _best(samples, path):
+    """Smallest value of a metric over the samples of a benchmark."""
+    values = []
+    for sample in samples:
+        for key in path:
+            sample = sample.get(key) if isinstance(sample, dict) else None
+        if sample is not None:
+            values.append(sample)
+    return min(values) if values else None
+
+
+def compare(old_file, new_file, threshold):
+    with open(old_file) as f:
+        old = json.load(f)["benchmarks"]
+    with open(new_file) as f:
+        new = json.load(f)["benchmarks"]
+    print("%-16s %-10s %12s %12s %8s" % ("graph", "metric", "old", "new", "ratio"))
+    regressions = 0
+    for name in old:
+        if name not in new:
+            continue
+        for metric, path in COMPARED:
+            a = _best(old[name], path)
+            b = _best(new[name], path)
+            if a is None or b is None:
+                continue
+            ratio = b / a if a else float("inf") if b else 1.0
+            flag = ""
+            if ratio > 1 + threshold:
+                flag = "  slower"
+                regressions += 1
+            elif ratio < 1 - threshold:
+                flag = "  faster"
+            print(
+                "%-16s %-10s %12.4g %12.4g %8.2f%s" % (name, metric, a, b, ratio, flag)
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("graphs", nargs="*", help="Graphs to run, defaults to all")
+    parser.add_argument("-o", "--output", help="JSON file, defaults to stdout")
+    parser.add_argument(
+        "--calls", type=int, default=50, help="Number of timed calls per graph"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="Number of processes per graph"
+    )
+    parser.add_argument("--mode", default="FAST_RUN", help="Compilation mode")
+    parser.add_argument(
+        "--cold", action="store_true", help="Use a new compiledir for the run"
+    )
+    parser.add_argument("--flags", default="", help="Additional THEANO_FLAGS")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("OLD", "NEW"),
+        help="Compare two JSON files instead of running the benchmarks",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative change reported by --compare",
+    )
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        worker(args.worker, args.calls, args.mode)
+    elif args.compare:
+        sys.exit(1 if compare(*args.compare, threshold=args.threshold) else 0)
+    else:
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
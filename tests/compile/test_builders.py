@@ -406,3 +406,25 @@ class TestOpFromGraph(unittest_tools.InferShapeTester):
         f = op(y)
         grad_f = tt.grad(f, y)
         assert grad_f.tag.test_value is not None
+
+    def test_hoist_shared(self):
+        x = tt.vector("x")
+        y = tt.vector("y")
+        op = OpFromGraph([x, y], [tt.exp(x) * y + 1, tt.exp(x)])
+        a = tt.vector("a")
+        b = tt.vector("b")
+        o1, o2 = op(a, b)
+        out = [o1 + tt.exp(a), o2]
+        f = function([a, b], out, mode="FAST_RUN")
+        nodes = f.maker.fgraph.toposort()
+        (ofg_node,) = [n for n in nodes if isinstance(n.op, OpFromGraph)]
+        inner_nodes = aesara.gof.graph.io_toposort(
+            ofg_node.op.local_inputs, ofg_node.op.local_outputs
+        )
+        assert not any(n.op == tt.exp for n in inner_nodes)
+
+        av = np.random.rand(3).astype(config.floatX)
+        bv = np.random.rand(3).astype(config.floatX)
+        r1, r2 = f(av, bv)
+        np.testing.assert_allclose(r1, np.exp(av) * bv + 1 + np.exp(av), rtol=1e-5)
+        np.testing.assert_allclose(r2, np.exp(av), rtol=1e-5)
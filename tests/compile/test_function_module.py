@@ -426,6 +426,17 @@ class TestFunction:
         for in1, in2 in zip(test_def.maker.inputs, test_cpy.maker.inputs):
             assert in1.value is in2.value
 
+    def test_copy_inplace(self):
+        x = tt.dvector("x")
+        y = tt.exp(x)
+        # y + 1 is computed inplace, after the sum of y.
+        f = function([x], [tt.sum(y), y + 1], mode="FAST_RUN")
+        g = f.copy()
+        assert len(g.maker.fgraph.orderings()) == len(f.maker.fgraph.orderings())
+        x_val = np.arange(3.0)
+        for a, b in zip(f(x_val), g(x_val)):
+            assert np.allclose(a, b)
+
     def test_copy_delete_updates(self):
         w = tt.iscalar("w")
         x = tt.fscalar("x")
@@ -725,6 +736,72 @@ class TestFunction:
 
             assert f._check_for_aliased_inputs, d
 
+    def test_fast_call(self):
+        x = tt.dvector("x")
+        r = tt.drow("r")
+        w = aesara.shared(np.ones(3))
+        f = aesara.function([x, r], [x.dot(w) + r.sum()], updates=[(w, w * 2)])
+        assert f._fast_call is None
+        x_val = np.arange(3.0)
+        assert f(x_val, np.ones((1, 2)))[0] == 5
+        assert f._fast_call
+        # Arguments that need a conversion.
+        assert f([0.0, 1.0, 2.0], [[1.0, 1.0]])[0] == 8
+        np.testing.assert_allclose(w.get_value(), 4)
+        # The storage of the inputs is emptied after the call.
+        assert f.input_storage[0].storage[0] is None
+
+        assert f(x_val.astype("float32"), np.ones((1, 2)))[0] == 14
+        np.testing.assert_allclose(w.get_value(), 8)
+
+        # Errors come from the general path.
+        with pytest.raises(TypeError, match="Bad input argument"):
+            f(x_val.astype("complex128"), np.ones((1, 2)))
+        with pytest.raises(TypeError, match="Bad input argument"):
+            f(x_val, np.ones((2, 2)))
+        with pytest.raises(TypeError, match="Bad input argument"):
+            f(x_val[None], np.ones((1, 2)))
+        with pytest.raises(ValueError):
+            f(np.arange(4.0), np.ones((1, 2)))
+        np.testing.assert_allclose(w.get_value(), 8)
+
+    def test_fast_call_needs_general_path(self):
+        x, y = tt.dvectors("x", "y")
+        f = aesara.function([x, aesara.In(y, value=np.ones(2))], x + y)
+        np.testing.assert_allclose(f(np.ones(2)), 2)
+        assert f._fast_call is False
+        f = aesara.function([aesara.In(x, mutable=True)], x + 1)
+        np.testing.assert_allclose(f(np.ones(2)), 2)
+        assert f._fast_call is False
+
+    def test_map(self):
+        x = tt.dvector("x")
+        y = tt.dscalar("y")
+        w = aesara.shared(np.arange(3.0))
+        f = function([x, In(y, value=2.0)], [tt.dot(x, w) * y, x.sum()])
+        xs = np.random.rand(4, 3)
+        r1, r2 = f.map(xs)
+        for i in range(4):
+            assert np.allclose([r1[i], r2[i]], f(xs[i]))
+        # Only the first input is batched.
+        r1, r2 = f.map(xs, 3.0, batched=[0])
+        assert np.allclose(r1, xs.dot(np.arange(3.0)) * 3)
+        assert len(f._map_fns) == 1
+
+        ys = np.arange(4.0)
+        r1, r2 = f.map(xs, ys, batched=[0, 1])
+        assert np.allclose(r1, xs.dot(np.arange(3.0)) * ys)
+
+        g = function([x], [], updates=[(w, w + x)])
+        with pytest.raises(NotImplementedError):
+            g.map(xs)
+
+        # Outputs given as a dict.
+        h = function([x], {"sum": x.sum(), "max": x.max()})
+        r = h.map(xs)
+        assert np.allclose(r["sum"], xs.sum(axis=1))
+        assert np.allclose(r["max"], xs.max(axis=1))
+
 
 class TestPicklefunction:
     def test_deepcopy(self):
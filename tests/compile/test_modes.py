@@ -19,9 +19,27 @@ class TestBunchOfModes:
 
         # Linkers to use with regular Mode
         if aesara.config.cxx:
-            linkers = ["py", "c|py", "c|py_nogc", "vm", "vm_nogc", "cvm", "cvm_nogc"]
+            linkers = [
+                "py",
+                "c|py",
+                "c|py_nogc",
+                "vm",
+                "vm_nogc",
+                "cvm",
+                "cvm_nogc",
+                "vm_parallel",
+                "vm_parallel_nogc",
+            ]
         else:
-            linkers = ["py", "c|py", "c|py_nogc", "vm", "vm_nogc"]
+            linkers = [
+                "py",
+                "c|py",
+                "c|py_nogc",
+                "vm",
+                "vm_nogc",
+                "vm_parallel",
+                "vm_parallel_nogc",
+            ]
         modes = predef_modes + [Mode(linker, "fast_run") for linker in linkers]
 
         for mode in modes:
@@ -6,10 +6,17 @@ deterministic based on the input type and the op.
 """
 
 
+import os
+
 import numpy as np
+import pytest
 
 import aesara
-from aesara.gof.cmodule import GCC_compiler
+import aesara.tensor as tt
+from aesara.gof import compilelock
+from aesara.gof.cc import CLinker, compile_c_modules, prepared_linker
+from aesara.gof.cmodule import GCC_compiler, ModuleCache
+from aesara.gof.fg import FunctionGraph
 
 
 class MyOp(aesara.compile.ops.DeepCopyOp):
@@ -68,3 +75,171 @@ def test_flag_detection():
     # but was not detected because that path is not usually taken,
     # so we test it here directly.
     GCC_compiler.try_flags(["-lblas"])
+
+
+@pytest.mark.skipif(
+    not aesara.config.cxx or compilelock.fcntl is None,
+    reason="Concurrent compilation needs a C++ compiler and fcntl",
+)
+def test_compile_many(tmpdir):
+    x = tt.dvector("x")
+    items = []
+    for op in (tt.exp, tt.cos, tt.sin, tt.sqrt):
+        out = op(x)
+        fgraph = FunctionGraph(out.owner.inputs, out.owner.outputs)
+        lnk = CLinker().accept(fgraph)
+        items.append((lnk.cmodule_key(), lnk))
+
+    cache = ModuleCache(str(tmpdir), do_refresh=False)
+    cache.compile_many(items, n_workers=2)
+    assert cache.stats[2] == len(items)
+    for key, lnk in items:
+        cache.module_from_key(key, lnk)
+    # Everything was compiled by compile_many.
+    assert cache.stats[2] == len(items)
+
+    # Another process gets the modules from the key locks.
+    other = ModuleCache(str(tmpdir), do_refresh=False)
+    other.compile_many(items, n_workers=2)
+    assert other.stats[2] == 0
+    for key, lnk in items:
+        assert other.module_from_key(key, lnk) is not None
+    assert other.stats[2] == 0
+
+
+@pytest.mark.skipif(
+    not aesara.config.cxx or compilelock.fcntl is None,
+    reason="Concurrent compilation needs a C++ compiler and fcntl",
+)
+def test_compile_c_modules_linkers():
+    x = tt.dvector("x")
+    fgraph = FunctionGraph([x], [tt.cos(tt.exp(x))])
+    nodes = fgraph.toposort()
+    storage_map = {v: [None] for v in fgraph.variables}
+    compute_map = {v: [False] for v in fgraph.variables}
+
+    # Nothing is built when the modules are compiled one at a time.
+    compile_c_modules(nodes, storage_map, compute_map, [], n_workers=1)
+    assert all(prepared_linker(node, []) is None for node in nodes)
+
+    compile_c_modules(nodes, storage_map, compute_map, [], n_workers=2)
+    # Not for another no_recycling.
+    assert prepared_linker(nodes[0], nodes[0].outputs) is None
+    lnk = prepared_linker(nodes[1], [])
+    assert lnk is not None and hasattr(lnk, "_cmodule_key")
+    # A linker is given out once.
+    assert prepared_linker(nodes[1], []) is None
+
+
+@pytest.mark.skipif(not aesara.config.cxx, reason="Needs a C++ compiler")
+def test_publish_module(tmpdir):
+    x = tt.dvector("x")
+    out = tt.exp(x) * 2
+    fgraph = FunctionGraph([x], [out])
+    lnk = CLinker().accept(fgraph)
+    key = lnk.cmodule_key()
+
+    cache = ModuleCache(str(tmpdir), do_refresh=False)
+    module = cache.module_from_key(key, lnk)
+    (module_hash,) = cache.module_hash_to_key_data
+    # The module is published under its hash, nothing is left in staging.
+    assert os.path.dirname(module.__file__) == cache._module_dir(module_hash)
+    assert os.listdir(os.path.join(str(tmpdir), "staging")) == []
+
+    # Another process reuses it, without refreshing its cache.
+    other = ModuleCache(str(tmpdir), do_refresh=False)
+    assert other.module_from_key(key, lnk).__file__ == module.__file__
+    assert other.stats[2] == 0
+    # And finds it when refreshing.
+    other = ModuleCache(str(tmpdir))
+    assert other.module_from_key(key, lnk).__file__ == module.__file__
+    assert other.stats == [0, 1, 0]
+
+
+@pytest.mark.skipif(not aesara.config.cxx, reason="Needs a C++ compiler")
+def test_module_index(tmpdir):
+    x = tt.dvector("x")
+    out = tt.exp(x) * tt.cos(x)
+    lnk = CLinker().accept(FunctionGraph([x], [out]))
+    key = lnk.cmodule_key()
+
+    cache = ModuleCache(str(tmpdir))
+    module = cache.module_from_key(key, lnk)
+    (module_hash,) = cache.module_hash_to_key_data
+    module_dir = os.path.basename(os.path.dirname(module.__file__))
+
+    # Refreshing reads the index, not the key.pkl files.
+    other = ModuleCache(str(tmpdir))
+    assert other.module_index == {module_hash: module_dir}
+    assert other.loaded_key_pkl == set()
+    assert other.module_from_key(key, lnk).__file__ == module.__file__
+    assert other.stats == [0, 1, 0]
+
+    # Without index, the cache directory is walked, and the index rebuilt.
+    os.remove(os.path.join(str(tmpdir), ModuleCache.index_name))
+    other = ModuleCache(str(tmpdir))
+    assert len(other.loaded_key_pkl) == 1
+    assert ModuleCache(str(tmpdir)).module_index == {module_hash: module_dir}
+
+    # Only the new entries are read.
+    other._append_index([("mfoo", "tmpfoo")])
+    other.refresh()
+    assert other.module_index == {module_hash: module_dir, "mfoo": "tmpfoo"}
+
+    # The index is compacted after a cleanup, that keeps recent modules.
+    for _ in other.cleanup_steps():
+        pass
+    assert os.path.exists(module.__file__)
+    other.refresh()
+    assert other.module_index == {module_hash: module_dir}
+
+
+@pytest.mark.skipif(not aesara.config.cxx, reason="Needs a C++ compiler")
+def test_cleanup_steps(tmpdir):
+    x = tt.dvector("x")
+    out = tt.exp(x) * tt.sin(x)
+    lnk = CLinker().accept(FunctionGraph([x], [out]))
+    key = lnk.cmodule_key()
+    cache = ModuleCache(str(tmpdir))
+    module = cache.module_from_key(key, lnk)
+    module_dir = os.path.dirname(module.__file__)
+
+    marked = os.path.join(str(tmpdir), "tmpmarked")
+    os.mkdir(marked)
+    open(os.path.join(marked, "delete.me"), "w").close()
+    # Modules used by this cache are kept.
+    cache.clear_old(age_thresh_del=-1)
+    assert os.path.exists(module_dir)
+    assert not os.path.exists(marked)
+
+    # But not by another one.
+    other = ModuleCache(str(tmpdir))
+    steps = other.cleanup_steps(age_thresh_del=-1)
+    next(steps)
+    for _ in steps:
+        pass
+    assert not os.path.exists(module_dir)
+    assert ModuleCache(str(tmpdir)).module_index == {}
+
+
+def test_start_cleanup(tmpdir):
+    cache = ModuleCache(str(tmpdir), do_refresh=False)
+    thread = cache.start_cleanup()
+    if compilelock.fcntl is not None:
+        thread.join()
+    # Only one cleanup per interval.
+    assert cache.start_cleanup() is None
+    assert os.path.exists(os.path.join(str(tmpdir), "last_cleanup"))
+
+
+def test_cleanup_error_logged(tmpdir, monkeypatch, caplog):
+    cache = ModuleCache(str(tmpdir), do_refresh=False)
+
+    def cleanup_steps():
+        yield
+        raise OSError("disk gone")
+
+    monkeypatch.setattr(cache, "cleanup_steps", cleanup_steps)
+    with caplog.at_level("WARNING", logger="aesara.gof.cmodule"):
+        cache._cleanup_in_background()
+    assert "disk gone" in caplog.text
@@ -464,3 +464,45 @@ def test_multiple_inplace():
     OpSubOptimizer(multiple_in_place_1, multiple_in_place_0_1, fail).optimize(g)
     assert g.consistent()
     assert fail.failures == 1
+
+
+def check_order(g):
+    order = g.destroy_handler.order
+    ords = g.destroy_handler.orderings(g, ordered=False)
+    assert order.valid
+    assert set(order.pos) == g.apply_nodes
+    assert sorted(order.pos.values()) == order.sorted_pos
+    for app in g.apply_nodes:
+        for parent in [i.owner for i in app.inputs if i.owner] + list(
+            ords.get(app, ())
+        ):
+            assert order.pos[parent] < order.pos[app]
+
+
+def test_incremental_order():
+    x, y, z = inputs()
+    s = sigmoid(y)
+    e1 = add(x, s)
+    e2 = dot(transpose_view(x), z)
+    g = Env([x, y, z], [e1, e2])
+    # The order is only built once the graph contains a destroyer.
+    assert not g.destroy_handler.order.valid
+
+    # The in-place add has to run after the dot that reads x.
+    e1_inplace = add_in_place(x, s)
+    g.replace_validate(e1, e1_inplace)
+    check_order(g)
+
+    # The dot can not both read x and use the result of the in-place add.
+    with pytest.raises(InconsistencyError):
+        g.replace_validate(z, e1_inplace)
+    check_order(g)
+    assert not destroyhandler._contains_cycle(
+        g, g.destroy_handler.orderings(g, ordered=False)
+    )
+
+    g.replace_validate(e2.owner.inputs[0], sigmoid(s))
+    check_order(g)
+    g.replace_validate(e2, dot(e1_inplace, z))
+    check_order(g)
+    assert str(g) == "[*1 -> AddInPlace(x, Sigmoid(y)), Dot(*1, z)]"
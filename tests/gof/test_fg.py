@@ -11,3 +11,19 @@ class TestFunctionGraph:
 
         s = pickle.dumps(func)
         pickle.loads(s)
+
+    def test_toposort_cache(self):
+        x = tt.vector("x")
+        y = tt.exp(x) + 1
+        func = FunctionGraph([x], [y * 2])
+        order = func.toposort()
+        assert len(order) == len(func.apply_nodes)
+        order.pop()
+        assert func.toposort() == func.toposort()
+        assert len(func.toposort()) == len(func.apply_nodes)
+
+        z = tt.log(func.outputs[0].owner.inputs[0])
+        func.replace(func.outputs[0], z)
+        order = func.toposort()
+        assert len(order) == len(func.apply_nodes)
+        assert order[-1] is z.owner
@@ -1,45 +1,142 @@
 import os
 
 import numpy as np
+import pytest
 
 import aesara
 import aesara.tensor as tt
+from aesara.compile.function_module import std_fgraph
+from aesara.compile.mode import get_mode
+from aesara.compile.optcache import (
+    OptimizedGraphCache,
+    get_optimized_graph_cache,
+    graph_key,
+)
 
 
 floatX = "float32"
 
 
-def test_graph_opt_caching():
-    opt_db_file = os.path.join(aesara.config.compiledir, "optimized_graphs.pkl")
-    if os.path.exists(opt_db_file):
-        os.remove(opt_db_file)
+@pytest.fixture
+def opt_cache():
+    get_optimized_graph_cache().clear()
+    default = aesara.config.cache_optimizations
+    aesara.config.cache_optimizations = True
+    yield get_optimized_graph_cache()
+    aesara.config.cache_optimizations = default
+    get_optimized_graph_cache().clear()
+
 
+def _mode():
     mode = aesara.config.mode
     if mode in ["DEBUG_MODE", "DebugMode"]:
         mode = "FAST_RUN"
-    default = aesara.config.cache_optimizations
-    try:
-        aesara.config.cache_optimizations = True
-        a = tt.fmatrix("a")
-        b = tt.fmatrix("b")
-        c = aesara.shared(np.ones((10, 10), dtype=floatX))
-        d = aesara.shared(np.ones((10, 10), dtype=floatX))
-        e = tt.sum(tt.sum(tt.sum(a ** 2 + b) + c) + d)
-        f1 = aesara.function([a, b], e, mode=mode)
-
-        m = tt.fmatrix("x1")
-        n = tt.fmatrix("x2")
-        p = aesara.shared(np.ones((10, 10), dtype=floatX))
-        q = aesara.shared(np.ones((10, 10), dtype=floatX))
-        j = tt.sum(tt.sum(tt.sum(m ** 2 + n) + p) + q)
-        f2 = aesara.function([m, n], j, mode=mode)
-
-        in1 = np.ones((10, 10), dtype=floatX)
-        in2 = np.ones((10, 10), dtype=floatX)
-        assert f1(in1, in2) == f2(in1, in2)
-    finally:
-        aesara.config.cache_optimizations = default
-
-
-if __name__ == "__main__":
-    test_graph_opt_caching()
+    return mode
+
+
+def test_graph_opt_caching(opt_cache):
+    mode = _mode()
+    a = tt.fmatrix("a")
+    b = tt.fmatrix("b")
+    c = aesara.shared(np.ones((10, 10), dtype=floatX))
+    d = aesara.shared(np.ones((10, 10), dtype=floatX))
+    e = tt.sum(tt.sum(tt.sum(a ** 2 + b) + c) + d)
+    f1 = aesara.function([a, b], e, mode=mode)
+
+    m = tt.fmatrix("x1")
+    n = tt.fmatrix("x2")
+    p = aesara.shared(np.ones((10, 10), dtype=floatX) * 2)
+    q = aesara.shared(np.ones((10, 10), dtype=floatX) * 3)
+    j = tt.sum(tt.sum(tt.sum(m ** 2 + n) + p) + q)
+    f2 = aesara.function([m, n], j, mode=mode)
+
+    # f2 must use its own shared variables.
+    assert {v.get_value()[0, 0] for v in f2.get_shared()} == {2, 3}
+
+    in1 = np.ones((10, 10), dtype=floatX)
+    in2 = np.ones((10, 10), dtype=floatX)
+    assert f1(in1, in2) == 100 * (100 * (200 + 1) + 1)
+    assert f2(in1, in2) == 100 * (100 * (200 + 2) + 3)
+
+
+def test_cache_hit(opt_cache):
+    def build(value):
+        x = tt.fmatrix("x")
+        w = aesara.shared(np.full((3, 3), value, dtype=floatX))
+        y = tt.tanh(tt.dot(x, w)) + tt.exp(x)
+        return aesara.function([x], y, updates=[(w, w * 2)], mode=_mode())
+
+    x_val = np.ones((2, 3), dtype=floatX)
+    f1 = build(1)
+    entries = [n for n in os.listdir(opt_cache.dirname) if n != "index.pkl"]
+    assert len(entries) == 1
+    f2 = build(0.5)
+    assert [n for n in os.listdir(opt_cache.dirname) if n != "index.pkl"] == entries
+    assert len(f1.maker.fgraph.apply_nodes) == len(f2.maker.fgraph.apply_nodes)
+
+    for _ in range(2):
+        np.testing.assert_allclose(
+            f1(x_val), np.tanh(x_val.dot(f1.get_shared()[0].get_value() / 2)) + np.e
+        )
+        np.testing.assert_allclose(
+            f2(x_val), np.tanh(x_val.dot(f2.get_shared()[0].get_value() / 2)) + np.e
+        )
+
+
+def test_graph_key():
+    optimizer = get_mode("FAST_RUN").optimizer
+
+    def key(build):
+        x = tt.vector("x")
+        y = tt.vector("y")
+        fgraph, _ = std_fgraph([aesara.In(x), aesara.In(y)], [aesara.Out(build(x, y))])
+        return graph_key(fgraph, optimizer)
+
+    # The order in which the graph is built does not matter.
+    def build1(x, y):
+        a = tt.exp(x)
+        b = tt.log(y)
+        return a * b
+
+    def build2(x, y):
+        b = tt.log(y)
+        a = tt.exp(x)
+        return a * b
+
+    assert key(build1) == key(build2)
+    assert key(build1) != key(lambda x, y: tt.exp(x) * tt.log(x))
+    assert key(build1) != key(lambda x, y: tt.exp(y) * tt.log(x))
+    assert key(lambda x, y: x + 1) != key(lambda x, y: x + 2)
+
+
+def test_eviction(tmpdir):
+    cache = OptimizedGraphCache(str(tmpdir), max_size=1)
+    x = tt.vector()
+    fgraph, _ = std_fgraph([aesara.In(x)], [aesara.Out(tt.exp(x))])
+    cache.add("a", fgraph)
+    assert cache.get("a", fgraph.inputs) is None
+    cache.max_size = 2 ** 20
+    cache.add("b", fgraph)
+    cache.add("c", fgraph)
+    outs = cache.get("b", fgraph.inputs)
+    assert outs[0].owner.inputs[0] is fgraph.inputs[0]
+    assert cache.get("c", fgraph.inputs) is not None
+
+
+def test_scan_inner_graph(opt_cache):
+    optimizer = get_mode("FAST_RUN").optimizer
+
+    def build(fn):
+        x = tt.fvector("x")
+        y, _ = aesara.scan(fn, sequences=[x])
+        fgraph, _ = std_fgraph([aesara.In(x)], [aesara.Out(y)])
+        return graph_key(fgraph, optimizer), aesara.function([x], y, mode=_mode())
+
+    # The two scans only differ by their inner graph.
+    x_val = np.ones(2, dtype=floatX)
+    key_tanh, f_tanh = build(tt.tanh)
+    key_exp, f_exp = build(tt.exp)
+    assert key_tanh is not None and key_tanh != key_exp
+    np.testing.assert_allclose(f_tanh(x_val), np.tanh(x_val), rtol=1e-5)
+    np.testing.assert_allclose(f_exp(x_val), np.exp(x_val), rtol=1e-5)
+    assert build(tt.exp)[0] == key_exp
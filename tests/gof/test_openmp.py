@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+import aesara
+import aesara.tensor as tt
+from aesara import config, scalar
+from aesara.configparser import change_flags
+from aesara.gof import openmp
+from aesara.gof.op import OpenMPOp
+from tests import unittest_tools as utt
+
+
+omp_lib = pytest.mark.skipif(
+    openmp.get_num_threads() is None, reason="The OpenMP runtime can't be loaded"
+)
+
+
+@omp_lib
+def test_num_threads():
+    n = openmp.get_num_threads()
+    with openmp.num_threads(1, blas=False):
+        assert openmp.get_num_threads() == 1
+        with openmp.num_threads(2, blas=False):
+            assert openmp.get_num_threads() == 2
+        assert openmp.get_num_threads() == 1
+    assert openmp.get_num_threads() == n
+
+
+@omp_lib
+@pytest.mark.skipif(not config.cxx, reason="G++ not available")
+def test_thread_budget():
+    if not OpenMPOp.test_gxx_support():
+        pytest.skip("The compiler doesn't support OpenMP")
+    x = tt.dvector("x")
+    x_val = np.random.rand(1000)
+    s = scalar.float64()
+    op = tt.Elemwise(scalar.Composite([s], [scalar.exp(s) * 2]), openmp=True)
+    with change_flags(openmp_elemwise_minsize=0):
+        f_default = aesara.function([x], op(x), mode="FAST_RUN")
+    assert hasattr(f_default.fn.thunks[0], "cthunk")
+    with change_flags(openmp_elemwise_minsize=0, openmp_num_threads=2):
+        f = aesara.function([x], op(x), mode="FAST_RUN")
+    # The budgeted thunk isn't called directly from C.
+    assert not hasattr(f.fn.thunks[0], "cthunk")
+
+    n = openmp.get_num_threads()
+    utt.assert_allclose(f(x_val), np.exp(x_val) * 2)
+    utt.assert_allclose(f(x_val), f_default(x_val))
+    assert openmp.get_num_threads() == n
@@ -9,7 +9,9 @@ import aesara
 from aesara import function, tensor
 from aesara.compile import Mode
 from aesara.gof import OpWiseCLinker, vm
-from aesara.ifelse import ifelse
+from aesara.ifelse import IfElse, ifelse
+from aesara.scan_module.scan_op import Scan
+from tests import unittest_tools as utt
 
 
 class TestCallbacks:
@@ -68,6 +70,48 @@ def test_c_thunks():
         assert any([hasattr(t, "cthunk") for t in f.fn.thunks]) == c_thunks
 
 
+@pytest.mark.skipif(
+    not aesara.config.cxx, reason="G++ not available, so we need to skip this test."
+)
+@pytest.mark.parametrize("as_view", [True, False])
+def test_cvm_ifelse(as_view):
+    class CIfElse(IfElse):
+        # The CVM selects the branch itself when the values are ndarrays.
+        def make_thunk(self, node, storage_map, compute_map, no_recycling, impl=None):
+            thunk = super().make_thunk(node, storage_map, compute_map, no_recycling)
+
+            def c_only():
+                for v in node.inputs[1:]:
+                    if compute_map[v][0] and isinstance(storage_map[v][0], np.ndarray):
+                        raise AssertionError("IfElse thunk called for ndarrays")
+                return thunk()
+
+            c_only.__dict__.update(thunk.__dict__)
+            return c_only
+
+    a = tensor.iscalar("a")
+    b, c = tensor.dvectors("bc")
+    x, y = CIfElse(2, as_view=as_view)(a, b * 2, b, c + 1, c)
+    f = function([a, b, c], [x, y], mode=Mode(optimizer=None, linker="cvm"))
+    b_val = np.arange(3.0)
+    c_val = np.arange(2.0)
+    x_val, y_val = f(1, b_val, c_val)
+    utt.assert_allclose(x_val, b_val * 2)
+    utt.assert_allclose(y_val, b_val)
+    # The false branch is always copied.
+    x_val, y_val = f(0, b_val, c_val)
+    utt.assert_allclose(x_val, c_val + 1)
+    utt.assert_allclose(y_val, c_val)
+    y_val[0] = 5
+    assert c_val[0] == 0
+
+    # Branches that are not ndarrays go through the thunk.
+    s = aesara.gof.generic()
+    z = CIfElse(1)(a, s, s)
+    f = function([a, s], z, mode=Mode(optimizer=None, linker="cvm"))
+    assert f(1, [1, 2]) == [1, 2]
+
+
 @pytest.mark.skipif(
     not aesara.config.cxx, reason="G++ not available, so we need to skip this test."
 )
@@ -456,3 +500,239 @@ def test_no_recycling():
         m1 = f.fn.thunks[0].thunk.module
         m2 = f2.fn.thunks[0].thunk.module
         assert m1 is m2
+
+
+class TestParallelLoop:
+    def _mode(self, **kwargs):
+        kwargs.setdefault("n_threads", 4)
+        return aesara.Mode(
+            optimizer="fast_run",
+            linker=vm.VM_Linker(use_cloop=False, parallel=True, **kwargs),
+        )
+
+    @pytest.mark.parametrize("allow_gc", [True, False])
+    def test_wide_graph(self, allow_gc):
+        x = tensor.matrix("x")
+        heads = [tensor.tanh(x * i + 1).sum() for i in range(8)]
+        f = function([x], heads, mode=self._mode(allow_gc=allow_gc))
+        assert isinstance(f.fn, vm.ParallelLoop)
+
+        x_val = np.random.rand(5, 4).astype(aesara.config.floatX)
+        ref = function([x], heads, mode=aesara.Mode(linker="py"))(x_val)
+        for _ in range(3):
+            out = f(x_val)
+            for o, r in zip(out, ref):
+                utt.assert_allclose(o, r)
+
+        intermediates = [
+            v
+            for v in f.fn.storage_map
+            if v.owner is not None and v not in f.maker.fgraph.outputs
+        ]
+        assert intermediates
+        if allow_gc:
+            assert all(f.fn.storage_map[v][0] is None for v in intermediates)
+        else:
+            assert all(f.fn.storage_map[v][0] is not None for v in intermediates)
+
+    def test_inplace(self):
+        # The destroy_map ordering must be respected: the inplace node may
+        # only run once every other reader of its input is done.
+        x = tensor.vector("x")
+        y = x * 2
+        outs = [y.sum(), tensor.exp(y) + 1, tensor.log(y + 3) + 1]
+        f = function([x], outs, mode=self._mode())
+        assert any(
+            getattr(n.op, "destroy_map", None) for n in f.maker.fgraph.toposort()
+        )
+        x_val = np.arange(1, 4).astype(aesara.config.floatX)
+        ref = function([x], outs, mode=aesara.Mode(linker="py"))(x_val)
+        for _ in range(5):
+            for o, r in zip(f(x_val), ref):
+                utt.assert_allclose(o, r)
+
+    def test_lazy_fallback(self):
+        a, b = tensor.scalars("ab")
+        f = function([a, b], ifelse(a, a * b, b), mode=self._mode())
+        assert isinstance(f.fn, vm.Stack)
+        assert f(1, 2) == 2
+
+    def test_error(self):
+        x = tensor.vector("x")
+        y = tensor.vector("y")
+        f = function([x, y], [x + y, x * 2], mode=self._mode())
+        with pytest.raises(ValueError):
+            f([1, 2], [3, 4, 5])
+
+    def test_profile(self):
+        x = tensor.vector("x")
+        f = function(
+            [x],
+            [x + 1, x * 2],
+            mode=self._mode(),
+            profile=aesara.compile.ProfileStats(),
+        )
+        f([1, 2])
+        f([1, 2])
+        assert sum(f.profile.apply_callcount.values()) == 4
+
+    def test_scan(self):
+        # The two directions of a bidirectional RNN are independent.
+        x = tensor.matrix("x")
+        w = tensor.matrix("w")
+        h0 = tensor.vector("h0")
+
+        def step(x_t, h, w):
+            return tensor.tanh(x_t + tensor.dot(h, w))
+
+        fwd, _ = aesara.scan(step, sequences=x, outputs_info=h0, non_sequences=w)
+        bwd, _ = aesara.scan(step, sequences=x[::-1], outputs_info=h0, non_sequences=w)
+        outs = [fwd, bwd]
+
+        f = function([x, w, h0], outs, mode=self._mode())
+        assert isinstance(f.fn, vm.ParallelLoop)
+        rng = np.random.RandomState(utt.fetch_seed())
+        x_val = rng.rand(20, 5).astype(aesara.config.floatX)
+        w_val = rng.rand(5, 5).astype(aesara.config.floatX)
+        h_val = np.zeros(5, dtype=aesara.config.floatX)
+        ref = function([x, w, h0], outs, mode=aesara.Mode(linker="py"))
+        ref_vals = ref(x_val, w_val, h_val)
+        for _ in range(5):
+            for o, r in zip(f(x_val, w_val, h_val), ref_vals):
+                utt.assert_allclose(o, r)
+
+        # The two ops are equal, but each one has its own inner function.
+        scans = [i for i, n in enumerate(f.fn.nodes) if isinstance(n.op, Scan)]
+        locks = {f.fn.nodes[i].op._fn_lock for i in scans}
+        assert len(scans) == len(locks) == 2
+
+    @pytest.mark.skipif(
+        not aesara.config.blas.ldflags,
+        reason="Scan only releases the GIL in the BLAS calls",
+    )
+    def test_scan_overlap(self):
+        x = tensor.tensor3("x")
+        w = tensor.matrix("w")
+        h0 = tensor.matrix("h0")
+
+        def step(x_t, h, w):
+            return tensor.tanh(x_t + tensor.dot(h, w))
+
+        fwd, _ = aesara.scan(step, sequences=x, outputs_info=h0, non_sequences=w)
+        bwd, _ = aesara.scan(step, sequences=x[::-1], outputs_info=h0, non_sequences=w)
+        f = function([x, w, h0], [fwd, bwd], mode=self._mode())
+
+        # Record when the inner function of each scan runs its steps.
+        class TimedFn:
+            def __init__(self, fn):
+                self.fn = fn
+                self.times = []
+
+            def __call__(self):
+                t0 = time.perf_counter()
+                self.fn()
+                self.times.append((t0, time.perf_counter()))
+
+            def __getattr__(self, name):
+                return getattr(self.fn, name)
+
+        timed = []
+        for node in f.maker.fgraph.toposort():
+            if isinstance(node.op, Scan):
+                node.op.fn.fn = TimedFn(node.op.fn.fn)
+                timed.append(node.op.fn.fn)
+        assert len(timed) == 2
+
+        rng = np.random.RandomState(utt.fetch_seed())
+        x_val = rng.rand(50, 64, 128).astype(aesara.config.floatX)
+        w_val = (rng.rand(128, 128) / 128).astype(aesara.config.floatX)
+        h_val = np.zeros((64, 128), dtype=aesara.config.floatX)
+        overlaps = []
+        for _ in range(5):
+            for t in timed:
+                del t.times[:]
+            f(x_val, w_val, h_val)
+            starts = [t.times[0][0] for t in timed]
+            ends = [t.times[-1][1] for t in timed]
+            overlaps.append(max(starts) < min(ends))
+        # One scan runs steps while the other one has not finished.
+        assert any(overlaps)
+
+
+class TestMemoryPlan:
+    def _graph(self):
+        x = tensor.matrix("x")
+        w = tensor.matrix("w")
+        h = x
+        for i in range(4):
+            h = tensor.tanh(tensor.dot(h, w) + i)
+        return [x, w], h.sum()
+
+    def test_plan(self):
+        inputs, out = self._graph()
+        f = function(inputs, out, mode=Mode(linker="vm").excluding("inplace"))
+        order = f.maker.linker.schedule(f.maker.fgraph)
+        plan = vm.calculate_memory_plan(order, f.maker.fgraph)
+        planned = [v for slot in plan for v in slot]
+        assert len(planned) == len(set(planned))
+        assert len(plan) < len(planned)
+        for slot in plan:
+            assert all(v.type == slot[0].type for v in slot)
+            assert all(v not in f.maker.fgraph.outputs for v in slot)
+
+    def test_no_aliased(self):
+        x = tensor.vector("x")
+        y = (x + 1)[1:]
+        out = tensor.exp(y) * 2
+        f = function([x], out, mode=Mode(linker="vm", optimizer=None))
+        order = f.maker.linker.schedule(f.maker.fgraph)
+        planned = {
+            v for slot in vm.calculate_memory_plan(order, f.maker.fgraph) for v in slot
+        }
+        assert y not in planned
+        assert y.owner.inputs[0] not in planned
+
+    @pytest.mark.parametrize("linker", ["vm", "vm_nogc"])
+    def test_buffers_reused(self, linker):
+        inputs, out = self._graph()
+        x_val = np.random.rand(5, 5).astype(aesara.config.floatX)
+        w_val = np.random.rand(5, 5).astype(aesara.config.floatX)
+        ref = function(inputs, out, mode=Mode(linker="py"))(x_val, w_val)
+        f = function(inputs, out, mode=Mode(linker=linker).excluding("inplace"))
+        intermediates = [
+            v
+            for v in f.maker.fgraph.variables
+            if v.owner and v not in f.maker.fgraph.outputs
+        ]
+
+        def buffers():
+            return {
+                id(f.fn.storage_map[v][0])
+                for v in intermediates
+                if f.fn.storage_map[v][0] is not None
+            }
+
+        utt.assert_allclose(f(x_val, w_val), ref)
+        first = buffers()
+        assert 0 < len(first) < len(intermediates)
+        utt.assert_allclose(f(x_val, w_val), ref)
+        assert buffers() == first
+
+    def test_disabled(self):
+        inputs, out = self._graph()
+        with aesara.change_flags(**{"vm.memory_plan": False}):
+            f = function(inputs, out, mode=Mode(linker="vm").excluding("inplace"))
+        assert not any(f.fn.post_thunk_transfer)
+
+    def test_profile(self):
+        inputs, out = self._graph()
+        mode = Mode(linker="vm").excluding("inplace")
+        profile = aesara.compile.ProfileStats(atexit_print=False)
+        f = function(inputs, out, mode=mode, profile=profile)
+        assert profile.memory_plan[f.maker.fgraph]
+
+        # The plan is not reported when it is not applied.
+        profile = aesara.compile.ProfileStats(atexit_print=False)
+        with aesara.change_flags(**{"vm.memory_plan": False}):
+            f = function(inputs, out, mode=mode, profile=profile)
+        assert f.maker.fgraph not in profile.memory_plan
@@ -3537,6 +3537,32 @@ for{cpu,scan_fn}.2 [id H] ''
         out = f(vx)
         assert len(out) == 24
 
+    @pytest.mark.parametrize("linker", ["py", "cvm"])
+    @pytest.mark.parametrize("stop", [0, 15, 16, 40, 99])
+    def test_while_growing_output(self, stop, linker):
+        # The sit_sot and nit_sot buffers of a while loop grow with the
+        # number of steps actually run.
+        x = tensor.matrix("x")
+
+        def lambda_fn(x_t, h_tm1):
+            return [h_tm1 + x_t, x_t * 2], aesara.scan_module.until(x_t[0] > 3)
+
+        (h, o), _ = aesara.scan(
+            lambda_fn, x, outputs_info=[tensor.zeros_like(x[0]), None]
+        )
+        f = aesara.function([x], [h, o], mode=aesara.Mode(linker=linker))
+        vx = np.zeros((100, 3), dtype=aesara.config.floatX)
+        vx[:, 1] = np.arange(100)
+        vx[stop, 0] = 4
+        for _ in range(2):
+            h_val, o_val = f(vx)
+            utt.assert_allclose(h_val, vx[: stop + 1].cumsum(0))
+            utt.assert_allclose(o_val, vx[: stop + 1] * 2)
+            if stop < 16:
+                # The outputs are views on the initial buffers.
+                assert h_val.base.shape[0] == 17
+                assert o_val.base.shape[0] == 16
+
     def test_while1(self):
         x = tensor.vector("x")
 
@@ -4851,6 +4877,132 @@ for{cpu,scan_fn}.2 [id H] ''
         else:
             assert detect_large_outputs.large_count == 3
 
+    @pytest.mark.skipif(
+        not aesara.config.cxx, reason="G++ not available, so we need to skip this test."
+    )
+    def test_fuse_inner(self):
+        x = tensor.dmatrix("x")
+        h0 = tensor.dvector("h0")
+        w = aesara.shared(np.eye(3) * 0.5)
+        mode = aesara.Mode(linker="cvm", optimizer="fast_run")
+
+        def step(x_t, h_tm1):
+            return tensor.tanh(x_t + tensor.dot(h_tm1, w))
+
+        out, _ = aesara.scan(step, sequences=[x], outputs_info=[h0], mode=mode)
+        x_val = np.random.rand(5, 3)
+        h0_val = np.random.rand(3)
+        expected = aesara.function([x, h0], out, mode=mode)(x_val, h0_val)
+        with aesara.change_flags(**{"scan.fuse_inner": True}):
+            f = aesara.function([x, h0], out, mode=mode)
+        (scan_node,) = scan_nodes_from_fct(f)
+        assert isinstance(scan_node.op.fn.maker.linker, aesara.gof.CLinker)
+        utt.assert_allclose(f(x_val, h0_val), expected)
+
+        # An inner Op without C code falls back to the VM.
+        def step_py(x_t):
+            return aesara.compile.ops.as_op([tensor.dvector], [tensor.dvector])(
+                lambda v: v * 2
+            )(x_t)
+
+        out, _ = aesara.scan(step_py, sequences=[x], mode=mode)
+        with aesara.change_flags(**{"scan.fuse_inner": True}):
+            f = aesara.function([x], out, mode=mode)
+        (scan_node,) = scan_nodes_from_fct(f)
+        assert not isinstance(scan_node.op.fn.maker.linker, aesara.gof.CLinker)
+        utt.assert_allclose(f(x_val), x_val * 2)
+
+    def test_shared_inner_fn(self):
+        # Two layers with the same step compile their inner graph once.
+        x = tensor.dmatrix("x")
+        h0 = tensor.dvector("h0")
+        w1 = tensor.dmatrix("w1")
+        w2 = tensor.dmatrix("w2")
+
+        def step(x_t, h_tm1, w):
+            return tensor.tanh(x_t + tensor.dot(h_tm1, w))
+
+        h1, _ = aesara.scan(step, sequences=[x], outputs_info=[h0], non_sequences=w1)
+        h2, _ = aesara.scan(step, sequences=[h1], outputs_info=[h0], non_sequences=w2)
+        f = aesara.function([x, h0, w1, w2], [h1, h2], mode=mode_with_opt)
+        node1, node2 = scan_nodes_from_fct(f)
+        assert node1.op == node2.op
+        # The second op reuses the optimized graph of the first one, but has
+        # its own storage and lock.
+        fn1, fn2 = node1.op.fn, node2.op.fn
+        assert fn1 is not fn2
+        assert [n.op for n in fn1.maker.fgraph.toposort()] == [
+            n.op for n in fn2.maker.fgraph.toposort()
+        ]
+        assert not {id(c) for c in fn1.input_storage} & {
+            id(c) for c in fn2.input_storage
+        }
+        assert node1.op._fn_lock is not node2.op._fn_lock
+
+        rng = np.random.RandomState(utt.fetch_seed())
+        x_val = rng.rand(5, 3)
+        h0_val = rng.rand(3)
+        w1_val = rng.rand(3, 3)
+        w2_val = rng.rand(3, 3)
+        ref = aesara.function([x, h0, w1, w2], [h1, h2], mode=aesara.Mode(linker="py"))
+        for o, r in zip(
+            f(x_val, h0_val, w1_val, w2_val), ref(x_val, h0_val, w1_val, w2_val)
+        ):
+            utt.assert_allclose(o, r)
+
+    def test_bidirectional_locks(self):
+        # The two directions of a bidirectional layer can run at the same
+        # time.
+        x = tensor.dmatrix("x")
+        h0 = tensor.dvector("h0")
+        w_f = tensor.dmatrix("w_f")
+        w_b = tensor.dmatrix("w_b")
+
+        def step(x_t, h_tm1, w):
+            return tensor.tanh(x_t + tensor.dot(h_tm1, w))
+
+        h_f, _ = aesara.scan(step, sequences=[x], outputs_info=[h0], non_sequences=w_f)
+        h_b, _ = aesara.scan(
+            step,
+            sequences=[x],
+            outputs_info=[h0],
+            non_sequences=w_b,
+            go_backwards=True,
+        )
+        f = aesara.function([x, h0, w_f, w_b], [h_f, h_b], mode=mode_with_opt)
+        node_f, node_b = scan_nodes_from_fct(f)
+        assert node_f.op == node_b.op
+        assert node_f.op._fn_lock is not node_b.op._fn_lock
+
+        rng = np.random.RandomState(utt.fetch_seed())
+        vals = [rng.rand(5, 3), rng.rand(3), rng.rand(3, 3), rng.rand(3, 3)]
+        ref = aesara.function(
+            [x, h0, w_f, w_b], [h_f, h_b], mode=aesara.Mode(linker="py")
+        )
+        for o, r in zip(f(*vals), ref(*vals)):
+            utt.assert_allclose(o, r)
+
+    def test_inner_graph_signature(self):
+        from aesara.scan_module.scan_op import _inner_graph_signature
+
+        def outer_step(x_t, n):
+            # A nested scan, whose number of steps is a constant.
+            r, _ = aesara.scan(lambda h: h * 2, outputs_info=[x_t], n_steps=n)
+            return r[-1]
+
+        def signature(n):
+            x = tensor.dmatrix("x")
+            r, _ = aesara.scan(lambda x_t: outer_step(x_t, n), sequences=[x])
+            (op,) = [
+                v.owner.op
+                for v in aesara.gof.graph.ancestors([r])
+                if v.owner and isinstance(v.owner.op, Scan)
+            ]
+            return _inner_graph_signature(op.inputs, op.outputs)
+
+        assert signature(3) == signature(3)
+        assert signature(3) != signature(4)
+
 
 class ScanGpuTests:
     """
@@ -4,6 +4,7 @@ import pytest
 import aesara
 import aesara.gpuarray
 import aesara.tensor as tt
+from aesara.scan_module.scan_checkpoints import checkpoint_schedule
 
 
 try:
@@ -79,6 +80,48 @@ class TestScanCheckpoint:
             with pytest.raises(GpuArrayException):
                 f(data, 1000)
 
+    def test_auto_schedule(self):
+        for kwargs in [{}, {"memory_budget": 10000}]:
+            result, _ = aesara.scan_checkpoints(
+                fn=lambda prior_result, A: prior_result * A,
+                outputs_info=tt.ones_like(self.A),
+                non_sequences=self.A,
+                n_steps=self.k,
+                save_every_N=None,
+                **kwargs,
+            )
+            grad_A = tt.grad(result[-1].sum(), self.A)
+            f = aesara.function(inputs=[self.A, self.k], outputs=[self.grad_A, grad_A])
+            out, out_check = f(range(10), 101)
+            assert np.allclose(out, out_check)
+
+    def test_checkpoint_schedule(self):
+        assert checkpoint_schedule(100) == 10
+        assert checkpoint_schedule(101) == 11
+        # 100 / N + N <= 29 for N up to 25.
+        assert checkpoint_schedule(100, 29) == 25
+        # Too small for any schedule.
+        assert checkpoint_schedule(100, 10) == 10
+        assert checkpoint_schedule(100, 1000) == 100
+        assert checkpoint_schedule(self.k, 29).eval({self.k: 100}) == 25
+
+    def test_padding(self):
+        x = tt.matrix("x")
+        result, _ = aesara.scan(
+            fn=lambda x_t, h: h + x_t, sequences=[x], outputs_info=tt.zeros((3,))
+        )
+        x_val = np.random.rand(10, 3).astype(aesara.config.floatX)
+        for save_every_N in [5, 4, None]:
+            result_check, _ = aesara.scan_checkpoints(
+                fn=lambda x_t, h: h + x_t,
+                sequences=[x],
+                outputs_info=tt.zeros((3,)),
+                save_every_N=save_every_N,
+            )
+            f = aesara.function([x], [result[-1], result_check[-1]])
+            out, out_check = f(x_val)
+            assert np.allclose(out, out_check)
+
     def test_taps_error(self):
         # Test that an error rises if we use taps in outputs_info.
         with pytest.raises(RuntimeError):
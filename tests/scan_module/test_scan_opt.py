@@ -423,3 +423,122 @@ class TestPushOutSumOfDot:
         output_no_opt = f_no_opt(input1_value, input2_value, input3_value)
 
         utt.assert_allclose(output_opt, output_no_opt)
+
+
+class TestScanVectorizeMap:
+    def setup_method(self):
+        self.rng = np.random.RandomState(utt.fetch_seed())
+        self.mode = aesara.compile.mode.get_mode("FAST_RUN").including(
+            "scan_vectorize_map"
+        )
+
+    def test_map(self):
+        x = tt.matrix("x")
+        w = aesara.shared(self.rng.rand(4, 3).astype(config.floatX))
+        out, _ = aesara.map(lambda r: tt.tanh(tt.dot(r, w)).sum(), sequences=[x])
+        f = aesara.function([x], out, mode=self.mode)
+        assert not any(isinstance(n.op, Scan) for n in f.maker.fgraph.apply_nodes)
+
+        x_val = self.rng.rand(10, 4).astype(config.floatX)
+        utt.assert_allclose(f(x_val), np.tanh(x_val.dot(w.get_value())).sum(1))
+
+    def test_batch_length(self):
+        x = tt.matrix("x")
+        # The inner outputs do not depend on the values of the sequence.
+        for fn, expected in [
+            (lambda r: r.shape[0] * 1.0, 3.0),
+            (lambda r: r.sum() * 0 + 1, 1.0),
+        ]:
+            out, _ = aesara.map(fn, sequences=[x])
+            f = aesara.function([x], out, mode=self.mode)
+            x_val = self.rng.rand(5, 3).astype(config.floatX)
+            utt.assert_allclose(f(x_val), np.full(5, expected))
+
+    def test_scan_tag(self):
+        # The rewrite must be requested by name.
+        mode = aesara.compile.mode.get_mode("FAST_RUN").including("scan")
+        x = tt.matrix("x")
+        out, _ = aesara.map(lambda r: r.sum(), sequences=[x])
+        f = aesara.function([x], out, mode=mode)
+        assert any(isinstance(n.op, Scan) for n in f.maker.fgraph.apply_nodes)
+
+    def test_not_vectorized(self):
+        x = tt.matrix("x")
+        # A recurrent state.
+        out, _ = aesara.scan(lambda r, h: h + r, sequences=[x], outputs_info=[x[0]])
+        f = aesara.function([x], out, mode=self.mode)
+        assert any(isinstance(n.op, Scan) for n in f.maker.fgraph.apply_nodes)
+
+        # An Op without a vectorization rule.
+        out, _ = aesara.map(
+            lambda r: tt.nlinalg.matrix_inverse(r.reshape((2, 2))), sequences=[x]
+        )
+        f = aesara.function([x], out, mode=self.mode)
+        assert any(isinstance(n.op, Scan) for n in f.maker.fgraph.apply_nodes)
+
+
+class TestPushOutSeqsMaxBytes:
+    def _outer_matrix_elemwise(self):
+        x = tt.matrix("x")
+        h0 = tt.vector("h0")
+        out, _ = aesara.scan(
+            lambda x_t, h: h * (x_t + 1), sequences=[x], outputs_info=[h0]
+        )
+        f = aesara.function([x, h0], out, mode="FAST_RUN")
+        x_val = np.ones((5, 3), dtype=config.floatX)
+        h0_val = np.ones(3, dtype=config.floatX)
+        utt.assert_allclose(f(x_val, h0_val)[-1], 2 ** 5 * h0_val)
+        return [
+            n
+            for n in f.maker.fgraph.apply_nodes
+            if isinstance(n.op, tt.Elemwise) and n.outputs[0].ndim == 2
+        ]
+
+    def _grad_storage(self, n_steps, n_hidden):
+        # The gradient of a RNN, with the intermediate results kept in the
+        # storage map.
+        rng = np.random.RandomState(utt.fetch_seed())
+        x = tt.matrix("x")
+        w = aesara.shared(rng.rand(n_hidden, n_hidden).astype(config.floatX) * 0.1)
+        out, _ = aesara.scan(
+            lambda x_t, h: tt.tanh(tt.dot(h, w) + x_t),
+            sequences=[x],
+            outputs_info=[tt.zeros((n_hidden,))],
+        )
+        grad = tt.grad(out[-1].sum(), w)
+        mode = aesara.compile.mode.get_mode("FAST_RUN").clone(
+            link_kwargs=dict(allow_gc=False)
+        )
+        f = aesara.function([x], grad, mode=mode)
+        value = f(rng.rand(n_steps, n_hidden).astype(config.floatX))
+        nbytes = sum(
+            storage[0].nbytes
+            for var, storage in f.fn.storage_map.items()
+            if var.owner is not None and isinstance(storage[0], np.ndarray)
+        )
+        return value, nbytes
+
+    def test_forward_scan(self):
+        # The forward loop is not affected.
+        assert self._outer_matrix_elemwise()
+        with aesara.change_flags(**{"scan.pushout_seqs_max_bytes": 0}):
+            assert self._outer_matrix_elemwise()
+
+    def test_recompute(self):
+        # With the default, 1 - tanh(...) ** 2 is recomputed in the backward
+        # scan instead of being stored for all the steps.
+        n_steps, n_hidden = 200, 20
+        value, nbytes = self._grad_storage(n_steps, n_hidden)
+        with aesara.change_flags(**{"scan.pushout_seqs_max_bytes": -1}):
+            value_pushout, nbytes_pushout = self._grad_storage(n_steps, n_hidden)
+        utt.assert_allclose(value, value_pushout)
+        trace = n_steps * n_hidden * np.dtype(config.floatX).itemsize
+        assert nbytes_pushout - nbytes >= trace
+
+    def test_cost_model(self):
+        from aesara.scan_module.scan_opt import is_cheap_to_recompute
+
+        x = tt.matrix("x")
+        assert is_cheap_to_recompute((x + 1).owner.op)
+        assert is_cheap_to_recompute((x < 1).owner.op)
+        assert not is_cheap_to_recompute(tt.exp(x).owner.op)
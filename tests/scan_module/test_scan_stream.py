@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+import aesara
+import aesara.tensor as tt
+from tests import unittest_tools as utt
+
+
+class TestScanStream:
+    def setup_method(self):
+        self.x = tt.dmatrix("x")
+        self.h0 = tt.dvector("h0")
+        self.W = tt.dmatrix("W")
+        rng = np.random.RandomState(utt.fetch_seed())
+        self.x_val = rng.rand(23, 3)
+        self.h0_val = rng.rand(3)
+        self.W_val = rng.rand(3, 3) / 3
+
+    def step(self, x_t, h, W):
+        h_t = tt.tanh(tt.dot(h, W) + x_t)
+        return h_t, h_t.sum()
+
+    def reference(self):
+        (h, s), _ = aesara.scan(
+            self.step,
+            sequences=[self.x],
+            outputs_info=[self.h0, None],
+            non_sequences=[self.W],
+        )
+        f = aesara.function([self.x, self.h0, self.W], [h, s])
+        return f(self.x_val, self.h0_val, self.W_val)
+
+    def stream(self, chunk_size):
+        return aesara.scan_stream(
+            self.step,
+            sequences=[self.x],
+            outputs_info=[self.h0, None],
+            non_sequences=[self.W],
+            chunk_size=chunk_size,
+        )
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 23, 100])
+    def test_chunks(self, chunk_size):
+        h, s = self.stream(chunk_size)(
+            [self.x_val], outputs_info=[self.h0_val], non_sequences=[self.W_val]
+        )
+        h_ref, s_ref = self.reference()
+        utt.assert_allclose(h, h_ref)
+        utt.assert_allclose(s, s_ref)
+
+    def test_iterable_and_sinks(self, tmpdir):
+        path = str(tmpdir.join("x.npy"))
+        np.save(path, self.x_val)
+        h_out = np.lib.format.open_memmap(
+            str(tmpdir.join("h.npy")), mode="w+", dtype="float64", shape=(23, 3)
+        )
+        chunks = []
+        stream = self.stream(5)
+        h, s = stream(
+            [path],
+            outputs_info=[self.h0_val],
+            non_sequences=[self.W_val],
+            sinks=[h_out, lambda c: chunks.append(c.copy())],
+        )
+        h_ref, s_ref = self.reference()
+        assert h is h_out
+        utt.assert_allclose(np.load(str(tmpdir.join("h.npy"))), h_ref)
+        assert [len(c) for c in chunks] == [5, 5, 5, 5, 3]
+        utt.assert_allclose(s, s_ref[-1])
+
+        # The steps of a sequence can also come from an iterable.
+        h, s = stream(
+            [iter(self.x_val)], outputs_info=[self.h0_val], non_sequences=[self.W_val]
+        )
+        utt.assert_allclose(h, h_ref)
+
+    def test_taps_error(self):
+        with pytest.raises(RuntimeError):
+            aesara.scan_stream(
+                lambda x_t, h: h + x_t,
+                [self.x],
+                {"initial": self.x, "taps": [-2]},
+            )
@@ -496,6 +496,18 @@ class TestImages2Neibs(unittest_tools.InferShapeTester):
         with pytest.raises(TypeError):
             f(images_val)
 
+    @pytest.mark.parametrize("mode", ["valid", "half", "full"])
+    def test_neibs_openmp(self, mode):
+        shape = (3, 4, 9, 9)
+        images = tt.dtensor4()
+        images_val = np.random.rand(*shape)
+        outs = []
+        for openmp in [False, True]:
+            op = Images2Neibs(mode, openmp=openmp)
+            f = aesara.function([images], op(images, (3, 3), (2, 2)), mode=self.mode)
+            outs.append(f(images_val))
+        unittest_tools.assert_allclose(outs[0], outs[1])
+
     def test_can_not_infer_nb_dim(self):
         # Was reported in gh-5613. Test that we do not crash
         # or that we crash in a few other case found while
@@ -1970,6 +1970,29 @@ class TestMaxAndArgmax:
         assert max.eval(), 3
         assert argmax.eval(), 2
 
+    @pytest.mark.skipif(not config.cxx, reason="G++ not available")
+    def test_c_openmp(self):
+        if not gof.OpenMPOp.test_gxx_support():
+            pytest.skip("The compiler doesn't support OpenMP")
+        from aesara.gof.openmp import num_threads
+
+        x = tt.dmatrix("x")
+        # Ties, so the first maximum must be found, and a NaN.
+        xv = np.floor(np.random.rand(300, 50) * 10)
+        xv[200, 7] = np.nan
+        for axis in [[0], [1], [0, 1]]:
+            with change_flags(openmp_elemwise_minsize=0):
+                f = aesara.function(
+                    [x], MaxAndArgmax(axis, openmp=True)(x), mode="FAST_RUN"
+                )
+            np_axis = None if len(axis) == 2 else axis[0]
+            for v in [xv, xv.T.copy().T]:
+                for n in [1, 3]:
+                    with num_threads(n):
+                        m, i = f(v)
+                    np.testing.assert_array_equal(m, np.max(v, axis=np_axis))
+                    assert np.array_equal(i, np.argmax(v, axis=np_axis))
+
 
 class TestArgminArgmax:
     def setup_method(self):
@@ -8,7 +8,7 @@ import pytest
 import aesara
 import aesara.tensor as tt
 import tests.unittest_tools as utt
-from aesara import config, gof, scalar
+from aesara import change_flags, config, gof, scalar
 from aesara.compile.mode import Mode, get_default_mode
 from aesara.tensor import TensorType, as_tensor_variable
 from aesara.tensor.elemwise import (
@@ -603,6 +603,79 @@ class TestCAReduce(unittest_tools.InferShapeTester):
             self.with_mode(Mode(linker="c"), scalar.minimum, dtype=dtype, test_nan=True)
             self.with_mode(Mode(linker="c"), scalar.maximum, dtype=dtype, test_nan=True)
 
+    @pytest.mark.skipif(
+        not aesara.config.cxx, reason="G++ not available, so we need to skip this test."
+    )
+    def test_c_layouts(self):
+        # The loops follow the memory layout of the input.
+        x = tt.tensor3("x", dtype="float64")
+        values = np.random.rand(4, 5, 6)
+        layouts = [
+            values,
+            np.asfortranarray(values),
+            values.transpose(2, 0, 1),
+            values[::-1, ::2],
+        ]
+        for axis in [None, 0, 1, 2, (0, 2), (1, 2)]:
+            for scalar_op, np_fn in [(scalar.add, np.sum), (scalar.maximum, np.max)]:
+                f = aesara.function(
+                    [x],
+                    CAReduce(scalar_op, axis=axis)(x),
+                    mode=Mode(linker="c", optimizer=None),
+                )
+                for xv in layouts:
+                    unittest_tools.assert_allclose(f(xv), np_fn(xv, axis=axis))
+
+    @pytest.mark.skipif(not config.cxx, reason="G++ not available")
+    def test_c_openmp(self):
+        if not gof.OpenMPOp.test_gxx_support():
+            pytest.skip("The compiler doesn't support OpenMP")
+        from aesara.gof.openmp import num_threads
+
+        x = tt.tensor3("x", dtype="float64")
+        values = np.random.rand(7, 30, 300)
+        for axis in [None, 0, 2, (0, 2)]:
+            for scalar_op, np_fn in [(scalar.add, np.sum), (scalar.maximum, np.max)]:
+                with change_flags(openmp_elemwise_minsize=0):
+                    f = aesara.function(
+                        [x],
+                        CAReduce(scalar_op, axis=axis, openmp=True)(x),
+                        mode=Mode(linker="c", optimizer=None),
+                    )
+                for xv in [values, values.transpose(2, 0, 1)]:
+                    with num_threads(1):
+                        r1 = f(xv).copy()
+                    with num_threads(3):
+                        r3 = f(xv)
+                    # The result doesn't depend on the number of threads.
+                    assert np.array_equal(r1, r3)
+                    unittest_tools.assert_allclose(r1, np_fn(xv, axis=axis))
+
+    @pytest.mark.skipif(not config.cxx, reason="G++ not available")
+    def test_c_summation(self):
+        with pytest.raises(ValueError):
+            Sum(summation="exact")
+
+        x = tt.matrix("x", dtype="float32")
+        values = np.random.rand(2000, 1000).astype("float32")
+        for axis in [None, 0]:
+            for xv in [values, values.T]:
+                expected = xv.astype("float64").sum(axis=axis)
+                errors = {}
+                for summation in Sum.summations:
+                    # Without OpenMP, the naive summation isn't chunked.
+                    with change_flags(openmp=False):
+                        op = Sum(axis=axis, acc_dtype="float32", summation=summation)
+                    f = aesara.function(
+                        [x], op(x), mode=Mode(linker="c", optimizer=None)
+                    )
+                    errors[summation] = np.max(np.abs(f(xv) - expected) / expected)
+                assert errors["pairwise"] < 1e-6
+                assert errors["kahan"] < 1e-6
+                if axis is None:
+                    assert errors["naive"] > errors["pairwise"]
+                    assert errors["naive"] > errors["kahan"]
+
     def test_infer_shape(self, dtype=None, pre_scalar_op=None):
         if dtype is None:
             dtype = aesara.config.floatX
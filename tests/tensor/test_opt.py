@@ -48,7 +48,7 @@ from aesara.tensor import (
 from aesara.tensor.basic import _convert_to_int8
 from aesara.tensor.blas import Dot22, Gemv
 from aesara.tensor.blas_c import CGemv
-from aesara.tensor.elemwise import DimShuffle, Elemwise, Prod
+from aesara.tensor.elemwise import DimShuffle, Elemwise, FusedCAReduce, Prod
 from aesara.tensor.nnet.sigm import softplus
 from aesara.tensor.opt import (
     Assert,
@@ -1201,7 +1201,9 @@ def test_cast_in_mul_canonizer():
 
 
 class TestFusion:
-    mode = copy.copy(compile.mode.get_default_mode())
+    # The Elemwise nodes are counted, so they must not be fused with the
+    # reductions.
+    mode = copy.copy(compile.mode.get_default_mode().excluding("local_careduce_fusion"))
     _shared = staticmethod(shared)
     topo_exclude = ()
 
@@ -2071,6 +2073,96 @@ class TestFusion:
         )
 
 
+@pytest.mark.skipif(not aesara.config.cxx, reason="No cxx compiler")
+class TestCAReduceFusion:
+    mode = get_mode("FAST_RUN").including("local_careduce_fusion")
+
+    @pytest.mark.parametrize("axis", [None, 0, 1, -1])
+    @pytest.mark.parametrize("reduce_fn", [tt.sum, tt.prod, tt.max])
+    def test_careduce_fusion(self, reduce_fn, axis):
+        x = tt.dmatrix("x")
+        mu = tt.dvector("mu")
+        out = reduce_fn(tt.exp((x - mu) ** 2) * x, axis=axis)
+        rng = np.random.RandomState(utt.fetch_seed())
+        x_val = rng.rand(4, 3)
+        mu_val = rng.rand(3)
+        expected = getattr(np, reduce_fn.__name__)(
+            np.exp((x_val - mu_val) ** 2) * x_val, axis=axis
+        )
+
+        f = function([x, mu], out, mode=self.mode)
+        topo = f.maker.fgraph.toposort()
+        assert any(isinstance(n.op, FusedCAReduce) for n in topo)
+        assert not any(isinstance(n.op, Elemwise) for n in topo)
+        utt.assert_allclose(f(x_val, mu_val), expected)
+
+        # The python implementation
+        mode = compile.Mode("py", self.mode.provided_optimizer)
+        f = function([x, mu], out, mode=mode)
+        assert any(isinstance(n.op, FusedCAReduce) for n in f.maker.fgraph.toposort())
+        utt.assert_allclose(f(x_val, mu_val), expected)
+
+    def test_broadcastable_first_input(self):
+        # The size of the output is taken from an input that is not
+        # broadcastable along each kept dimension.
+        v = tt.dvector("v")
+        m = tt.dmatrix("m")
+        i = tt.imatrix("i")
+        r1 = tt.drow("r1")
+        r2 = tt.drow("r2")
+        rng = np.random.RandomState(utt.fetch_seed())
+        v_val = rng.rand(3)
+        m_val = rng.rand(4, 3)
+        i_val = rng.randint(-5, 5, size=(4, 3)).astype("int32")
+        r1_val = rng.rand(1, 3)
+        r2_val = rng.rand(1, 3)
+        for inputs, out, values, expected in [
+            (
+                [v, m],
+                ((v * m) ** 2).sum(axis=1),
+                [v_val, m_val],
+                ((v_val * m_val) ** 2).sum(axis=1),
+            ),
+            ([i], tt.max(i * 2, axis=0), [i_val], (i_val * 2).max(axis=0)),
+            (
+                [r1, r2],
+                (r1 * r2).sum(axis=1),
+                [r1_val, r2_val],
+                (r1_val * r2_val).sum(axis=1),
+            ),
+        ]:
+            f = function(inputs, out, mode=self.mode)
+            assert any(
+                isinstance(n.op, FusedCAReduce) for n in f.maker.fgraph.toposort()
+            )
+            utt.assert_allclose(f(*values), expected)
+
+    def test_multiple_clients(self):
+        x = tt.dmatrix("x")
+        y = tt.exp(x)
+        f = function([x], [y.sum(axis=0), y], mode=self.mode)
+        assert not any(
+            isinstance(n.op, FusedCAReduce) for n in f.maker.fgraph.toposort()
+        )
+
+    def test_openmp(self):
+        # With OpenMP, only reductions of small inputs are fused, the
+        # others keep the parallel loops of the CAReduce and the Elemwise.
+        x = tt.dmatrix("x")
+        x_val = np.random.RandomState(utt.fetch_seed()).rand(4, 3)
+        with change_flags(openmp=True):
+            for inp, fused in [
+                (x, False),
+                (tt.specify_shape(x, (4, 3)), True),
+            ]:
+                out = tt.exp(inp).sum(axis=0)
+                assert out.owner.op.openmp
+                f = function([x], out, mode=self.mode)
+                topo = f.maker.fgraph.toposort()
+                assert any(isinstance(n.op, FusedCAReduce) for n in topo) == fused
+                utt.assert_allclose(f(x_val), np.exp(x_val).sum(axis=0))
+
+
 class TimesN(scal.basic.UnaryScalarOp):
     """
     Used in test TestCompositeCodegen
@@ -6406,7 +6498,9 @@ class TestLocalSumProd:
             inputs, inputs_val, reduction_op, expected_output, nb_expected_sum_nodes
         ):
             mul_out = tt.mul(*inputs)
-            f = aesara.function(inputs, reduction_op()(mul_out), mode=self.mode)
+            # The reductions are counted, so they must not be fused.
+            mode = self.mode.excluding("local_careduce_fusion")
+            f = aesara.function(inputs, reduction_op()(mul_out), mode=mode)
             out = f(*inputs_val)
             utt.assert_allclose(out, expected_output)
 
@@ -6864,7 +6958,9 @@ class TestLocalReduce:
             tt.min,
         ]:
             x = tt.TensorType("int64", (True, False, True))()
-            f = aesara.function([x], [fct(x, axis=[0, 1])], mode=self.mode)
+            # The reduction is inspected, so it must not be fused.
+            mode = self.mode.excluding("local_careduce_fusion")
+            f = aesara.function([x], [fct(x, axis=[0, 1])], mode=mode)
 
             order = f.maker.fgraph.toposort()
             assert 1 == sum([isinstance(node.op, tt.CAReduce) for node in order])
@@ -7086,9 +7182,10 @@ class TestLocalSumProdDimshuffle:
         default_mode = aesara.compile.mode.get_default_mode()
         # FusionOptimizer is included to make sure that expected_outer_operator
         # remains the same for all optimization modes.
+        # The reductions are not fused, so the last node is the Elemwise.
         mode_with_opt = default_mode.including(
             "local_sum_prod_div_dimshuffle", "FusionOptimizer"
-        )
+        ).excluding("local_careduce_fusion")
         mode_without_opt = default_mode.excluding("local_sum_prod_div_dimshuffle")
 
         # Numerical tests: tests whether the numerical values with and without
@@ -7137,6 +7234,28 @@ class TestLocalSumProdDimshuffle:
                 g.maker.fgraph.toposort()[-1].op.scalar_op, expected_outer_operator[i]
             )
 
+    def test_local_sum_div_dimshuffle_keeps_op_params(self):
+        m = tt.fmatrix("m")
+        a = tt.fvector("a")
+        s = tt.sum(m / a, axis=0, acc_dtype="float32", summation="kahan")
+
+        mode = self.mode.including("local_sum_prod_div_dimshuffle").excluding(
+            "local_careduce_fusion"
+        )
+        f = aesara.function([m, a], s, mode=mode)
+        sums = [
+            n for n in f.maker.fgraph.apply_nodes if isinstance(n.op, tt.elemwise.Sum)
+        ]
+        # The sum is now done on the numerator alone.
+        assert [n.inputs[0] for n in sums] == f.maker.fgraph.inputs[:1]
+        assert sums[0].op.summation == "kahan"
+        assert sums[0].op.acc_dtype == "float32"
+
+        rng = np.random.RandomState(utt.fetch_seed())
+        m_val = rng.rand(3, 4).astype("float32")
+        a_val = rng.rand(4).astype("float32") + 1
+        utt.assert_allclose(f(m_val, a_val), (m_val / a_val).sum(axis=0))
+
     # TODO:
     # test_local_sum_prod_dimshuffle (a * b * c)
     # test_local_sum_divprod_dimshuffle ((a * b) / (c * d))
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+import aesara
+import aesara.tensor as tt
+from aesara.scan_module.scan_op import Scan
+from aesara.tensor.vectorize import vectorize
+from tests import unittest_tools as utt
+
+
+class TestVectorize:
+    def setup_method(self):
+        self.rng = np.random.RandomState(utt.fetch_seed())
+
+    def check(self, inputs, output, replace, values, batched_values):
+        f = aesara.function(inputs, output)
+        new_inputs = [replace.get(i, i) for i in inputs]
+        f_batched = aesara.function(new_inputs, vectorize(output, replace))
+        batched = [i in replace for i in inputs]
+        rval = f_batched(*batched_values)
+        for k in range(len(rval)):
+            args = [
+                bv[k] if b else v for b, v, bv in zip(batched, values, batched_values)
+            ]
+            utt.assert_allclose(rval[k], f(*args))
+        return f_batched
+
+    def test_elemwise_and_reduce(self):
+        x = tt.dmatrix("x")
+        y = tt.dvector("y")
+        out = tt.exp(x + y).sum(axis=0) + x.T.max()
+        xs = tt.dtensor3("xs")
+        x_val = self.rng.rand(2, 3)
+        y_val = self.rng.rand(3)
+        xs_val = self.rng.rand(4, 2, 3)
+        f = self.check([x, y], out, {x: xs}, [x_val, y_val], [xs_val, y_val])
+        nodes = f.maker.fgraph.apply_nodes
+        assert not any(isinstance(n.op, Scan) for n in nodes)
+
+    @pytest.mark.parametrize("batched", [(True, True), (True, False), (False, True)])
+    @pytest.mark.parametrize("ndims", [(1, 1), (1, 2), (2, 1), (2, 2)])
+    def test_dot(self, batched, ndims):
+        shapes = {(1, 1): [(3,), (3,)], (1, 2): [(3,), (3, 4)]}
+        shapes[(2, 1)] = [(2, 3), (3,)]
+        shapes[(2, 2)] = [(2, 3), (3, 4)]
+        a = tt.TensorType("float64", (False,) * ndims[0])("a")
+        b = tt.TensorType("float64", (False,) * ndims[1])("b")
+        values = [self.rng.rand(*s) for s in shapes[ndims]]
+        replace = {}
+        batched_values = []
+        for var, is_batched, v in zip([a, b], batched, values):
+            if is_batched:
+                replace[var] = tt.TensorType("float64", (False,) * (var.ndim + 1))()
+                batched_values.append(self.rng.rand(5, *v.shape))
+            else:
+                batched_values.append(v)
+        self.check([a, b], tt.dot(a, b), replace, values, batched_values)
+
+    def test_subtensor(self):
+        x = tt.dmatrix("x")
+        i = tt.lscalar("i")
+        xs = tt.dtensor3("xs")
+        out = x[i, 1:]
+        x_val = self.rng.rand(3, 4)
+        xs_val = self.rng.rand(5, 3, 4)
+        f = self.check([x, i], out, {x: xs}, [x_val, 2], [xs_val, 2])
+        nodes = f.maker.fgraph.apply_nodes
+        assert not any(isinstance(n.op, Scan) for n in nodes)
+
+        # Batched indices are computed with a scan.
+        i_s = tt.lvector("i_s")
+        self.check([x, i], out, {x: xs, i: i_s}, [x_val, 2], [xs_val, [0, 1, 2, 1, 0]])
+
+    def test_shape(self):
+        x = tt.dmatrix("x")
+        xs = tt.dtensor3("xs")
+        f = aesara.function(
+            [xs], vectorize([x.shape[0] + 0, x.shape * 1], {x: xs}), mode="FAST_COMPILE"
+        )
+        r1, r2 = f(np.zeros((4, 2, 3)))
+        assert np.array_equal(r1, [2] * 4)
+        assert np.array_equal(r2, [[2, 3]] * 4)
+
+    def test_map_fallback(self):
+        x = tt.dmatrix("x")
+        xs = tt.dtensor3("xs")
+        out = tt.nlinalg.matrix_inverse(x)
+        x_val = self.rng.rand(3, 3) + np.eye(3)
+        xs_val = self.rng.rand(4, 3, 3) + np.eye(3)
+        self.check([x], out, {x: xs}, [x_val], [xs_val])
+
+    def test_unbatched_output(self):
+        x = tt.dvector("x")
+        y = tt.dvector("y")
+        xs = tt.dmatrix("xs")
+        f = aesara.function([xs, y], vectorize([x * 2, y + 1], {x: xs}))
+        r1, r2 = f(np.ones((3, 2)), np.ones(2))
+        utt.assert_allclose(r1, 2 * np.ones((3, 2)))
+        utt.assert_allclose(r2, 2 * np.ones((3, 2)))
+
+    def test_bad_ndim(self):
+        x = tt.dvector("x")
+        with pytest.raises(TypeError):
+            vectorize(x * 2, {x: tt.dvector()})